@@ -0,0 +1,41 @@
+"""add hot query indexes
+
+Revision ID: 3f9c2a7d1e04
+Revises:
+Create Date: 2026-10-16 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9c2a7d1e04"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns). Tables themselves come from Base.metadata.create_all,
+# which skips indexes on tables that already exist, so these are created idempotently.
+INDEXES = [
+    # Whale confluence / whale-sell scans: ts range + side, then wallet
+    ("idx_trades_ts_side_wallet", "trades", ["ts", "side", "wallet_address"]),
+    # Autonomous trader whale filter on unrealized PnL
+    ("idx_wallet_stats_unrealized_pnl", "wallet_stats_30d", ["unrealized_pnl_usd"]),
+    # Whale discovery: ORDER BY seed_tokens.vol_24h_usd DESC LIMIT 100
+    ("idx_seed_tokens_vol", "seed_tokens", ["vol_24h_usd"]),
+    # Whale discovery: tokens.liquidity_usd > threshold
+    ("idx_tokens_liquidity", "tokens", ["liquidity_usd"]),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
@@ -2,7 +2,7 @@
 
 import logging
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime, timedelta
 import redis
 
@@ -98,6 +98,86 @@ class ConfluenceDetector:
         # Get remaining entries
         entries = self.redis.zrange(key, 0, -1)
 
+        return self._events_from_entries(entries, token_address, chain_id, side, min_wallets)
+
+    def process_batch(
+        self,
+        trades: List[Tuple[str, str, str, str, Dict[str, Any]]],
+        min_wallets: int = 2,
+    ) -> List[Optional[List[Dict[str, Any]]]]:
+        """Record many trades and check confluence for each in two pipelined round-trips.
+
+        Equivalent to calling record_trade then check_confluence for each trade
+        in order: a trade only sees window entries recorded before it.
+
+        Args:
+            trades: (token_address, chain_id, wallet_address, side, metadata) tuples
+            min_wallets: Minimum number of wallets for confluence
+
+        Returns:
+            Per-trade confluence events (None where no confluence), in input order
+        """
+        if not trades:
+            return []
+
+        timestamp = datetime.utcnow().timestamp()
+        cutoff_ts = (datetime.utcnow() - timedelta(minutes=self.window_minutes)).timestamp()
+        keys = list(dict.fromkeys(
+            f"confluence:{side}:{chain_id}:{token_address}"
+            for token_address, chain_id, _, side, _ in trades
+        ))
+
+        # Round-trip 1: prune and read the current window for every touched key
+        pipe = self.redis.pipeline()
+        for key in keys:
+            pipe.zremrangebyscore(key, "-inf", cutoff_ts)
+            pipe.zrange(key, 0, -1)
+        replies = pipe.execute()
+        windows = {key: list(replies[i * 2 + 1]) for i, key in enumerate(keys)}
+
+        # Round-trip 2: record every new trade
+        pipe = self.redis.pipeline()
+        results = []
+        for token_address, chain_id, wallet_address, side, metadata in trades:
+            key = f"confluence:{side}:{chain_id}:{token_address}"
+            value = json.dumps({
+                "wallet": wallet_address,
+                "ts": timestamp,
+                "side": side,
+                **metadata,
+            })
+            pipe.zadd(key, {value: timestamp})
+            pipe.expire(key, self.window_minutes * 60 + 300)
+
+            windows[key].append(value)
+            results.append(
+                self._events_from_entries(windows[key], token_address, chain_id, side, min_wallets)
+            )
+        pipe.execute()
+
+        logger.debug(f"Recorded {len(trades)} trades across {len(keys)} confluence windows")
+        return results
+
+    def _events_from_entries(
+        self,
+        entries: List[str],
+        token_address: str,
+        chain_id: str,
+        side: str,
+        min_wallets: int,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Parse window entries into unique-wallet events if they form a confluence.
+
+        Args:
+            entries: Serialized events from the sorted set (oldest first)
+            token_address: Token address
+            chain_id: Chain identifier
+            side: "buy" or "sell"
+            min_wallets: Minimum number of wallets for confluence
+
+        Returns:
+            List of trade events if confluence detected, None otherwise
+        """
         if len(entries) < min_wallets:
             return None
 
@@ -7,6 +7,7 @@ from telegram.ext import Application, CommandHandler, MessageHandler, filters, C
 
 from src.config import settings
 from src.analytics.paper_trading import PaperTradingTracker
+from src.db.session import SessionLocal
 
 logger = logging.getLogger(__name__)
 
@@ -15,14 +16,18 @@ async def handle_update_command(update: Update, context: ContextTypes.DEFAULT_TY
     """Handle /update or 'update' message - show current paper trading status."""
 
     # Load paper trading state
-    paper_trader = PaperTradingTracker.load_from_file("paper_trading_log.json")
+    db = SessionLocal()
+    try:
+        paper_trader = PaperTradingTracker.load_from_db(db, closed_trades_limit=3)
+    finally:
+        db.close()
 
-    if not paper_trader:
+    if not paper_trader.positions and not paper_trader.closed_trades:
         await update.message.reply_text("📊 No paper trading data yet. Waiting for first confluence signal...")
         return
 
     # Get current stats
-    total_trades = len(paper_trader.closed_trades)
+    total_trades = paper_trader.win_count + paper_trader.loss_count
     wins = paper_trader.win_count
     losses = paper_trader.loss_count
     win_rate = (wins / total_trades * 100) if total_trades > 0 else 0
@@ -1,12 +1,15 @@
 """Being-Early score calculation."""
 
+import bisect
+import itertools
 import logging
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, func
 
 from src.db.models import Trade, Token
+from src.analytics.pnl import TRADE_STREAM_CHUNK
 
 logger = logging.getLogger(__name__)
 
@@ -114,12 +117,24 @@ class EarlyScoreCalculator:
         # Get liquidity at time of trade (or closest available)
         token = self.db.query(Token).filter(Token.token_address == token_address).first()
 
-        if not token or not token.liquidity_usd:
+        return self._mc_score_from_liquidity(token.liquidity_usd if token else None)
+
+    @staticmethod
+    def _mc_score_from_liquidity(liquidity_usd: Optional[float]) -> float:
+        """Score a token's estimated market cap from its liquidity.
+
+        Args:
+            liquidity_usd: Token liquidity in USD (None if unknown)
+
+        Returns:
+            Score 0-40, lower market cap scoring higher
+        """
+        if not liquidity_usd:
             # No data, assume neutral score
             return 20.0
 
         # Estimate market cap (liquidity × 3)
-        estimated_mc = token.liquidity_usd * 3
+        estimated_mc = liquidity_usd * 3
 
         # Target: $1M market cap
         target_mc = 1_000_000
@@ -237,3 +252,112 @@ class EarlyScoreCalculator:
             scores.append(score)
 
         return statistics.median(scores) if scores else None
+
+    def calculate_all_medians(
+        self, wallet_addresses: List[str], days: int = 30
+    ) -> Dict[str, Optional[float]]:
+        """Calculate median Being-Early scores for many wallets at once.
+
+        Produces the same scores as calculate_median_score, but loads the
+        inputs with three queries total (buys in window, every trade on the
+        touched tokens, token liquidity) instead of several queries per trade.
+
+        Args:
+            wallet_addresses: Wallet addresses
+            days: Days to look back
+
+        Returns:
+            Dict mapping wallet address to median EarlyScore (wallets without buys omitted)
+        """
+        from datetime import timedelta
+        import statistics
+
+        if not wallet_addresses:
+            return {}
+
+        since = datetime.utcnow() - timedelta(days=days)
+
+        buy_trades = (
+            self.db.query(
+                Trade.wallet_address, Trade.token_address, Trade.ts, Trade.usd_value
+            )
+            .filter(
+                and_(
+                    Trade.wallet_address.in_(wallet_addresses),
+                    Trade.side == "buy",
+                    Trade.ts >= since,
+                )
+            )
+            .all()
+        )
+
+        if not buy_trades:
+            return {}
+
+        token_addresses = list({t.token_address for t in buy_trades})
+
+        # Every trade on the touched tokens (rank and volume look at all history),
+        # streamed in chunks and folded straight into the per-token indexes below
+        token_trades = (
+            self.db.query(
+                Trade.token_address, Trade.wallet_address, Trade.side, Trade.ts, Trade.usd_value
+            )
+            .filter(Trade.token_address.in_(token_addresses))
+            .yield_per(TRADE_STREAM_CHUNK)
+        )
+
+        # Per token: sorted first-buy time per buyer, sorted trade times + volume prefix sums
+        first_buys: Dict[str, Dict[str, datetime]] = {}
+        volume_events: Dict[str, List[Tuple[datetime, float]]] = {}
+        for t in token_trades:
+            if t.side == "buy":
+                buyers = first_buys.setdefault(t.token_address, {})
+                if t.wallet_address not in buyers or t.ts < buyers[t.wallet_address]:
+                    buyers[t.wallet_address] = t.ts
+            volume_events.setdefault(t.token_address, []).append((t.ts, t.usd_value or 0.0))
+
+        first_buy_times = {
+            token: sorted(buyers.values()) for token, buyers in first_buys.items()
+        }
+        volume_times: Dict[str, List[datetime]] = {}
+        volume_prefix: Dict[str, List[float]] = {}
+        for token, events in volume_events.items():
+            events.sort(key=lambda e: e[0])
+            volume_times[token] = [ts for ts, _ in events]
+            volume_prefix[token] = list(itertools.accumulate((v for _, v in events), initial=0.0))
+
+        liquidity = dict(
+            self.db.query(Token.token_address, Token.liquidity_usd)
+            .filter(Token.token_address.in_(token_addresses))
+            .all()
+        )
+
+        scores_by_wallet: Dict[str, List[float]] = {}
+        for trade in buy_trades:
+            token = trade.token_address
+
+            # Component 1: distinct buyers whose first buy precedes this trade
+            times = first_buy_times.get(token, [])
+            buyers_before = bisect.bisect_left(times, trade.ts)
+            rank_score = 40.0 * (1.0 - buyers_before / max(len(times), 1))
+
+            # Component 2: liquidity-based market cap estimate
+            mc_score = self._mc_score_from_liquidity(liquidity.get(token))
+
+            # Component 3: share of ±1h volume
+            ts_list = volume_times.get(token, [])
+            lo = bisect.bisect_left(ts_list, trade.ts - timedelta(hours=1))
+            hi = bisect.bisect_right(ts_list, trade.ts + timedelta(hours=1))
+            total_volume = volume_prefix[token][hi] - volume_prefix[token][lo] if ts_list else 0.0
+            vol_score = 0.0
+            if total_volume > 0:
+                participation = min((trade.usd_value or 0.0) / total_volume, 0.5)
+                vol_score = 20.0 * (participation / 0.5)
+
+            score = max(0.0, min(100.0, rank_score + mc_score + vol_score))
+            scores_by_wallet.setdefault(trade.wallet_address, []).append(score)
+
+        return {
+            wallet_address: statistics.median(scores)
+            for wallet_address, scores in scores_by_wallet.items()
+        }
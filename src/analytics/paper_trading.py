@@ -1,13 +1,35 @@
 """Paper trading system to track actual performance with $1,000 starting balance."""
 
 import logging
-from typing import Dict, Any, List, Optional
+import os
+from typing import Dict, Any, List, Optional, Set
 from datetime import datetime, timedelta
+
+import orjson
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func, select
+
+from src.db.models import PaperPosition, PaperTrade
 
 logger = logging.getLogger(__name__)
 
+# Position dict keys persisted as PaperPosition columns
+_POSITION_FIELDS = (
+    "token_address",
+    "chain_id",
+    "qty",
+    "entry_price",
+    "cost_basis",
+    "bought_at",
+    "reason",
+    "num_whales",
+    "take_profit_pct",
+    "stop_loss_pct",
+    "peak_profit_pct",
+    "last_price_usd",
+    "last_checked_at",
+)
+
 
 class PaperTradingTracker:
     """Tracks paper trades to measure REAL performance with $1,000 virtual balance."""
@@ -29,6 +51,12 @@ class PaperTradingTracker:
         self.win_count = 0
         self.loss_count = 0
 
+        # Changes not yet written by persist()
+        self._position_ids: Dict[str, int] = {}  # token_address -> open PaperPosition id
+        self._dirty_positions: Set[str] = set()
+        self._closed_position_ids: List[Dict[str, Any]] = []
+        self._pending_trades: List[Dict[str, Any]] = []
+
     def execute_buy(
         self,
         token_address: str,
@@ -76,6 +104,8 @@ class PaperTradingTracker:
             "num_whales": num_whales,
         }
 
+        self._dirty_positions.add(token_address)
+
         # Update balance
         self.current_balance -= amount_usd
 
@@ -150,9 +180,16 @@ class PaperTradingTracker:
             "num_whales": position["num_whales"],
         }
         self.closed_trades.append(closed_trade)
+        self._pending_trades.append(closed_trade)
 
         # Remove from positions
         del self.positions[token_address]
+        self._dirty_positions.discard(token_address)
+        position_id = self._position_ids.pop(token_address, None)
+        if position_id is not None:
+            self._closed_position_ids.append(
+                {"id": position_id, "status": "closed", "closed_at": closed_trade["sold_at"]}
+            )
 
         emoji = "💰" if profit_loss > 0 else "📉"
         logger.info(
@@ -166,6 +203,158 @@ class PaperTradingTracker:
 
         return closed_trade
 
+    def update_position(self, token_address: str, **fields: Any) -> None:
+        """Update fields of an open position (e.g. exit targets) and mark it for persist().
+
+        Args:
+            token_address: Token of the open position
+            **fields: Position fields to set
+        """
+        self.positions[token_address].update(fields)
+        self._dirty_positions.add(token_address)
+
+    def stale_positions(self, max_age_seconds: float) -> List[str]:
+        """Open positions whose last exit check is older than max_age_seconds (or never ran).
+
+        Args:
+            max_age_seconds: Maximum age of a reusable last-checked price
+
+        Returns:
+            Token addresses that need a fresh price
+        """
+        cutoff = datetime.utcnow() - timedelta(seconds=max_age_seconds)
+        return [
+            token_address
+            for token_address, position in self.positions.items()
+            if position.get("last_checked_at") is None
+            or position.get("last_price_usd") is None
+            or position["last_checked_at"] < cutoff
+        ]
+
+    def record_check(self, token_address: str, price_usd: float, checked_at: datetime) -> None:
+        """Remember the price an open position was last checked at.
+
+        Args:
+            token_address: Token of the open position
+            price_usd: Fresh price used for the check
+            checked_at: When the price was fetched
+        """
+        self.update_position(token_address, last_price_usd=price_usd, last_checked_at=checked_at)
+
+    def persist(self) -> None:
+        """Write positions and trades changed since the last persist and commit.
+
+        New positions are bulk-inserted, changed ones bulk-updated, sold ones
+        marked closed, and closed trades bulk-inserted, so the cost is
+        proportional to the changes rather than the whole trading history.
+        On failure the changes stay pending and are retried on the next call.
+        """
+        new_rows: List[Dict[str, Any]] = []
+        changed_rows: List[Dict[str, Any]] = []
+        for token_address in self._dirty_positions:
+            position = self.positions[token_address]
+            row = {field: position.get(field) for field in _POSITION_FIELDS}
+            position_id = self._position_ids.get(token_address)
+            if position_id is None:
+                new_rows.append(row)
+            else:
+                changed_rows.append(dict(row, id=position_id))
+
+        try:
+            if new_rows:
+                self.db.bulk_insert_mappings(PaperPosition, new_rows, return_defaults=True)
+            if changed_rows:
+                self.db.bulk_update_mappings(PaperPosition, changed_rows)
+            if self._closed_position_ids:
+                self.db.bulk_update_mappings(PaperPosition, self._closed_position_ids)
+            if self._pending_trades:
+                self.db.bulk_insert_mappings(
+                    PaperTrade,
+                    [
+                        {
+                            key: value
+                            for key, value in trade.items()
+                            if key in PaperTrade.__table__.columns
+                        }
+                        for trade in self._pending_trades
+                    ],
+                )
+            self.db.commit()
+        except Exception as e:
+            logger.error(f"Error persisting paper trading state: {str(e)}")
+            self.db.rollback()
+            return
+
+        self._position_ids.update((row["token_address"], row["id"]) for row in new_rows)
+        self._dirty_positions.clear()
+        self._closed_position_ids.clear()
+        self._pending_trades.clear()
+
+    @classmethod
+    def load_from_db(
+        cls,
+        db: Session,
+        starting_balance: float = 1000.0,
+        closed_trades_limit: Optional[int] = 0,
+    ) -> "PaperTradingTracker":
+        """Load paper trading state from the paper_positions/paper_trades tables.
+
+        Open positions are loaded in full; win/loss totals come from one
+        aggregate query, and balance is derived from them.
+
+        Args:
+            db: Database session (also used by persist())
+            starting_balance: Starting virtual balance
+            closed_trades_limit: Most recent closed trades to load into
+                ``closed_trades`` (0 for none, None for all)
+
+        Returns:
+            PaperTradingTracker instance
+        """
+        tracker = cls(db, starting_balance=starting_balance)
+
+        open_positions = db.execute(
+            select(PaperPosition).where(PaperPosition.status == "open")
+        ).scalars()
+        for row in open_positions:
+            # Unset optional fields stay absent, so position.get(field, default) keeps working
+            tracker.positions[row.token_address] = {
+                field: value
+                for field in _POSITION_FIELDS
+                if (value := getattr(row, field)) is not None
+            }
+            tracker._position_ids[row.token_address] = row.id
+
+        win = PaperTrade.profit_loss > 0
+        wins, losses, total_profit, total_loss = db.execute(
+            select(
+                func.count().filter(win),
+                func.count().filter(~win),
+                func.coalesce(func.sum(PaperTrade.profit_loss).filter(win), 0.0),
+                func.coalesce(-func.sum(PaperTrade.profit_loss).filter(~win), 0.0),
+            )
+        ).one()
+        tracker.win_count = wins
+        tracker.loss_count = losses
+        tracker.total_profit = total_profit
+        tracker.total_loss = total_loss
+
+        open_cost = sum(position["cost_basis"] for position in tracker.positions.values())
+        tracker.current_balance = starting_balance + total_profit - total_loss - open_cost
+
+        if closed_trades_limit != 0:
+            stmt = select(PaperTrade).order_by(PaperTrade.sold_at.desc())
+            if closed_trades_limit is not None:
+                stmt = stmt.limit(closed_trades_limit)
+            trades = db.execute(stmt).scalars().all()
+            columns = PaperTrade.__table__.columns.keys()
+            tracker.closed_trades = [
+                {column: getattr(trade, column) for column in columns}
+                for trade in reversed(trades)
+            ]
+
+        return tracker
+
     async def check_open_positions(self, price_fetcher) -> List[Dict[str, Any]]:
         """Check all open positions and calculate current value.
 
@@ -177,13 +366,20 @@ class PaperTradingTracker:
         """
         results = []
 
+        # Price each unique (token, chain) once for the whole pass
+        try:
+            prices = await price_fetcher.get_token_prices(
+                [(token_address, position["chain_id"]) for token_address, position in self.positions.items()]
+            )
+        except Exception as e:
+            logger.error(f"Error fetching prices for {len(self.positions)} positions: {e}")
+            prices = {}
+
         for token_address, position in self.positions.items():
             # Get current price
-            try:
-                current_price = await price_fetcher.get_token_price(token_address, position["chain_id"])
-            except Exception as e:
-                logger.error(f"Error fetching price for {token_address[:16]}...: {e}")
-                current_price = position["entry_price"]  # Fallback
+            current_price = prices.get(
+                (token_address, position["chain_id"]), position["entry_price"]  # Fallback
+            )
 
             current_value = position["qty"] * current_price
             unrealized_pnl = current_value - position["cost_basis"]
@@ -218,7 +414,7 @@ class PaperTradingTracker:
             Formatted report string
         """
         # Calculate metrics
-        total_trades = len(self.closed_trades)
+        total_trades = self.win_count + self.loss_count
         win_rate = (self.win_count / total_trades * 100) if total_trades > 0 else 0
         net_profit = self.total_profit - self.total_loss
         roi = ((self.current_balance - self.starting_balance) / self.starting_balance) * 100
@@ -309,13 +505,11 @@ class PaperTradingTracker:
         return report
 
     def save_to_file(self, filename: str = "paper_trading_log.json"):
-        """Save paper trading state to JSON file.
+        """Save a JSON snapshot of paper trading state (audit only; see persist()).
 
         Args:
             filename: Filename to save to
         """
-        import json
-
         data = {
             "starting_balance": self.starting_balance,
             "current_balance": self.current_balance,
@@ -325,11 +519,19 @@ class PaperTradingTracker:
             "total_loss": self.total_loss,
             "win_count": self.win_count,
             "loss_count": self.loss_count,
-            "last_updated": datetime.utcnow().isoformat(),
+            "last_updated": datetime.utcnow(),
         }
 
-        with open(filename, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+        with open(filename, "wb") as f:
+            f.write(
+                orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2
+                    | orjson.OPT_NAIVE_UTC
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS,
+                )
+            )
 
         logger.info(f"📁 Paper trading state saved to {filename}")
 
@@ -343,23 +545,25 @@ class PaperTradingTracker:
         Returns:
             PaperTradingTracker instance or None if file doesn't exist
         """
-        import json
-        import os
-
         if not os.path.exists(filename):
             return None
 
         try:
-            with open(filename, "r") as f:
-                data = json.load(f)
+            with open(filename, "rb") as f:
+                data = orjson.loads(f.read())
 
             # Create instance
-            from sqlalchemy.orm import Session
             tracker = cls(Session(), starting_balance=data.get("starting_balance", 1000.0))
 
             # Restore state
             tracker.current_balance = data.get("current_balance", tracker.starting_balance)
             tracker.positions = data.get("positions", {})
+            # Timestamps are written as UTC ISO strings; restore the naive datetimes
+            # the exit checks compare against datetime.utcnow()
+            for position in tracker.positions.values():
+                for field in ("bought_at", "last_checked_at"):
+                    if isinstance(position.get(field), str):
+                        position[field] = datetime.fromisoformat(position[field]).replace(tzinfo=None)
             tracker.closed_trades = data.get("closed_trades", [])
             tracker.total_profit = data.get("total_profit", 0.0)
             tracker.total_loss = data.get("total_loss", 0.0)
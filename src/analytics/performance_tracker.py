@@ -5,8 +5,9 @@ based on signal quality, timeliness, and outcome accuracy.
 """
 
 import logging
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Deque, Dict, Any, List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
 
@@ -14,6 +15,9 @@ from src.db.models import Alert, Trade, Token, WalletStats30D
 
 logger = logging.getLogger(__name__)
 
+# Scoring events kept in memory (oldest dropped first)
+PERFORMANCE_LOG_MAXLEN = 1000
+
 
 class PerformanceTracker:
     """Tracks and scores system performance with rewards/punishments."""
@@ -28,6 +32,7 @@ class PerformanceTracker:
         self.score = 0
         self.total_rewards = 0
         self.total_punishments = 0
+        self.performance_log: Deque[Dict[str, Any]] = deque(maxlen=PERFORMANCE_LOG_MAXLEN)
 
     def evaluate_alert_outcome(self, alert_id: int, hours_after: int = 24) -> Dict[str, Any]:
         """Evaluate how well an alert performed.
@@ -1,7 +1,9 @@
 """FIFO PnL calculation for wallet positions."""
 
 import logging
-from typing import List, Dict, Tuple
+from itertools import groupby
+from operator import attrgetter
+from typing import Any, Iterable, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
@@ -11,6 +13,9 @@ from src.utils.price_fetcher import MultiSourcePriceFetcher
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip when streaming trades from a server-side cursor
+TRADE_STREAM_CHUNK = 1000
+
 
 class FIFOPnLCalculator:
     """Calculate realized and unrealized PnL using FIFO method."""
@@ -70,6 +75,143 @@ class FIFOPnLCalculator:
             "total_pnl": total_realized + total_unrealized,
         }
 
+    async def calculate_all_wallets_pnl(
+        self,
+        wallet_addresses: List[str],
+        days: int = 30,
+        fifo_memo: Optional[Dict[str, Dict[str, Any]]] = None,
+    ) -> Dict[str, Tuple[float, float, float]]:
+        """Calculate PnL and best multiple for many wallets in one pass.
+
+        Loads every trade for the given wallets with a single query, prices all
+        still-open tokens with one batched price lookup and updates the matching
+        positions in the session without committing (the caller commits).
+
+        Args:
+            wallet_addresses: Wallet addresses to calculate
+            days: Number of days to look back
+            fifo_memo: Optional wallet -> FIFO state from an earlier pass over
+                unchanged trade histories. Those wallets skip the trade query
+                and FIFO matching (unrealized PnL is still revalued at current
+                prices). Filled in place with the states computed here.
+
+        Returns:
+            Dict mapping wallet address to (realized_pnl, unrealized_pnl, best_multiple)
+        """
+        if not wallet_addresses:
+            return {}
+
+        if fifo_memo is None:
+            fifo_memo = {}
+        misses = [address for address in wallet_addresses if address not in fifo_memo]
+
+        since = datetime.utcnow() - timedelta(days=days)
+
+        # Only the columns FIFO matching needs, as lightweight rows (no ORM identity map),
+        # streamed from a server-side cursor so only one wallet's trades are held at a time
+        trades = (
+            self.db.query(
+                Trade.wallet_address,
+                Trade.token_address,
+                Trade.chain_id,
+                Trade.side,
+                Trade.qty_token,
+                Trade.price_usd,
+                Trade.usd_value,
+                Trade.fee_usd,
+            )
+            .filter(and_(Trade.wallet_address.in_(misses), Trade.ts >= since))
+            .order_by(Trade.wallet_address, Trade.ts.asc())
+            .yield_per(TRADE_STREAM_CHUNK)
+        ) if misses else []
+
+        # Rows arrive grouped by wallet; split each wallet's run by token (order preserved)
+        # and FIFO-match every wallet/token pair before touching prices
+        trade_count = 0
+        for wallet_address, wallet_trades in groupby(trades, key=attrgetter("wallet_address")):
+            token_groups: Dict[str, List[Trade]] = {}
+            for trade in wallet_trades:
+                token_groups.setdefault(trade.token_address, []).append(trade)
+                trade_count += 1
+
+            tokens = {}
+            for token_address, token_trades in token_groups.items():
+                buy_queue, realized_pnl = self._match_fifo(token_trades)
+                # (chain_id, open lots, realized PnL, last trade price)
+                tokens[token_address] = (
+                    token_trades[0].chain_id, buy_queue, realized_pnl, token_trades[-1].price_usd
+                )
+            fifo_memo[wallet_address] = {
+                "tokens": tokens,
+                "best_multiple": self._best_multiple(token_groups.values()),
+            }
+
+        states = {
+            address: fifo_memo[address] for address in wallet_addresses if address in fifo_memo
+        }
+
+        # One batched price lookup for every token that still has an open queue
+        open_tokens = {
+            (token_address, chain_id)
+            for state in states.values()
+            for token_address, (chain_id, buy_queue, _, _) in state["tokens"].items()
+            if buy_queue
+        }
+        prices = await self.price_fetcher.get_token_prices(list(open_tokens)) if open_tokens else {}
+
+        positions = {
+            (p.wallet_address, p.token_address): p
+            for p in self.db.query(Position)
+            .filter(Position.wallet_address.in_(list(states)))
+            .all()
+        }
+
+        results: Dict[str, Tuple[float, float, float]] = {}
+        now = datetime.utcnow()
+
+        for wallet_address, state in states.items():
+            total_realized = 0.0
+            total_unrealized = 0.0
+
+            for token_address, (chain_id, buy_queue, realized_pnl, last_price) in state["tokens"].items():
+                current_price = 0.0
+                if buy_queue:
+                    current_price = prices.get((token_address, chain_id), 0.0)
+                    if current_price == 0.0:
+                        # Fallback to last trade price if ALL price sources fail
+                        current_price = last_price
+
+                unrealized_pnl = sum(
+                    qty * current_price - cost_basis for qty, _, cost_basis in buy_queue
+                )
+                total_realized += realized_pnl
+                total_unrealized += unrealized_pnl
+
+                position = positions.get((wallet_address, token_address))
+                if position is None:
+                    position = Position(
+                        wallet_address=wallet_address,
+                        token_address=token_address,
+                        chain_id=chain_id,
+                    )
+                    self.db.add(position)
+                position.qty = sum(qty for qty, _, _ in buy_queue)
+                position.cost_basis_usd = sum(cost for _, _, cost in buy_queue)
+                position.realized_pnl_usd = realized_pnl
+                position.unrealized_pnl_usd = unrealized_pnl
+                position.last_price_usd = current_price
+                position.last_update = now
+
+            results[wallet_address] = (total_realized, total_unrealized, state["best_multiple"])
+
+        logger.info(
+            f"Calculated PnL for {len(results)} wallets "
+            f"({len(misses)} re-matched from {trade_count} trades, "
+            f"{len(open_tokens)} open tokens priced)"
+        )
+
+        return results
+
     async def _calculate_token_pnl(
         self, wallet_address: str, token_address: str, trades: List[Trade]
     ) -> Tuple[float, float]:
@@ -86,42 +228,7 @@ class FIFOPnLCalculator:
         if not trades:
             return 0.0, 0.0
 
-        # FIFO queue of buys: (qty, price, cost_basis)
-        buy_queue: List[Tuple[float, float, float]] = []
-        realized_pnl = 0.0
-
-        for trade in trades:
-            if trade.side == "buy":
-                # Add to queue
-                cost = trade.usd_value + (trade.fee_usd or 0)
-                buy_queue.append((trade.qty_token, trade.price_usd, cost))
-
-            elif trade.side == "sell":
-                # Match with buys FIFO
-                sell_qty = trade.qty_token
-                sell_proceeds = trade.usd_value - (trade.fee_usd or 0)
-
-                while sell_qty > 0 and buy_queue:
-                    buy_qty, buy_price, buy_cost = buy_queue[0]
-
-                    if sell_qty >= buy_qty:
-                        # Consume entire buy
-                        sell_qty -= buy_qty
-                        # Realized = proceeds proportional to this buy - cost basis
-                        proportion = buy_qty / trade.qty_token
-                        realized_pnl += (sell_proceeds * proportion) - buy_cost
-                        buy_queue.pop(0)
-                    else:
-                        # Partial buy
-                        proportion = sell_qty / trade.qty_token
-                        cost_proportion = (sell_qty / buy_qty) * buy_cost
-                        realized_pnl += (sell_proceeds * proportion) - cost_proportion
-
-                        # Update remaining buy
-                        remaining_qty = buy_qty - sell_qty
-                        remaining_cost = buy_cost - cost_proportion
-                        buy_queue[0] = (remaining_qty, buy_price, remaining_cost)
-                        sell_qty = 0
+        buy_queue, realized_pnl = self._match_fifo(trades)
 
         # Calculate unrealized PnL from remaining positions
         unrealized_pnl = 0.0
@@ -180,6 +287,57 @@ class FIFOPnLCalculator:
 
         return realized_pnl, unrealized_pnl
 
+    @staticmethod
+    def _match_fifo(
+        trades: List[Trade],
+    ) -> Tuple[List[Tuple[float, float, float]], float]:
+        """Match sells against buys FIFO.
+
+        Args:
+            trades: Trades for a single wallet/token pair, oldest first
+
+        Returns:
+            Tuple of (remaining buy queue as (qty, price, cost_basis), realized_pnl)
+        """
+        # FIFO queue of buys: (qty, price, cost_basis)
+        buy_queue: List[Tuple[float, float, float]] = []
+        realized_pnl = 0.0
+
+        for trade in trades:
+            if trade.side == "buy":
+                # Add to queue
+                cost = trade.usd_value + (trade.fee_usd or 0)
+                buy_queue.append((trade.qty_token, trade.price_usd, cost))
+
+            elif trade.side == "sell":
+                # Match with buys FIFO
+                sell_qty = trade.qty_token
+                sell_proceeds = trade.usd_value - (trade.fee_usd or 0)
+
+                while sell_qty > 0 and buy_queue:
+                    buy_qty, buy_price, buy_cost = buy_queue[0]
+
+                    if sell_qty >= buy_qty:
+                        # Consume entire buy
+                        sell_qty -= buy_qty
+                        # Realized = proceeds proportional to this buy - cost basis
+                        proportion = buy_qty / trade.qty_token
+                        realized_pnl += (sell_proceeds * proportion) - buy_cost
+                        buy_queue.pop(0)
+                    else:
+                        # Partial buy
+                        proportion = sell_qty / trade.qty_token
+                        cost_proportion = (sell_qty / buy_qty) * buy_cost
+                        realized_pnl += (sell_proceeds * proportion) - cost_proportion
+
+                        # Update remaining buy
+                        remaining_qty = buy_qty - sell_qty
+                        remaining_cost = buy_cost - cost_proportion
+                        buy_queue[0] = (remaining_qty, buy_price, remaining_cost)
+                        sell_qty = 0
+
+        return buy_queue, realized_pnl
+
     def _update_position(
         self,
         wallet_address: str,
@@ -271,9 +429,21 @@ class FIFOPnLCalculator:
                 trades_by_token[trade.token_address] = []
             trades_by_token[trade.token_address].append(trade)
 
+        return self._best_multiple(trades_by_token.values())
+
+    @staticmethod
+    def _best_multiple(token_groups: Iterable[List[Trade]]) -> float:
+        """Best average-sell / average-buy multiple across a wallet's tokens.
+
+        Args:
+            token_groups: Trades grouped per token
+
+        Returns:
+            Best trade multiple (1.0 if no token has both buys and sells)
+        """
         best_multiple = 1.0
 
-        for token_trades in trades_by_token.values():
+        for token_trades in token_groups:
             buys = [t for t in token_trades if t.side == "buy"]
             sells = [t for t in token_trades if t.side == "sell"]
 
@@ -101,7 +101,7 @@ async def get_overview_stats(db: Session = Depends(get_db)):
 
         # Paper trading status
         try:
-            paper_trader = PaperTradingTracker.load_from_file()
+            paper_trader = PaperTradingTracker.load_from_db(db)
             if paper_trader:
                 paper_stats = {
                     "balance": paper_trader.current_balance,
@@ -358,12 +358,12 @@ async def get_recent_alerts(limit: int = 20, db: Session = Depends(get_db)):
 
 
 @app.get("/api/paper-trading/status")
-async def get_paper_trading_status():
+async def get_paper_trading_status(db: Session = Depends(get_db)):
     """Get current paper trading status and positions."""
     try:
-        paper_trader = PaperTradingTracker.load_from_file()
+        paper_trader = PaperTradingTracker.load_from_db(db, closed_trades_limit=20)
 
-        if not paper_trader:
+        if not paper_trader.positions and not paper_trader.closed_trades:
             return {
                 "active": False,
                 "message": "No paper trading data available",
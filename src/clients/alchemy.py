@@ -1,8 +1,10 @@
 """Alchemy API client for EVM chain data."""
 
+import asyncio
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+import httpx
 from src.clients.base import BaseAPIClient
 from src.clients.dexscreener import DexScreenerClient
 from src.utils.dex_routers import is_dex_router, get_dex_name
@@ -10,18 +12,57 @@ from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Blocks scanned back for token transfers (~3 hours on Ethereum)
+TRANSFER_LOOKBACK_BLOCKS = 1000
+
+# alchemy_getAssetTransfers calls bundled into one JSON-RPC batch request
+MAX_RPC_BATCH = 50
+
+# Process-wide client, so scheduler ticks reuse its keep-alive connections
+_ALCHEMY: Optional["AlchemyClient"] = None
+
+
+def get_alchemy_client() -> "AlchemyClient":
+    """Return the shared AlchemyClient, creating it on first use.
+
+    Raises:
+        ValueError: If ALCHEMY_API_KEY is not configured
+    """
+    global _ALCHEMY
+    if _ALCHEMY is None:
+        _ALCHEMY = AlchemyClient()
+    return _ALCHEMY
+
+
+async def close_alchemy_client() -> None:
+    """Close the shared AlchemyClient's HTTP connections, if it was created."""
+    global _ALCHEMY
+    if _ALCHEMY is not None:
+        await _ALCHEMY.close()
+        await _ALCHEMY.dex_client.close()
+        _ALCHEMY = None
+
 
 class AlchemyClient(BaseAPIClient):
     """Client for Alchemy blockchain data."""
 
-    def __init__(self) -> None:
-        """Initialize Alchemy client."""
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        """Initialize Alchemy client.
+
+        Args:
+            transport: Optional httpx transport (e.g. a ThrottledTransport)
+        """
         self.api_key = settings.alchemy_api_key
 
         if not self.api_key:
             raise ValueError("ALCHEMY_API_KEY not set in .env file")
 
-        super().__init__(base_url=f"https://eth-mainnet.g.alchemy.com/v2/{self.api_key}")
+        super().__init__(
+            base_url=f"https://eth-mainnet.g.alchemy.com/v2/{self.api_key}",
+            timeout=20,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            transport=transport,
+        )
         self.dex_client = DexScreenerClient()
         logger.info("✅ Alchemy client initialized")
 
@@ -40,88 +81,232 @@ class AlchemyClient(BaseAPIClient):
         """
         try:
             # First get current block number
-            block_payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "eth_blockNumber",
-                "params": []
-            }
-            block_response = await self.post("", data=block_payload)
-            latest_block = int(block_response.get("result", "0x0"), 16)
-            # CHANGED: Look back only 1000 blocks (~3 hours) for FRESH RECENT whales!
-            # We want whales trading RIGHT NOW, not 2 weeks ago
-            from_block = max(0, latest_block - 1000)
+            from_block = await self._transfer_from_block()
 
             # Use Alchemy's getAssetTransfers API with block range
             payload = {
                 "jsonrpc": "2.0",
                 "id": 1,
                 "method": "alchemy_getAssetTransfers",
-                "params": [{
-                    "fromBlock": hex(from_block),
-                    "toBlock": "latest",
-                    "contractAddresses": [token_address],
-                    "category": ["erc20"],
-                    "maxCount": f"0x{min(limit, 1000):x}",
-                    "order": "desc"
-                }]
+                "params": [self._asset_transfer_params(token_address, from_block, limit)],
             }
 
             response = await self.post("", data=payload)
-            transfers = []
 
             # Get token price from DexScreener
             token_info = await self.dex_client.get_token_info(token_address)
             current_price = token_info.get("price_usd", 0)
 
-            # Identify potential DEX pools (addresses that send tokens multiple times)
-            from_address_counts = {}
-            all_transfers = response.get("result", {}).get("transfers", [])
-            for transfer in all_transfers:
-                from_addr = transfer.get("from", "").lower()
-                from_address_counts[from_addr] = from_address_counts.get(from_addr, 0) + 1
+            return self._parse_dex_buys(
+                token_address, response.get("result", {}).get("transfers", []), current_price
+            )
 
-            # Addresses sending multiple times are likely DEX pools
-            potential_pools = {addr for addr, count in from_address_counts.items() if count > 2}
+        except Exception as e:
+            logger.error(f"Alchemy API error: {str(e)}")
+            return []
 
-            logger.info(f"Identified {len(potential_pools)} potential DEX pools for {token_address[:10]}...")
+    async def get_token_transfers_batch(
+        self, token_addresses: List[str], limit: int = 100
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get recent token transfers (buys) for many tokens with JSON-RPC batches.
 
-            for transfer in all_transfers:
-                # CORRECT LOGIC: Check if transfer is FROM a DEX pool (not TO a router)
-                # When users buy tokens, the pool sends tokens to the buyer
-                from_address = transfer.get("from", "").lower()
+        Sends one block-number call, then bundles up to MAX_RPC_BATCH
+        alchemy_getAssetTransfers calls per HTTP request, and prices every
+        token with one batched DexScreener lookup.
 
-                # Check if from a known DEX pool (heuristic: sends tokens multiple times)
-                if from_address not in potential_pools:
-                    continue  # Skip transfers not from DEX pools
+        Args:
+            token_addresses: Token contract addresses
+            limit: Max number of transfers per token
 
-                # The "to" address is the buyer's wallet
-                buyer_address = transfer.get("to", "")
+        Returns:
+            Dict of token_address -> transfer data (same shape as get_token_transfers);
+            tokens whose batch failed are omitted
+        """
+        token_addresses = list(dict.fromkeys(token_addresses))
+        if not token_addresses:
+            return {}
 
-                amount = float(transfer.get("value", 0))
-                value_usd = amount * current_price if current_price > 0 else 0
+        try:
+            from_block = await self._transfer_from_block()
+        except Exception as e:
+            logger.error(f"Alchemy API error: {str(e)}")
+            return {}
+
+        async def fetch_batch(chunk: List[str]) -> Dict[Any, Dict[str, Any]]:
+            batch = [
+                {
+                    "jsonrpc": "2.0",
+                    "id": i,
+                    "method": "alchemy_getAssetTransfers",
+                    "params": [self._asset_transfer_params(token_address, from_block, limit)],
+                }
+                for i, token_address in enumerate(chunk)
+            ]
+            responses = await self.post("", data=batch)
+            # Batch responses may come back in any order; match them up by id
+            return {response.get("id"): response for response in responses}
+
+        chunks = [
+            token_addresses[i:i + MAX_RPC_BATCH]
+            for i in range(0, len(token_addresses), MAX_RPC_BATCH)
+        ]
+        batch_results, token_infos = await asyncio.gather(
+            asyncio.gather(*(fetch_batch(chunk) for chunk in chunks), return_exceptions=True),
+            self.dex_client.get_tokens_info(token_addresses),
+        )
+
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        for chunk, responses in zip(chunks, batch_results):
+            if isinstance(responses, Exception):
+                logger.error(f"Alchemy batch error for {len(chunk)} tokens: {str(responses)}")
+                continue
+
+            for i, token_address in enumerate(chunk):
+                response = responses.get(i, {})
+                if "error" in response:
+                    logger.error(f"Alchemy API error for {token_address[:10]}...: {response['error']}")
+                    continue
+                current_price = token_infos.get(token_address, {}).get("price_usd", 0)
+                results[token_address] = self._parse_dex_buys(
+                    token_address, response.get("result", {}).get("transfers", []), current_price
+                )
+
+        return results
+
+    async def _transfer_from_block(self) -> int:
+        """First block of the recent-transfer window, from the current block number."""
+        block_payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "eth_blockNumber",
+            "params": []
+        }
+        block_response = await self.post("", data=block_payload)
+        latest_block = int(block_response.get("result", "0x0"), 16)
+        # CHANGED: Look back only 1000 blocks (~3 hours) for FRESH RECENT whales!
+        # We want whales trading RIGHT NOW, not 2 weeks ago
+        return max(0, latest_block - TRANSFER_LOOKBACK_BLOCKS)
+
+    @staticmethod
+    def _asset_transfer_params(token_address: str, from_block: int, limit: int) -> Dict[str, Any]:
+        """alchemy_getAssetTransfers params for a token's recent ERC-20 transfers."""
+        return {
+            "fromBlock": hex(from_block),
+            "toBlock": "latest",
+            "contractAddresses": [token_address],
+            "category": ["erc20"],
+            "maxCount": f"0x{min(limit, 1000):x}",
+            "order": "desc"
+        }
+
+    @staticmethod
+    def _parse_dex_buys(
+        token_address: str, all_transfers: List[Dict[str, Any]], current_price: float
+    ) -> List[Dict[str, Any]]:
+        """Turn raw asset transfers into DEX buys (transfers out of likely pools).
 
-                transfers.append({
-                    "tx_hash": transfer.get("hash"),
-                    "timestamp": datetime.now(),
-                    "from_address": buyer_address,  # The buyer, not the pool
-                    "type": "buy",
-                    "token_address": token_address,
-                    "amount": amount,
-                    "price_usd": current_price,
-                    "value_usd": value_usd,
-                    "dex": "dex_pool",  # Generic since we're using heuristic
-                })
+        Args:
+            token_address: Token contract address
+            all_transfers: alchemy_getAssetTransfers results
+            current_price: Token USD price (0 if unknown)
+
+        Returns:
+            List of transfer data
+        """
+        transfers = []
+
+        # Identify potential DEX pools (addresses that send tokens multiple times)
+        from_address_counts = {}
+        for transfer in all_transfers:
+            from_addr = transfer.get("from", "").lower()
+            from_address_counts[from_addr] = from_address_counts.get(from_addr, 0) + 1
 
-            logger.info(f"Fetched {len(transfers)} DEX buys for {token_address[:10]}... (price=${current_price:.6f})")
-            return transfers
+        # Addresses sending multiple times are likely DEX pools
+        potential_pools = {addr for addr, count in from_address_counts.items() if count > 2}
+
+        logger.info(f"Identified {len(potential_pools)} potential DEX pools for {token_address[:10]}...")
+
+        for transfer in all_transfers:
+            # CORRECT LOGIC: Check if transfer is FROM a DEX pool (not TO a router)
+            # When users buy tokens, the pool sends tokens to the buyer
+            from_address = transfer.get("from", "").lower()
+
+            # Check if from a known DEX pool (heuristic: sends tokens multiple times)
+            if from_address not in potential_pools:
+                continue  # Skip transfers not from DEX pools
+
+            # The "to" address is the buyer's wallet
+            buyer_address = transfer.get("to", "")
+
+            amount = float(transfer.get("value", 0))
+            value_usd = amount * current_price if current_price > 0 else 0
+
+            transfers.append({
+                "tx_hash": transfer.get("hash"),
+                "timestamp": datetime.now(),
+                "from_address": buyer_address,  # The buyer, not the pool
+                "type": "buy",
+                "token_address": token_address,
+                "amount": amount,
+                "price_usd": current_price,
+                "value_usd": value_usd,
+                "dex": "dex_pool",  # Generic since we're using heuristic
+            })
+
+        logger.info(f"Fetched {len(transfers)} DEX buys for {token_address[:10]}... (price=${current_price:.6f})")
+        return transfers
+
+    async def get_latest_tx_hash(self, wallet_address: str, chain_id: str) -> Optional[str]:
+        """Get the hash of the wallet's most recent ERC20 transfer (in or out).
+
+        Cheap probe (two maxCount=1 queries) used to skip the full
+        get_wallet_transactions fetch when nothing has changed.
+
+        Args:
+            wallet_address: Wallet address
+            chain_id: Chain identifier
+
+        Returns:
+            Latest transfer hash or None if unavailable
+        """
+        try:
+            latest = None
+            for direction in ("toAddress", "fromAddress"):
+                payload = {
+                    "jsonrpc": "2.0",
+                    "id": 1,
+                    "method": "alchemy_getAssetTransfers",
+                    "params": [{
+                        "fromBlock": "0x0",
+                        "toBlock": "latest",
+                        direction: wallet_address,
+                        "category": ["erc20"],
+                        "maxCount": "0x1",
+                        "order": "desc"
+                    }]
+                }
+                response = await self.post("", data=payload)
+                transfers = response.get("result", {}).get("transfers", [])
+                if not transfers:
+                    continue
+
+                transfer = transfers[0]
+                block = int(transfer.get("blockNum", "0x0"), 16)
+                if latest is None or block > latest[0]:
+                    latest = (block, transfer.get("hash"))
+
+            return latest[1] if latest else None
 
         except Exception as e:
             logger.error(f"Alchemy API error: {str(e)}")
-            return []
+            return None
 
     async def get_wallet_transactions(
-        self, wallet_address: str, chain_id: str, limit: int = 10
+        self,
+        wallet_address: str,
+        chain_id: str,
+        limit: int = 10,
+        raise_errors: bool = False,
     ) -> List[Dict[str, Any]]:
         """Get recent wallet transactions (both buys and sells).
 
@@ -129,6 +314,8 @@ class AlchemyClient(BaseAPIClient):
             wallet_address: Wallet address
             chain_id: Chain identifier
             limit: Max number of transactions
+            raise_errors: Re-raise API failures instead of returning an empty list,
+                for callers that must tell "no transfers" apart from a failed fetch
 
         Returns:
             List of transaction data with both buys and sells
@@ -267,4 +454,6 @@ class AlchemyClient(BaseAPIClient):
 
         except Exception as e:
             logger.error(f"Alchemy API error: {str(e)}")
+            if raise_errors:
+                raise
             return []
@@ -1,7 +1,8 @@
 """Base client with retry logic and error handling."""
 
+import asyncio
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Union
 import httpx
 from tenacity import (
     retry,
@@ -31,6 +32,8 @@ class BaseAPIClient:
         api_key: Optional[str] = None,
         timeout: int = 30,
         max_retries: int = 3,
+        limits: Optional[httpx.Limits] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ):
         """Initialize base client.
 
@@ -39,12 +42,17 @@ class BaseAPIClient:
             api_key: Optional API key
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
+            limits: Optional connection pool limits (httpx defaults otherwise)
+            transport: Optional httpx transport (e.g. a ThrottledTransport); when
+                given, it owns the connection pool and limits is ignored
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.client = httpx.AsyncClient(
+            timeout=timeout, limits=limits or httpx.Limits(), transport=transport
+        )
 
     def _get_headers(self) -> Dict[str, str]:
         """Get default headers for requests."""
@@ -81,7 +89,6 @@ class BaseAPIClient:
         """
         # Add rate limiting delay if specified
         if rate_limit_delay > 0:
-            import asyncio
             await asyncio.sleep(rate_limit_delay)
 
         url = f"{self.base_url}/{endpoint.lstrip('/')}"
@@ -112,14 +119,14 @@ class BaseAPIClient:
     async def post(
         self,
         endpoint: str,
-        data: Optional[Dict[str, Any]] = None,
+        data: Optional[Union[Dict[str, Any], List[Dict[str, Any]]]] = None,
         headers: Optional[Dict[str, str]] = None,
-    ) -> Dict[str, Any]:
+    ) -> Any:
         """Make POST request with retry logic.
 
         Args:
             endpoint: API endpoint
-            data: Request body
+            data: Request body (a list for JSON-RPC batch requests)
             headers: Additional headers
 
         Returns:
@@ -1,6 +1,7 @@
 """DEX Screener API client for trending tokens."""
 
 import logging
+import time
 from typing import List, Dict, Any
 from src.clients.base import BaseAPIClient
 
@@ -10,6 +11,9 @@ logger = logging.getLogger(__name__)
 class DexScreenerClient(BaseAPIClient):
     """Client for DEX Screener trending tokens."""
 
+    # dex/tokens/{addresses} accepts at most 30 comma-separated addresses
+    MAX_TOKENS_PER_REQUEST = 30
+
     def __init__(self) -> None:
         """Initialize DEX Screener client."""
         super().__init__(base_url="https://api.dexscreener.com/latest")
@@ -85,8 +89,6 @@ class DexScreenerClient(BaseAPIClient):
         Returns:
             Token info
         """
-        import time
-
         # Check cache first
         cache_key = f"token_info:{token_address}"
         if cache_key in self._cache:
@@ -124,3 +126,63 @@ class DexScreenerClient(BaseAPIClient):
         except Exception as e:
             logger.error(f"Error fetching token info for {token_address}: {str(e)}")
             return {}
+
+    async def get_tokens_info(self, token_addresses: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get info for many tokens using the comma-separated tokens endpoint.
+
+        Args:
+            token_addresses: Token contract addresses (any chain)
+
+        Returns:
+            Dict of token_address -> token info (same shape as get_token_info);
+            tokens with no pairs are omitted
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        to_fetch = []
+
+        # Serve what we can from the per-token cache
+        for token_address in dict.fromkeys(token_addresses):
+            cache_key = f"token_info:{token_address}"
+            if cache_key in self._cache:
+                cached_data, cached_time = self._cache[cache_key]
+                if time.time() - cached_time < self._cache_ttl:
+                    results[token_address] = cached_data
+                    continue
+            to_fetch.append(token_address)
+
+        for i in range(0, len(to_fetch), self.MAX_TOKENS_PER_REQUEST):
+            chunk = to_fetch[i:i + self.MAX_TOKENS_PER_REQUEST]
+
+            try:
+                response = await self.get(f"dex/tokens/{','.join(chunk)}", rate_limit_delay=3.0)
+            except Exception as e:
+                logger.error(f"Error fetching token info for {len(chunk)} tokens: {str(e)}")
+                continue
+
+            # Keep the highest-liquidity pair per base token
+            best_pairs: Dict[str, Dict[str, Any]] = {}
+            for pair in response.get("pairs") or []:
+                base_address = pair.get("baseToken", {}).get("address", "").lower()
+                liquidity = float(pair.get("liquidity", {}).get("usd", 0))
+                best = best_pairs.get(base_address)
+                if best is None or liquidity > float(best.get("liquidity", {}).get("usd", 0)):
+                    best_pairs[base_address] = pair
+
+            for token_address in chunk:
+                best_pair = best_pairs.get(token_address.lower())
+                if not best_pair:
+                    continue
+
+                result = {
+                    "token_address": token_address,
+                    "chain_id": best_pair.get("chainId"),
+                    "symbol": best_pair.get("baseToken", {}).get("symbol"),
+                    "price_usd": float(best_pair.get("priceUsd", 0)),
+                    "liquidity_usd": float(best_pair.get("liquidity", {}).get("usd", 0)),
+                    "volume_24h_usd": float(best_pair.get("volume", {}).get("h24", 0)),
+                    "price_change_24h": float(best_pair.get("priceChange", {}).get("h24", 0)),
+                }
+                self._cache[f"token_info:{token_address}"] = (result, time.time())
+                results[token_address] = result
+
+        return results
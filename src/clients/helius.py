@@ -2,8 +2,9 @@
 
 import logging
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from datetime import datetime
+import httpx
 from src.clients.base import BaseAPIClient
 from src.clients.dexscreener import DexScreenerClient
 from src.utils.dex_routers import is_dex_router, get_dex_name
@@ -15,8 +16,12 @@ logger = logging.getLogger(__name__)
 class HeliusClient(BaseAPIClient):
     """Client for Helius Solana data."""
 
-    def __init__(self) -> None:
-        """Initialize Helius client."""
+    def __init__(self, transport: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        """Initialize Helius client.
+
+        Args:
+            transport: Optional httpx transport (e.g. a ThrottledTransport)
+        """
         # Try settings first, fallback to direct os.getenv
         self.api_key = settings.helius_api_key or os.getenv("HELIUS_API_KEY", "")
 
@@ -27,7 +32,7 @@ class HeliusClient(BaseAPIClient):
             logger.info(f"✅ Helius client initialized with API key: {self.api_key[:8]}...")
 
         # Helius uses mainnet RPC endpoint with API key as query param
-        super().__init__(base_url=f"https://mainnet.helius-rpc.com")
+        super().__init__(base_url=f"https://mainnet.helius-rpc.com", transport=transport)
         self.dex_client = DexScreenerClient()
 
     async def get_wallet_transactions(
@@ -43,12 +48,10 @@ class HeliusClient(BaseAPIClient):
             # Endpoint: https://api.helius.xyz/v0/addresses/{address}/transactions
             url = f"https://api.helius.xyz/v0/addresses/{wallet_address}/transactions?api-key={self.api_key}"
 
-            # Make request with httpx directly
-            import httpx
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url, params={"limit": min(limit, 100)})
-                response.raise_for_status()
-                data = response.json()
+            # Absolute URL on the shared client (keeps its connection pool and transport)
+            response = await self.client.get(url, params={"limit": min(limit, 100)})
+            response.raise_for_status()
+            data = response.json()
 
             transactions = []
             for tx in data:
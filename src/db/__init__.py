@@ -1,12 +1,25 @@
 """Database models and connection management."""
 
-from src.db.session import engine, SessionLocal, get_db
-from src.db.models import Base, Token, SeedToken, Wallet, Trade, Position, WalletStats30D, Alert
+from src.db.session import engine, SessionLocal, AsyncSessionLocal, get_db, get_async_session
+from src.db.models import (
+    Base,
+    Token,
+    SeedToken,
+    Wallet,
+    Trade,
+    Position,
+    WalletStats30D,
+    Alert,
+    PaperPosition,
+    PaperTrade,
+)
 
 __all__ = [
     "engine",
     "SessionLocal",
+    "AsyncSessionLocal",
     "get_db",
+    "get_async_session",
     "Base",
     "Token",
     "SeedToken",
@@ -15,4 +28,6 @@ __all__ = [
     "Position",
     "WalletStats30D",
     "Alert",
+    "PaperPosition",
+    "PaperTrade",
 ]
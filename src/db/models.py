@@ -40,7 +40,10 @@ class Token(Base):
     seed_tokens = relationship("SeedToken", back_populates="token")
     trades = relationship("Trade", back_populates="token")
 
-    __table_args__ = (Index("idx_tokens_chain", "chain_id"),)
+    __table_args__ = (
+        Index("idx_tokens_chain", "chain_id"),
+        Index("idx_tokens_liquidity", "liquidity_usd"),
+    )
 
 
 class SeedToken(Base):
@@ -63,6 +66,7 @@ class SeedToken(Base):
     __table_args__ = (
         Index("idx_seed_tokens_snapshot", "snapshot_ts"),
         Index("idx_seed_tokens_token_chain", "token_address", "chain_id"),
+        Index("idx_seed_tokens_vol", "vol_24h_usd"),
     )
 
 
@@ -114,6 +118,7 @@ class Trade(Base):
         Index("idx_trades_wallet_ts", "wallet_address", "ts"),
         Index("idx_trades_token_ts", "token_address", "ts"),
         Index("idx_trades_chain_ts", "chain_id", "ts"),
+        Index("idx_trades_ts_side_wallet", "ts", "side", "wallet_address"),
     )
 
 
@@ -159,6 +164,7 @@ class WalletStats30D(Base):
     __table_args__ = (
         Index("idx_wallet_stats_pnl", "realized_pnl_usd"),
         Index("idx_wallet_stats_trades", "trades_count"),
+        Index("idx_wallet_stats_unrealized_pnl", "unrealized_pnl_usd"),
     )
 
 
@@ -200,3 +206,56 @@ class CustomWatchlistWallet(Base):
         Index("idx_custom_watchlist_active", "is_active"),
         Index("idx_custom_watchlist_added", "added_at"),
     )
+
+
+class PaperPosition(Base):
+    """Paper trading positions (open until sold, then kept for audit)."""
+
+    __tablename__ = "paper_positions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    token_address = Column(String(100), nullable=False)
+    chain_id = Column(String(20), nullable=False)
+    qty = Column(Float, nullable=False)
+    entry_price = Column(Float, nullable=False)
+    cost_basis = Column(Float, nullable=False)
+    bought_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    reason = Column(Text, nullable=True)
+    num_whales = Column(Integer, nullable=False, default=1)
+    take_profit_pct = Column(Float, nullable=True)
+    stop_loss_pct = Column(Float, nullable=True)
+    peak_profit_pct = Column(Float, nullable=True)
+    last_price_usd = Column(Float, nullable=True)  # Price at the last exit check
+    last_checked_at = Column(DateTime, nullable=True)
+    status = Column(String(10), nullable=False, default="open")  # open, closed
+    closed_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("idx_paper_positions_status", "status"),
+        CheckConstraint("status IN ('open', 'closed')", name="check_paper_position_status"),
+    )
+
+
+class PaperTrade(Base):
+    """Closed paper trades with realized profit/loss."""
+
+    __tablename__ = "paper_trades"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    token_address = Column(String(100), nullable=False)
+    chain_id = Column(String(20), nullable=False)
+    entry_price = Column(Float, nullable=False)
+    exit_price = Column(Float, nullable=False)
+    qty = Column(Float, nullable=False)
+    cost_basis = Column(Float, nullable=False)
+    proceeds = Column(Float, nullable=False)
+    profit_loss = Column(Float, nullable=False)
+    profit_pct = Column(Float, nullable=False)
+    hold_time_hours = Column(Float, nullable=False)
+    bought_at = Column(DateTime, nullable=False)
+    sold_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    buy_reason = Column(Text, nullable=True)
+    sell_reason = Column(Text, nullable=True)
+    num_whales = Column(Integer, nullable=False, default=1)
+
+    __table_args__ = (Index("idx_paper_trades_sold_at", "sold_at"),)
@@ -1,7 +1,8 @@
 """Database session management."""
 
-from typing import Generator
+from typing import Generator, Optional
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from src.config import settings
 
@@ -9,13 +10,24 @@ from src.config import settings
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_timeout=30,  # Fail fast instead of queueing forever when jobs pile up
+    pool_recycle=1800,  # Replace connections before server/proxy idle timeouts drop them
+    isolation_level="READ COMMITTED",
+    # Multi-row INSERTs are batched by default; also batch executemany UPDATE/DELETE
+    executemany_mode="values_plus_batch",
+    connect_args={"options": f"-c synchronous_commit={settings.db_synchronous_commit}"},
 )
 
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async session factory for jobs that await their queries instead of blocking
+# the event loop; bound to the asyncpg engine on first use
+AsyncSessionLocal = async_sessionmaker(autoflush=False, expire_on_commit=False)
+_async_engine: Optional[AsyncEngine] = None
+
 
 def get_db() -> Generator[Session, None, None]:
     """Dependency for FastAPI to get database session."""
@@ -24,3 +36,23 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_async_session() -> AsyncSession:
+    """Open an AsyncSession, creating the asyncpg engine on first use.
+
+    Use as ``async with get_async_session() as db:``.
+    """
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            settings.database_url.replace("postgresql://", "postgresql+asyncpg://", 1),
+            pool_pre_ping=True,
+            pool_size=settings.db_async_pool_size,
+            max_overflow=settings.db_async_max_overflow,
+            pool_recycle=1800,
+            isolation_level="READ COMMITTED",
+            connect_args={"server_settings": {"synchronous_commit": settings.db_synchronous_commit}},
+        )
+        AsyncSessionLocal.configure(bind=_async_engine)
+    return AsyncSessionLocal()
@@ -1,14 +1,18 @@
 """Runner token ingestion from trending sources."""
 
+import hashlib
 import logging
 from datetime import datetime
 from typing import List, Dict, Any
+
+import orjson
 from sqlalchemy.orm import Session
 from src.clients.dexscreener import DexScreenerClient
 from src.clients.geckoterminal import GeckoTerminalClient
 from src.clients.birdeye import BirdeyeClient
 from src.db.models import Token, SeedToken
 from src.config import settings
+from src.utils.redis_cache import cache_get_many, cache_set_many, feed_key
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +53,14 @@ class RunnerIngestion:
                 logger.warning(f"Unknown source {source} for chain {chain}")
                 return 0
 
+            # Skip all DB writes when the feed is identical to the last ingested payload
+            key = feed_key(source, chain)
+            fingerprint = self._fingerprint(tokens)
+            (previous,) = await cache_get_many([key])
+            if tokens and previous == fingerprint:
+                logger.info(f"⏭️  {source} feed for {chain} unchanged, skipping ingest")
+                return 0
+
             count = 0
             snapshot_ts = datetime.utcnow()
 
@@ -82,6 +94,8 @@ class RunnerIngestion:
                     continue
 
             self.db.commit()
+            if tokens:
+                await cache_set_many({key: fingerprint}, settings.feed_fingerprint_ttl_seconds)
             logger.info(f"Ingested {count} tokens from {source} for {chain}")
             return count
 
@@ -90,6 +104,19 @@ class RunnerIngestion:
             self.db.rollback()
             return 0
 
+    @staticmethod
+    def _fingerprint(tokens: List[Dict[str, Any]]) -> str:
+        """Hash a normalized feed payload (key order independent).
+
+        Args:
+            tokens: Token dicts as returned by a source client
+
+        Returns:
+            Hex digest identifying the payload
+        """
+        payload = orjson.dumps(tokens, option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
     def _upsert_token(self, token_data: Dict[str, Any]) -> Token:
         """Upsert token into database.
 
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
 from src.db.models import Token, SeedToken, Wallet, Trade
 from src.utils.meme_coin_detector import MemeCoinDetector
@@ -23,28 +23,32 @@ class WalletDiscovery:
         self.db = db
         self.meme_detector = MemeCoinDetector(db)
 
-    async def discover_from_seed_tokens(self, hours_back: int = 24) -> int:
+    async def discover_from_seed_tokens(
+        self, hours_back: int = 24, seed_tokens: Optional[List[SeedToken]] = None
+    ) -> int:
         """Discover wallets from recent seed tokens.
 
         Args:
             hours_back: How many hours back to look for seed tokens
+            seed_tokens: Seed tokens already loaded by the caller (skips the query)
 
         Returns:
             Number of wallets discovered
         """
         try:
-            since = datetime.utcnow() - timedelta(hours=hours_back)
-
-            # Get recent seed tokens
-            seed_tokens = (
-                self.db.query(SeedToken)
-                .filter(SeedToken.snapshot_ts >= since)
-                .order_by(SeedToken.rank_24h)
-                .limit(50)  # Top 50 trending tokens
-                .all()
-            )
+            if seed_tokens is None:
+                since = datetime.utcnow() - timedelta(hours=hours_back)
+
+                # Get recent seed tokens
+                seed_tokens = (
+                    self.db.query(SeedToken)
+                    .filter(SeedToken.snapshot_ts >= since)
+                    .order_by(SeedToken.rank_24h)
+                    .limit(50)  # Top 50 trending tokens
+                    .all()
+                )
 
-            logger.info(f"Found {len(seed_tokens)} seed tokens from last {hours_back}h")
+                logger.info(f"Found {len(seed_tokens)} seed tokens from last {hours_back}h")
 
             total_wallets = 0
 
@@ -112,9 +116,9 @@ class WalletDiscovery:
                     token_address, limit=limit
                 )
             else:
-                from src.clients.alchemy import AlchemyClient
+                from src.clients.alchemy import get_alchemy_client
 
-                client = AlchemyClient()
+                client = get_alchemy_client()
                 transactions = await client.get_token_transfers(
                     token_address, chain_id, limit=limit
                 )
@@ -128,9 +128,10 @@ class MempoolMonitor:
 
             if result["success"]:
                 # Store targets
-                self.paper_trader.positions[token_out]["take_profit_pct"] = 25.0
-                self.paper_trader.positions[token_out]["stop_loss_pct"] = -15.0
-                self.paper_trader.save_to_file()
+                self.paper_trader.update_position(
+                    token_out, take_profit_pct=25.0, stop_loss_pct=-15.0
+                )
+                self.paper_trader.persist()
 
                 logger.info(
                     f"⚡ MEMPOOL BUY EXECUTED (0-CONFIRMATION!)\n"
@@ -208,7 +209,7 @@ async def mempool_monitoring_job():
             return
 
         # Load paper trader
-        paper_trader = PaperTradingTracker.load_from_file() or PaperTradingTracker(db, starting_balance=1000.0)
+        paper_trader = PaperTradingTracker.load_from_db(db, starting_balance=1000.0)
 
         # Start mempool monitoring (runs indefinitely)
         monitor = MempoolMonitor(whale_addresses, paper_trader)
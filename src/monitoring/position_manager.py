@@ -4,6 +4,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import Dict, Any
 from src.analytics.paper_trading import PaperTradingTracker
+from src.config import settings
 from src.utils.price_fetcher import MultiSourcePriceFetcher
 
 logger = logging.getLogger(__name__)
@@ -29,14 +30,30 @@ class PositionManager:
         """
         positions_closed = 0
 
+        # Batch-price only positions not checked recently; the rest reuse their last price
+        stale = set(self.paper_trader.stale_positions(settings.position_recheck_seconds))
+        now = datetime.utcnow()
+        prices = await self.price_fetcher.get_token_prices(
+            [
+                (token_address, position.get("chain_id", "ethereum"))
+                for token_address, position in self.paper_trader.positions.items()
+                if token_address in stale
+            ]
+        )
+
         for token_address in list(self.paper_trader.positions.keys()):
             try:
                 position = self.paper_trader.positions[token_address]
 
                 # Get current price
-                current_price = await self.price_fetcher.get_token_price(
-                    token_address, position.get("chain_id", "ethereum")
-                )
+                if token_address in stale:
+                    current_price = prices.get(
+                        (token_address, position.get("chain_id", "ethereum")), 0.0
+                    )
+                    if current_price > 0:
+                        self.paper_trader.record_check(token_address, current_price, now)
+                else:
+                    current_price = position["last_price_usd"]
 
                 if current_price == 0:
                     logger.warning(f"Cannot get price for {token_address[:16]}..., skipping")
@@ -80,7 +97,7 @@ class PositionManager:
 
                     # Update peak if current is higher
                     if profit_pct > peak_profit:
-                        self.paper_trader.positions[token_address]["peak_profit_pct"] = profit_pct
+                        self.paper_trader.update_position(token_address, peak_profit_pct=profit_pct)
                         peak_profit = profit_pct
 
                     # If profit dropped 8% from peak, sell (lock in gains)
@@ -95,7 +112,6 @@ class PositionManager:
 
                     if result:
                         positions_closed += 1
-                        self.paper_trader.save_to_file()
 
                         emoji = "✅" if result["profit_loss"] > 0 else "❌"
                         logger.info(
@@ -111,4 +127,8 @@ class PositionManager:
                 logger.error(f"Error checking position {token_address[:16]}...: {str(e)}")
                 continue
 
+        # One write for the sells and the refreshed last-checked prices
+        if stale or positions_closed:
+            self.paper_trader.persist()
+
         return positions_closed
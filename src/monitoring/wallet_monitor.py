@@ -1,21 +1,76 @@
 """Real-time wallet monitoring for trade detection."""
 
+import asyncio
+import bisect
+import functools
 import logging
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, FrozenSet, NamedTuple, Optional, Tuple
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from src.db.models import Wallet, Trade, WalletStats30D, Alert, CustomWatchlistWallet
+from src.db.models import Wallet, Trade, WalletStats30D, Alert, CustomWatchlistWallet, Token
 from src.alerts.telegram import TelegramAlerter
 from src.alerts.confluence import ConfluenceDetector
 from src.analytics.paper_trading import PaperTradingTracker
+from src.clients.alchemy import AlchemyClient, get_alchemy_client
+from src.clients.solscan import SolscanClient
 from src.utils.price_fetcher import MultiSourcePriceFetcher
 from src.monitoring.position_manager import PositionManager
 from src.utils.meme_coin_detector import MemeCoinDetector
+from src.utils.redis_cache import cache_get_many, stats_key
 from src.config import settings
-import redis
+from redis.asyncio import Redis as AsyncRedis
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Preliminary score ladders: points[i] is awarded when a value exceeds cuts[i - 1]
+_PNL_CUTS = [10000, 50000, 100000]
+_PNL_PTS = [10, 20, 30, 40]  # 30D PnL component (40%)
+_MULTIPLE_CUTS = [3, 5, 10]
+_MULTIPLE_PTS = [5, 15, 20, 30]  # Best trade component (30%)
+_EARLYSCORE_CUTS = [40, 60, 80]
+_EARLYSCORE_PTS = [5, 10, 20, 30]  # EarlyScore component (30%)
+
+# Stablecoins & wrapped base tokens never traded (extended at runtime via DENYLIST_KEY)
+STABLECOINS_AND_WRAPPED = frozenset({
+    # Ethereum Mainnet
+    "0xdac17f958d2ee523a2206206994597c13d831ec7",  # USDT (ETH)
+    "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",  # USDC (ETH)
+    "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2",  # WETH (ETH)
+    "0x2260fac5e5542a774ae82da6db1b2159f876eff9",  # WBTC (ETH)
+    "0x6b175474e89094c44da98b954eedeac495271d0f",  # DAI (ETH)
+    # Base
+    "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913",  # USDC (Base)
+    "0x2260fac5e5542a773aa44fbcfedf7c193bc2c599",  # WBTC (Base)
+    "0x4200000000000000000000000000000000000006",  # WETH (Base)
+    # Arbitrum
+    "0xfd086bc7cd5c481dcc9c85ebe478a1c0b69fcbb9",  # USDT (Arbitrum)
+    "0xaf88d065e77c8cc2239327c5edb3a432268e5831",  # USDC (Arbitrum)
+    "0x2f2a2543b76a4166549f7aab2e75bef0aefc5b0f",  # WBTC (Arbitrum)
+    "0x82af49447d8a07e3bd95bd0d56f35241523fbab1",  # WETH (Arbitrum)
+})
+
+# Redis SET of extra token addresses to skip (e.g. `SADD denylist:tokens 0x...`)
+DENYLIST_KEY = "denylist:tokens"
+_DENYLIST_TTL_SECONDS = 300
+
+# Block explorer tx URL per chain (unknown chains fall back to Etherscan)
+_EXPLORER_TEMPLATES = {
+    "ethereum": "https://etherscan.io/tx/{}",
+    "base": "https://basescan.org/tx/{}",
+    "arbitrum": "https://arbiscan.io/tx/{}",
+    "solana": "https://solscan.io/tx/{}",
+}
+
+
+class WatchedWallet(NamedTuple):
+    """Address/chain pair for a monitored wallet (no ORM state)."""
+
+    address: str
+    chain_id: str
+
 
 class WalletMonitor:
     """Monitors watchlist wallets for new trades."""
@@ -29,24 +84,46 @@ class WalletMonitor:
         self.db = db
         self.telegram = TelegramAlerter()
         self.confluence = ConfluenceDetector()
-        self.redis_client = redis.Redis(
+        # Async client so cache I/O doesn't stall the event loop between API calls
+        self.redis_client = AsyncRedis(
             host=settings.redis_host,
             port=settings.redis_port,
             decode_responses=True,
         )
 
         # Load or create paper trader (OPPORTUNITY-DRIVEN)
-        self.paper_trader = PaperTradingTracker.load_from_file() or PaperTradingTracker(db, starting_balance=1000.0)
+        self.paper_trader = PaperTradingTracker.load_from_db(db, starting_balance=1000.0)
         self.price_fetcher = MultiSourcePriceFetcher()
         self.position_manager = PositionManager(self.paper_trader)
         self.meme_detector = MemeCoinDetector(db)
 
+        # Chain clients are built once so their HTTP connection pools are reused
+        self._solscan = SolscanClient()
+        try:
+            self._alchemy: Optional[AlchemyClient] = get_alchemy_client()
+        except ValueError as e:
+            logger.warning(f"EVM wallet monitoring disabled: {str(e)}")
+            self._alchemy = None
+
+        # Per-pass memo of Token rows (reset every monitoring cycle)
+        self._token_cache: Dict[str, Optional[Token]] = {}
+        # Per-pass prefetch of WalletStats30D rows keyed by wallet address
+        self._stats_cache: Dict[str, WalletStats30D] = {}
+
+        # Token denylist (built-in set + Redis additions), reloaded every few minutes
+        self._denylist: FrozenSet[str] = STABLECOINS_AND_WRAPPED
+        self._denylist_loaded_at = 0.0
+
     async def monitor_watchlist_wallets(self) -> int:
         """Monitor all watchlist wallets for new trades.
 
         Returns:
             Number of alerts sent
         """
+        # Token metadata can change between passes, so only memoize within one
+        self._token_cache = {}
+        self._stats_cache = {}
+
         try:
             # 🎯 STEP 1: Check open positions for take-profit/stop-loss
             positions_closed = await self.position_manager.check_and_exit_positions()
@@ -58,85 +135,85 @@ class WalletMonitor:
 
             logger.info(f"Monitoring {len(watchlist)} watchlist wallets")
 
+            # Prefetch cache + stats up front so the loop below does no lookups
+            enriched = await self._enrich_watchlist(watchlist)
+            await self._refresh_denylist()
+
             alerts_sent = 0
+            pending_paper_trades: List[Tuple[Dict[str, Any], int, str]] = []
+
+            # Trades to push through the confluence tracker in one batch
+            batch: List[Tuple[Dict[str, Any], str]] = []
 
-            for wallet in watchlist:
+            for wallet, last_seen_tx, last_head_tx in enriched:
                 try:
                     # Check for new trades
-                    new_trades = await self._check_wallet_for_new_trades(wallet)
+                    new_trades = await self._check_wallet_for_new_trades(
+                        wallet, last_seen_tx, last_head_tx
+                    )
 
                     for trade in new_trades:
                         side = trade.get("side", "buy")  # "buy" or "sell"
 
                         # 🚫 FILTER STABLECOINS & BASE TOKENS - CRITICAL FIX!
                         token_address = trade["token_address"].lower()
-                        STABLECOINS_AND_WRAPPED = {
-                            # Ethereum Mainnet
-                            "0xdac17f958d2ee523a2206206994597c13d831ec7",  # USDT (ETH)
-                            "0xa0b86991c6218b36c1d19d4a2e9eb0ce3606eb48",  # USDC (ETH)
-                            "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2",  # WETH (ETH)
-                            "0x2260fac5e5542a774ae82da6db1b2159f876eff9",  # WBTC (ETH)
-                            "0x6b175474e89094c44da98b954eedeac495271d0f",  # DAI (ETH)
-                            # Base
-                            "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913",  # USDC (Base)
-                            "0x2260fac5e5542a773aa44fbcfedf7c193bc2c599",  # WBTC (Base)
-                            "0x4200000000000000000000000000000000000006",  # WETH (Base)
-                            # Arbitrum
-                            "0xfd086bc7cd5c481dcc9c85ebe478a1c0b69fcbb9",  # USDT (Arbitrum)
-                            "0xaf88d065e77c8cc2239327c5edb3a432268e5831",  # USDC (Arbitrum)
-                            "0x2f2a2543b76a4166549f7aab2e75bef0aefc5b0f",  # WBTC (Arbitrum)
-                            "0x82af49447d8a07e3bd95bd0d56f35241523fbab1",  # WETH (Arbitrum)
-                        }
-
-                        if token_address in STABLECOINS_AND_WRAPPED:
+                        if token_address in self._denylist:
                             logger.info(f"⏭️  SKIPPING STABLECOIN/WRAPPED: {token_address[:16]}... (not a memecoin)")
                             continue
 
-                        # Record trade in confluence tracker
-                        self.confluence.record_trade(
-                            trade["token_address"],
-                            trade["chain_id"],
-                            wallet.address,
-                            side,
-                            {
-                                "price_usd": trade.get("price_usd", 0),
-                                "value_usd": trade.get("value_usd", 0),
-                                "tx_hash": trade.get("tx_hash"),
-                            }
-                        )
+                        batch.append((trade, side))
 
-                        # Check if this creates confluence (≥2 whales within 30 min)
-                        confluence_events = self.confluence.check_confluence(
-                            trade["token_address"],
-                            trade["chain_id"],
-                            side=side,
-                            min_wallets=2  # 2+ whales buying same token = signal
-                        )
+                except Exception as e:
+                    logger.error(f"Error monitoring wallet {wallet.address}: {str(e)}")
+                    continue
+
+            # Record all trades + check confluence (≥2 whales within 30 min) in one
+            # pipelined pass; each trade only sees trades recorded before it
+            confluence_results = self.confluence.process_batch(
+                [
+                    (
+                        trade["token_address"],
+                        trade["chain_id"],
+                        trade["wallet_address"],
+                        side,
+                        {
+                            "price_usd": trade.get("price_usd", 0),
+                            "value_usd": trade.get("value_usd", 0),
+                            "tx_hash": trade.get("tx_hash"),
+                        },
+                    )
+                    for trade, side in batch
+                ],
+                min_wallets=2,  # 2+ whales buying same token = signal
+            )
+
+            for (trade, side), confluence_events in zip(batch, confluence_results):
+                if not confluence_events:
+                    # DO NOT send single wallet alerts - user only wants confluence
+                    continue
 
-                        if confluence_events:
-                            # 🤖 EXECUTE PAPER TRADE ON CONFLUENCE (OPPORTUNITY-DRIVEN!)
-                            if side == "buy":
-                                await self._execute_paper_buy(trade, len(confluence_events))
-                            elif side == "sell":
-                                await self._execute_paper_sell(trade, len(confluence_events))
-
-                            # SEND CONFLUENCE ALERT (≥2 whales trading same token)
-                            await self._send_confluence_alert(
-                                trade, confluence_events, side=side
-                            )
-                            alerts_sent += 1
-                            action = "buying" if side == "buy" else "selling"
-                            logger.info(
-                                f"🚨 CONFLUENCE ALERT SENT: {len(confluence_events)} whales "
-                                f"{action} {trade['token_address'][:10]}..."
-                            )
-
-                        # DO NOT send single wallet alerts - user only wants confluence
+                try:
+                    # 🤖 QUEUE PAPER TRADE ON CONFLUENCE (priced in one batch below)
+                    if side in ("buy", "sell"):
+                        pending_paper_trades.append((trade, len(confluence_events), side))
+
+                    # SEND CONFLUENCE ALERT (≥2 whales trading same token)
+                    await self._send_confluence_alert(trade, confluence_events, side=side)
+                    alerts_sent += 1
+                    action = "buying" if side == "buy" else "selling"
+                    logger.info(
+                        f"🚨 CONFLUENCE ALERT SENT: {len(confluence_events)} whales "
+                        f"{action} {trade['token_address'][:10]}..."
+                    )
 
                 except Exception as e:
-                    logger.error(f"Error monitoring wallet {wallet.address}: {str(e)}")
+                    logger.error(f"Error handling confluence for {trade['token_address'][:10]}: {str(e)}")
                     continue
 
+            # 🤖 EXECUTE PAPER TRADES ON CONFLUENCE (OPPORTUNITY-DRIVEN!)
+            if pending_paper_trades:
+                await self._execute_pending_paper_trades(pending_paper_trades)
+
             logger.info(f"Monitoring complete: {alerts_sent} alerts sent")
             return alerts_sent
 
@@ -144,23 +221,28 @@ class WalletMonitor:
             logger.error(f"Wallet monitoring failed: {str(e)}")
             return 0
 
-    def _get_watchlist_wallets(self) -> List[Wallet]:
+    def _get_watchlist_wallets(self) -> List[WatchedWallet]:
         """Get PROFITABLE WHALES + USER CUSTOM WALLETS for strong signals!
 
+        Only address and chain_id are selected; full Wallet rows are never
+        materialized for monitoring.
+
         Returns:
             List of whale wallets (auto-discovered + custom)
         """
         try:
             # Get auto-discovered whales with $500+ PnL (QUALITY over quantity!)
-            profitable_whales = (
-                self.db.query(Wallet)
-                .join(WalletStats30D, Wallet.address == WalletStats30D.wallet_address)
-                .filter(
-                    WalletStats30D.unrealized_pnl_usd > 500,  # $500+ profit whales only
-                    WalletStats30D.trades_count >= 2,  # At least 2 trades
-                )
-                .all()
-            )
+            profitable_whales = [
+                WatchedWallet(address, chain_id)
+                for address, chain_id in self.db.execute(
+                    select(Wallet.address, Wallet.chain_id)
+                    .join(WalletStats30D, Wallet.address == WalletStats30D.wallet_address)
+                    .where(
+                        WalletStats30D.unrealized_pnl_usd > 500,  # $500+ profit whales only
+                        WalletStats30D.trades_count >= 2,  # At least 2 trades
+                    )
+                ).all()
+            ]
 
             # Get user's CUSTOM WATCHLIST wallets
             custom_wallet_addrs = (
@@ -169,75 +251,206 @@ class WalletMonitor:
                 .all()
             )
 
-            # Fetch full Wallet objects for custom wallets
+            # Make sure every custom wallet has a Wallet row (one lookup for all)
+            known_addrs = set()
+            if custom_wallet_addrs:
+                known_addrs = set(
+                    self.db.execute(
+                        select(Wallet.address).where(
+                            Wallet.address.in_([addr for addr, _ in custom_wallet_addrs])
+                        )
+                    ).scalars()
+                )
+
             custom_wallets = []
             for addr, chain in custom_wallet_addrs:
-                wallet = self.db.query(Wallet).filter(Wallet.address == addr, Wallet.chain_id == chain).first()
-
                 # If not in database yet, create it
-                if not wallet:
-                    wallet = Wallet(
-                        address=addr,
-                        chain_id=chain,
-                        first_seen_at=datetime.utcnow(),
+                if addr not in known_addrs:
+                    self.db.add(
+                        Wallet(
+                            address=addr,
+                            chain_id=chain,
+                            first_seen_at=datetime.utcnow(),
+                        )
                     )
-                    self.db.add(wallet)
-                    self.db.commit()
+                    known_addrs.add(addr)
                     logger.info(f"✨ Created wallet entry for custom watchlist: {addr[:16]}...")
 
-                custom_wallets.append(wallet)
+                custom_wallets.append(WatchedWallet(addr, chain))
+
+            if self.db.new:
+                self.db.commit()
 
-            # Combine both lists (remove duplicates)
-            all_wallets = profitable_whales + custom_wallets
-            unique_wallets = {w.address: w for w in all_wallets}.values()
+            # Combine both lists (remove duplicates, first occurrence wins)
+            seen_addrs = set()
+            unique_wallets = []
+            for wallet in profitable_whales:
+                if wallet.address not in seen_addrs:
+                    seen_addrs.add(wallet.address)
+                    unique_wallets.append(wallet)
+            for wallet in custom_wallets:
+                if wallet.address not in seen_addrs:
+                    seen_addrs.add(wallet.address)
+                    unique_wallets.append(wallet)
 
             logger.info(
                 f"🐋 MONITORING {len(profitable_whales)} AUTO-DISCOVERED WHALES + "
                 f"{len(custom_wallets)} CUSTOM WALLETS = {len(unique_wallets)} TOTAL"
             )
 
-            return list(unique_wallets)
+            return unique_wallets
 
         except Exception as e:
             logger.error(f"Error getting watchlist: {str(e)}")
             return []
 
+    async def _enrich_watchlist(
+        self, watchlist: List[WatchedWallet]
+    ) -> List[Tuple[WatchedWallet, Optional[str], Optional[str]]]:
+        """Prefetch last-seen tx hashes and 30D stats for the whole watchlist.
+
+        One Redis MGET for tx hashes, one for stats published by the rollup
+        job, and one IN query for stats misses replace cache reads per wallet
+        and a stats query per alert. Stats land in ``self._stats_cache``.
+
+        Args:
+            watchlist: Wallets to monitor this pass
+
+        Returns:
+            List of (wallet, last_seen_tx, last_head_tx) tuples
+        """
+        if not watchlist:
+            return []
+
+        addresses = [w.address for w in watchlist]
+
+        try:
+            cached = await self.redis_client.mget(
+                [f"wallet_monitor:last_trade:{addr}" for addr in addresses]
+                + [f"wallet_monitor:head:{addr}" for addr in addresses]
+            )
+            last_seen, last_head = cached[:len(addresses)], cached[len(addresses):]
+        except Exception as e:
+            logger.error(f"Error prefetching last seen trades: {str(e)}")
+            last_seen = last_head = [None] * len(watchlist)
+
+        # Stats published by the hourly rollup come from Redis; only misses hit SQL
+        cached_stats = await cache_get_many([stats_key(addr) for addr in addresses])
+        self._stats_cache = {}
+        for addr, stats in zip(addresses, cached_stats):
+            if stats is None:
+                continue
+            try:
+                self._stats_cache[addr] = WalletStats30D(
+                    **dict(stats, last_update=datetime.fromisoformat(stats["last_update"]))
+                )
+            except Exception as e:
+                # Stale or malformed entry (e.g. fields changed between deploys): use SQL
+                logger.warning(f"Ignoring cached stats for {addr[:16]}...: {str(e)}")
+        misses = [addr for addr in addresses if addr not in self._stats_cache]
+
+        try:
+            if misses:
+                stats_rows = (
+                    self.db.query(WalletStats30D)
+                    .filter(WalletStats30D.wallet_address.in_(misses))
+                    .all()
+                )
+                self._stats_cache.update({row.wallet_address: row for row in stats_rows})
+        except Exception as e:
+            logger.error(f"Error prefetching wallet stats: {str(e)}")
+
+        return list(zip(watchlist, last_seen, last_head))
+
+    async def _refresh_denylist(self) -> None:
+        """Reload the token denylist from Redis if the cached copy has expired.
+
+        Operators can skip new stablecoins/wrapped tokens without a redeploy by
+        adding lowercase addresses to the ``denylist:tokens`` Redis set.
+        """
+        now = time.monotonic()
+        if now - self._denylist_loaded_at < _DENYLIST_TTL_SECONDS:
+            return
+
+        try:
+            extra = await self.redis_client.smembers(DENYLIST_KEY)
+            self._denylist = STABLECOINS_AND_WRAPPED | {addr.lower() for addr in extra}
+            self._denylist_loaded_at = now
+        except Exception as e:
+            logger.error(f"Error loading token denylist: {str(e)}")
+
+    def _get_wallet_stats(self, wallet_address: str) -> Optional[WalletStats30D]:
+        """Get 30D stats for a wallet, preferring the per-pass prefetch.
+
+        Args:
+            wallet_address: Wallet address
+
+        Returns:
+            WalletStats30D row or None
+        """
+        stats = self._stats_cache.get(wallet_address)
+        if stats is None:
+            # Confluence events can reference wallets recorded in earlier passes
+            stats = (
+                self.db.query(WalletStats30D)
+                .filter(WalletStats30D.wallet_address == wallet_address)
+                .first()
+            )
+            if stats is not None:
+                self._stats_cache[wallet_address] = stats
+        return stats
+
     async def _check_wallet_for_new_trades(
-        self, wallet: Wallet, minutes_back: int = 5
+        self,
+        wallet: WatchedWallet,
+        last_seen_tx: Optional[str] = None,
+        last_head_tx: Optional[str] = None,
+        minutes_back: int = 5,
     ) -> List[Dict[str, Any]]:
         """Check if wallet has made new trades.
 
         Args:
             wallet: Wallet to check
+            last_seen_tx: Last seen tx hash (prefetched from Redis)
+            last_head_tx: Latest raw transfer hash seen last pass (prefetched from Redis)
             minutes_back: How many minutes back to check
 
         Returns:
             List of new trade data
         """
         try:
-            # Check Redis cache for last seen trade
             cache_key = f"wallet_monitor:last_trade:{wallet.address}"
-            last_seen_tx = self.redis_client.get(cache_key)
 
-            # Get recent trades from chain (1000 txs = ~24-48h of whale activity)
+            # Get recent trades from chain
             if wallet.chain_id == "solana":
-                from src.clients.solscan import SolscanClient
-
-                client = SolscanClient()
-                recent_txs = await client.get_wallet_transactions(
+                recent_txs = await self._solscan.get_wallet_transactions(
                     wallet.address, limit=1000
                 )
 
                 # Log that we're tracking this Solana whale
                 logger.info(f"📍 Tracking Solana whale: {wallet.address[:16]}... via Solscan")
             else:
-                from src.clients.alchemy import AlchemyClient
-
-                client = AlchemyClient()
-                recent_txs = await client.get_wallet_transactions(
-                    wallet.address, wallet.chain_id, limit=1000
+                if self._alchemy is None:
+                    return []
+
+                # Cheap head probe: skip the full 1000-tx fetch if nothing moved
+                head_tx = await self._alchemy.get_latest_tx_hash(wallet.address, wallet.chain_id)
+                if head_tx and head_tx == last_head_tx:
+                    return []
+
+                # Full default lookback: DEX pools are only recognisable across many
+                # transfers, and the last_seen_tx break below trims what was already
+                # seen. A failed fetch raises, so the head is only saved once its
+                # trades were seen
+                recent_txs = await self._alchemy.get_wallet_transactions(
+                    wallet.address, wallet.chain_id, limit=1000, raise_errors=True
                 )
 
+                if head_tx:
+                    await self.redis_client.setex(
+                        f"wallet_monitor:head:{wallet.address}", 3600, head_tx
+                    )
+
             new_trades = []
 
             for tx in recent_txs:
@@ -268,7 +481,7 @@ class WalletMonitor:
             # Update cache with latest tx
             if recent_txs:
                 latest_tx = recent_txs[0].get("tx_hash")
-                self.redis_client.setex(cache_key, 3600, latest_tx)  # 1 hour TTL
+                await self.redis_client.setex(cache_key, 3600, latest_tx)  # 1 hour TTL
 
             return new_trades
 
@@ -276,8 +489,25 @@ class WalletMonitor:
             logger.error(f"Error checking wallet for new trades: {str(e)}")
             return []
 
+    def _get_token(self, token_address: str) -> Optional[Token]:
+        """Get token metadata, memoized for the current monitoring pass.
+
+        Args:
+            token_address: Token address
+
+        Returns:
+            Token row or None if unknown
+        """
+        if token_address not in self._token_cache:
+            self._token_cache[token_address] = (
+                self.db.query(Token)
+                .filter(Token.token_address == token_address)
+                .first()
+            )
+        return self._token_cache[token_address]
+
     async def _send_single_alert(
-        self, trade: Dict[str, Any], wallet: Wallet
+        self, trade: Dict[str, Any], wallet: WatchedWallet
     ) -> None:
         """Send alert for single wallet buy.
 
@@ -287,26 +517,13 @@ class WalletMonitor:
         """
         try:
             # Get wallet stats
-            stats = (
-                self.db.query(WalletStats30D)
-                .filter(
-                    WalletStats30D.wallet_address == wallet.address,
-                    WalletStats30D.chain_id == wallet.chain_id,
-                )
-                .first()
-            )
+            stats = self._get_wallet_stats(wallet.address)
 
             # Calculate preliminary score
             prelim_score = self._calculate_preliminary_score(trade, stats)
 
             # Get token data
-            from src.db.models import Token
-
-            token = (
-                self.db.query(Token)
-                .filter(Token.token_address == trade["token_address"])
-                .first()
-            )
+            token = self._get_token(trade["token_address"])
 
             # Build alert message
             # Send via Telegram (DISABLED - user requested to stop)
@@ -330,8 +547,8 @@ class WalletMonitor:
                 type="single",
                 token_address=trade["token_address"],
                 chain_id=trade["chain_id"],
-                wallets_json=f'["{wallet.address}"]',
-                payload_json=str(trade),
+                wallets_json=orjson.dumps([wallet.address]).decode(),
+                payload_json=orjson.dumps(trade, default=str).decode(),
             )
             self.db.add(alert)
             self.db.commit()
@@ -343,19 +560,50 @@ class WalletMonitor:
         except Exception as e:
             logger.error(f"Error sending single alert: {str(e)}")
 
-    async def _execute_paper_buy(self, trade: Dict[str, Any], num_whales: int) -> None:
+    async def _execute_pending_paper_trades(
+        self, pending: List[Tuple[Dict[str, Any], int, str]]
+    ) -> None:
+        """Price all confluence tokens in one batch, then execute paper trades in order.
+
+        Args:
+            pending: (trade, num_whales, side) tuples collected during the pass
+        """
+        try:
+            # Sells only need a price if we actually hold the token
+            tokens_to_price = [
+                (trade["token_address"], trade["chain_id"])
+                for trade, _, side in pending
+                if side == "buy" or trade["token_address"] in self.paper_trader.positions
+            ]
+            prices = await self.price_fetcher.get_token_prices(tokens_to_price)
+        except Exception as e:
+            logger.error(f"Error batch-fetching confluence prices: {str(e)}")
+            prices = {}
+
+        for trade, num_whales, side in pending:
+            price = prices.get((trade["token_address"], trade["chain_id"]))
+            if side == "buy":
+                await self._execute_paper_buy(trade, num_whales, price)
+            else:
+                await self._execute_paper_sell(trade, num_whales, price)
+
+    async def _execute_paper_buy(
+        self, trade: Dict[str, Any], num_whales: int, price: Optional[float] = None
+    ) -> None:
         """Execute paper buy on confluence detection (OPPORTUNITY-DRIVEN).
 
         Args:
             trade: Trade data
             num_whales: Number of whales in confluence
+            price: Prefetched current price (fetched here if None)
         """
         try:
             token_address = trade["token_address"]
             chain_id = trade["chain_id"]
 
             # 🎯 MEME COIN FILTER - ONLY trade meme coins!
-            is_meme = self.meme_detector.is_meme_coin(
+            meme_check = functools.partial(
+                self.meme_detector.is_meme_coin,
                 token_address,
                 chain_id,
                 price_usd=trade.get("price_usd"),
@@ -363,6 +611,15 @@ class WalletMonitor:
                 liquidity=None,   # Will fetch from DB
             )
 
+            if price is None:
+                # Overlap the DB-bound meme check with the HTTP-bound price fetch
+                is_meme, current_price = await asyncio.gather(
+                    asyncio.to_thread(meme_check),
+                    self.price_fetcher.get_token_price(token_address, chain_id),
+                )
+            else:
+                is_meme, current_price = meme_check(), price
+
             if not is_meme:
                 logger.info(f"❌ SKIPPING NON-MEME TOKEN: {token_address[:16]}... (not a meme coin)")
                 return
@@ -379,8 +636,6 @@ class WalletMonitor:
                 logger.debug(f"Already have position in {token_address[:16]}..., skipping paper buy")
                 return
 
-            # Get current price
-            current_price = await self.price_fetcher.get_token_price(token_address, chain_id)
             if current_price == 0:
                 logger.warning(f"Cannot get price for {token_address[:16]}..., skipping paper buy")
                 return
@@ -418,9 +673,10 @@ class WalletMonitor:
 
             if result["success"]:
                 # Store take profit / stop loss targets in position
-                self.paper_trader.positions[token_address]["take_profit_pct"] = take_profit
-                self.paper_trader.positions[token_address]["stop_loss_pct"] = stop_loss
-                self.paper_trader.save_to_file()
+                self.paper_trader.update_position(
+                    token_address, take_profit_pct=take_profit, stop_loss_pct=stop_loss
+                )
+                self.paper_trader.persist()
 
                 logger.info(
                     f"💰 PAPER BUY EXECUTED\n"
@@ -435,12 +691,15 @@ class WalletMonitor:
         except Exception as e:
             logger.error(f"Error executing paper buy: {str(e)}")
 
-    async def _execute_paper_sell(self, trade: Dict[str, Any], num_whales: int) -> None:
+    async def _execute_paper_sell(
+        self, trade: Dict[str, Any], num_whales: int, price: Optional[float] = None
+    ) -> None:
         """Execute paper sell on whale exit confluence (OPPORTUNITY-DRIVEN).
 
         Args:
             trade: Trade data
             num_whales: Number of whales selling
+            price: Prefetched current price (fetched here if None)
         """
         try:
             token_address = trade["token_address"]
@@ -450,9 +709,11 @@ class WalletMonitor:
                 return
 
             # Get current price
-            current_price = await self.price_fetcher.get_token_price(
-                token_address, trade["chain_id"]
-            )
+            current_price = price
+            if current_price is None:
+                current_price = await self.price_fetcher.get_token_price(
+                    token_address, trade["chain_id"]
+                )
             if current_price == 0:
                 logger.warning(f"Cannot get price for {token_address[:16]}..., skipping paper sell")
                 return
@@ -463,7 +724,7 @@ class WalletMonitor:
             )
 
             if result:
-                self.paper_trader.save_to_file()
+                self.paper_trader.persist()
                 emoji = "✅" if result["profit_loss"] > 0 else "❌"
                 logger.info(
                     f"{emoji} PAPER SELL EXECUTED\n"
@@ -488,13 +749,7 @@ class WalletMonitor:
         """
         try:
             # Get token data
-            from src.db.models import Token
-
-            token = (
-                self.db.query(Token)
-                .filter(Token.token_address == trade["token_address"])
-                .first()
-            )
+            token = self._get_token(trade["token_address"])
 
             # Extract wallet addresses and trade details from events
             wallet_addrs = [event.get("wallet") for event in confluence_events]
@@ -503,11 +758,7 @@ class WalletMonitor:
             wallet_stats_list = []
             for event in confluence_events:
                 wallet_addr = event.get("wallet")
-                stats = (
-                    self.db.query(WalletStats30D)
-                    .filter(WalletStats30D.wallet_address == wallet_addr)
-                    .first()
-                )
+                stats = self._get_wallet_stats(wallet_addr)
 
                 # Get trade details from event metadata
                 trade_metadata = event.get("metadata", {})
@@ -544,20 +795,18 @@ class WalletMonitor:
             # await self.telegram.send_confluence_alert(alert_data)
 
             # Log alert with full trade details
-            import json
-
             alert = Alert(
                 ts=datetime.utcnow(),
                 type="confluence",
                 token_address=trade["token_address"],
                 chain_id=trade["chain_id"],
-                wallets_json=json.dumps(wallet_addrs),
-                payload_json=json.dumps({
+                wallets_json=orjson.dumps(wallet_addrs).decode(),
+                payload_json=orjson.dumps({
                     "wallet_details": wallet_stats_list,
                     "side": side,
                     "token_symbol": token.symbol if token else "Unknown",
                     "token_price": trade.get("price_usd", 0),
-                }),
+                }, default=str).decode(),
             )
             self.db.add(alert)
             self.db.commit()
@@ -584,37 +833,14 @@ class WalletMonitor:
         if not stats:
             return 0.0
 
-        score = 0.0
-
-        # 30D PnL component (40%)
-        if stats.realized_pnl_usd > 100000:
-            score += 40
-        elif stats.realized_pnl_usd > 50000:
-            score += 30
-        elif stats.realized_pnl_usd > 10000:
-            score += 20
-        else:
-            score += 10
-
-        # Best trade component (30%)
-        if stats.best_trade_multiple and stats.best_trade_multiple > 10:
-            score += 30
-        elif stats.best_trade_multiple and stats.best_trade_multiple > 5:
-            score += 20
-        elif stats.best_trade_multiple and stats.best_trade_multiple > 3:
-            score += 15
-        else:
-            score += 5
-
-        # EarlyScore component (30%)
-        if stats.earlyscore_median and stats.earlyscore_median > 80:
-            score += 30
-        elif stats.earlyscore_median and stats.earlyscore_median > 60:
-            score += 20
-        elif stats.earlyscore_median and stats.earlyscore_median > 40:
-            score += 10
-        else:
-            score += 5
+        # bisect_left keeps the strict ">" semantics of each threshold
+        score = float(_PNL_PTS[bisect.bisect_left(_PNL_CUTS, stats.realized_pnl_usd)])
+        score += _MULTIPLE_PTS[
+            bisect.bisect_left(_MULTIPLE_CUTS, stats.best_trade_multiple or 0)
+        ]
+        score += _EARLYSCORE_PTS[
+            bisect.bisect_left(_EARLYSCORE_CUTS, stats.earlyscore_median or 0)
+        ]
 
         return score
 
@@ -628,11 +854,4 @@ class WalletMonitor:
         Returns:
             Explorer URL
         """
-        explorers = {
-            "ethereum": f"https://etherscan.io/tx/{tx_hash}",
-            "base": f"https://basescan.org/tx/{tx_hash}",
-            "arbitrum": f"https://arbiscan.io/tx/{tx_hash}",
-            "solana": f"https://solscan.io/tx/{tx_hash}",
-        }
-
-        return explorers.get(chain_id, f"https://etherscan.io/tx/{tx_hash}")
+        return _EXPLORER_TEMPLATES.get(chain_id, _EXPLORER_TEMPLATES["ethereum"]).format(tx_hash)
@@ -1,5 +1,5 @@
 """Job scheduler for periodic tasks."""
 
-from src.scheduler.jobs import setup_scheduler
+from src.scheduler.jobs import run_forever
 
-__all__ = ["setup_scheduler"]
+__all__ = ["run_forever"]
@@ -1,8 +1,13 @@
 """Autonomous paper trader that executes trades based on confluence signals."""
 
+import asyncio
 import logging
+from itertools import islice
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+import numpy as np
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.orm import Session
 
 from src.analytics.paper_trading import PaperTradingTracker
@@ -13,6 +18,42 @@ from src.db.models import Trade, WalletStats30D
 
 logger = logging.getLogger(__name__)
 
+# Smallest paper buy worth placing; below this the confluence scan is skipped entirely
+MIN_TRADE_USD = 10.0
+
+# Closed-trade outcomes kept for the rolling win rate used by rule adjustment
+OUTCOME_WINDOW = 200
+
+# Naive-UTC epoch (positions store naive datetime.utcnow() timestamps)
+_EPOCH = datetime(1970, 1, 1)
+
+# Whale wallets worth following. Used as an IN-subquery so trades are pruned to
+# whales before grouping instead of joining every recent trade to the stats table.
+WHALE_WALLETS_STMT = select(WalletStats30D.wallet_address).where(
+    WalletStats30D.unrealized_pnl_usd >= bindparam("min_pnl")
+)
+
+# Tokens bought by at least min_whales whales since `since`; built once, executed with params each cycle
+CONFLUENCE_STMT = (
+    select(
+        Trade.token_address,
+        Trade.chain_id,
+        func.count(func.distinct(Trade.wallet_address)).label("whale_count"),
+        func.avg(Trade.price_usd).label("avg_price"),
+        func.max(Trade.ts).label("last_trade_time"),
+    )
+    .where(
+        Trade.wallet_address.in_(WHALE_WALLETS_STMT),
+        Trade.ts >= bindparam("since"),
+        Trade.side == "buy",
+    )
+    .group_by(Trade.token_address, Trade.chain_id)
+    .having(func.count(func.distinct(Trade.wallet_address)) >= bindparam("min_whales"))
+)
+
+# Reopen the trader's DB session every N cycles (12 × 5 min ≈ hourly) to avoid stale connections
+SESSION_REFRESH_CYCLES = 12
+
 
 class AutonomousPaperTrader:
     """Autonomous trader that learns from confluence signals and manages paper trades."""
@@ -24,7 +65,7 @@ class AutonomousPaperTrader:
             starting_balance: Starting paper trading balance
         """
         self.db = SessionLocal()
-        self.paper_trader = PaperTradingTracker(self.db, starting_balance)
+        self.paper_trader = PaperTradingTracker.load_from_db(self.db, starting_balance)
         self.performance_tracker = PerformanceTracker(self.db)
         self.price_fetcher = MultiSourcePriceFetcher()
 
@@ -38,11 +79,26 @@ class AutonomousPaperTrader:
             "min_whale_pnl": 500.0,  # Only follow whales with >$500 PnL
         }
 
+        # Circular buffer of recent trade outcomes (1 = win, 0 = loss)
+        self._outcomes = np.zeros(OUTCOME_WINDOW, dtype=np.int8)
+        self._outcome_idx = 0
+
         logger.info(
             f"🤖 Autonomous Paper Trader initialized with ${starting_balance:,.2f}\n"
             f"   Rules: {self.rules}"
         )
 
+    def refresh_session(self) -> None:
+        """Replace the DB session shared by the trader and its trackers."""
+        try:
+            self.db.close()
+        except Exception as e:
+            logger.warning(f"Error closing trader session: {str(e)}")
+
+        self.db = SessionLocal()
+        self.paper_trader.db = self.db
+        self.performance_tracker.db = self.db
+
     async def check_for_confluence_buys(self) -> int:
         """Check for confluence signals and execute paper buys.
 
@@ -51,32 +107,33 @@ class AutonomousPaperTrader:
         """
         buys_executed = 0
 
+        # Nothing to do if the balance can't fund a meaningful buy (skip SQL + price fetches)
+        if self.paper_trader.current_balance * self.rules["buy_amount_pct"] < MIN_TRADE_USD:
+            logger.debug(
+                f"Balance ${self.paper_trader.current_balance:,.2f} too low to buy, skipping confluence scan"
+            )
+            return buys_executed
+
         # Get recent trades from TOP whales
         since = datetime.utcnow() - timedelta(minutes=30)
 
-        # Find tokens where ≥2 whales bought within last 30 minutes
-        from sqlalchemy import func
+        # Find tokens where ≥2 whales bought within last 30 minutes (query runs off the event loop)
+        params = {
+            "since": since,
+            "min_pnl": self.rules["min_whale_pnl"],
+            "min_whales": self.rules["min_whales_for_buy"],
+        }
+        confluence_tokens = await asyncio.to_thread(
+            lambda: self.db.execute(CONFLUENCE_STMT, params).all()
+        )
 
-        confluence_tokens = (
-            self.db.query(
-                Trade.token_address,
-                Trade.chain_id,
-                func.count(func.distinct(Trade.wallet_address)).label("whale_count"),
-                func.avg(Trade.price_usd).label("avg_price"),
-                func.max(Trade.ts).label("last_trade_time"),
-            )
-            .join(
-                WalletStats30D,
-                Trade.wallet_address == WalletStats30D.wallet_address,
-            )
-            .filter(
-                Trade.ts >= since,
-                Trade.side == "buy",
-                WalletStats30D.unrealized_pnl_usd >= self.rules["min_whale_pnl"],
-            )
-            .group_by(Trade.token_address, Trade.chain_id)
-            .having(func.count(func.distinct(Trade.wallet_address)) >= self.rules["min_whales_for_buy"])
-            .all()
+        # Price every candidate we don't already hold in one batched request
+        prices = await self.price_fetcher.get_token_prices(
+            [
+                (token_address, chain_id)
+                for token_address, chain_id, *_ in confluence_tokens
+                if token_address not in self.paper_trader.positions
+            ]
         )
 
         for token_address, chain_id, whale_count, avg_price, last_trade_time in confluence_tokens:
@@ -86,13 +143,15 @@ class AutonomousPaperTrader:
                 continue
 
             # Get current price
-            current_price = await self.price_fetcher.get_token_price(token_address, chain_id)
+            current_price = prices.get((token_address, chain_id), 0.0)
             if current_price == 0:
                 logger.warning(f"Cannot get price for {token_address[:16]}..., skipping")
                 continue
 
             # Calculate buy amount (20% of current balance)
             buy_amount = self.paper_trader.current_balance * self.rules["buy_amount_pct"]
+            if buy_amount < MIN_TRADE_USD:
+                break
 
             # Execute paper buy
             result = self.paper_trader.execute_buy(
@@ -142,98 +201,123 @@ class AutonomousPaperTrader:
         """
         sells_executed = 0
 
-        for token_address in list(self.paper_trader.positions.keys()):
-            position = self.paper_trader.positions[token_address]
-
-            # Get current price
-            current_price = await self.price_fetcher.get_token_price(
-                token_address, position["chain_id"]
-            )
-
-            if current_price == 0:
-                logger.warning(f"Cannot get price for {token_address[:16]}..., skipping")
-                continue
-
-            # Calculate current P/L
-            current_value = position["qty"] * current_price
-            profit_loss = current_value - position["cost_basis"]
-            profit_pct = (profit_loss / position["cost_basis"]) * 100
-
-            # Calculate hold time
-            hold_time_hours = (datetime.utcnow() - position["bought_at"]).total_seconds() / 3600
-
-            # Sell decision logic
-            sell_reason = None
+        # Snapshot positions
+        positions = list(self.paper_trader.positions.items())
+        if not positions:
+            return sells_executed
 
-            if profit_pct >= self.rules["take_profit_pct"]:
-                sell_reason = f"TAKE PROFIT (+{profit_pct:.1f}%)"
+        # One clock read per cycle drives both the whale-sell window and hold times
+        now = datetime.utcnow()
+        now_ts = (now - _EPOCH).total_seconds()
+        since = now - timedelta(minutes=30)
 
-            elif profit_pct <= self.rules["stop_loss_pct"]:
-                sell_reason = f"STOP LOSS ({profit_pct:.1f}%)"
+        # Count distinct whale sellers per held token in one GROUP BY
+        whale_sells_query = (
+            self.db.query(Trade.token_address, func.count(func.distinct(Trade.wallet_address)))
+            .filter(
+                Trade.wallet_address.in_(WHALE_WALLETS_STMT),
+                Trade.token_address.in_([token_address for token_address, _ in positions]),
+                Trade.side == "sell",
+                Trade.ts >= since,
+            )
+            .group_by(Trade.token_address)
+            .params(min_pnl=self.rules["min_whale_pnl"])
+        )
 
-            elif hold_time_hours >= self.rules["max_hold_hours"]:
-                sell_reason = f"MAX HOLD TIME ({hold_time_hours:.1f}h)"
+        # Batched price request and the whale-sell query (in a worker thread) overlap
+        prices, whale_sell_rows = await asyncio.gather(
+            self.price_fetcher.get_token_prices(
+                [(token_address, position["chain_id"]) for token_address, position in positions]
+            ),
+            asyncio.to_thread(whale_sells_query.all),
+        )
+        whale_sells_by_token: Dict[str, int] = dict(whale_sell_rows)
+
+        # Struct-of-arrays snapshot so P/L, hold time and sell rules evaluate vectorized
+        n = len(positions)
+        qty = np.fromiter((p["qty"] for _, p in positions), dtype=np.float64, count=n)
+        cost_basis = np.fromiter((p["cost_basis"] for _, p in positions), dtype=np.float64, count=n)
+        bought_at_ts = np.fromiter(
+            ((p["bought_at"] - _EPOCH).total_seconds() for _, p in positions),
+            dtype=np.float64,
+            count=n,
+        )
+        prices_arr = np.fromiter(
+            (prices.get((t, p["chain_id"]), 0.0) for t, p in positions), dtype=np.float64, count=n
+        )
+        whale_sells_arr = np.fromiter(
+            (whale_sells_by_token.get(t, 0) for t, _ in positions), dtype=np.int64, count=n
+        )
 
-            # Check if whales are selling (exit signal)
-            since = datetime.utcnow() - timedelta(minutes=30)
-            whale_sells = (
-                self.db.query(func.count(func.distinct(Trade.wallet_address)))
-                .join(
-                    WalletStats30D,
-                    Trade.wallet_address == WalletStats30D.wallet_address,
-                )
-                .filter(
-                    Trade.token_address == token_address,
-                    Trade.side == "sell",
-                    Trade.ts >= since,
-                    WalletStats30D.unrealized_pnl_usd >= self.rules["min_whale_pnl"],
-                )
-                .scalar()
+        priced = prices_arr > 0
+        for i in np.flatnonzero(~priced):
+            logger.warning(f"Cannot get price for {positions[i][0][:16]}..., skipping")
+
+        # Calculate current P/L and hold time for every position at once
+        with np.errstate(divide="ignore", invalid="ignore"):
+            profit_pct = (qty * prices_arr - cost_basis) / cost_basis * 100
+        hold_time_hours = (now_ts - bought_at_ts) / 3600
+
+        # Sell decision logic
+        take_profit = profit_pct >= self.rules["take_profit_pct"]
+        stop_loss = profit_pct <= self.rules["stop_loss_pct"]
+        max_hold = hold_time_hours >= self.rules["max_hold_hours"]
+        whale_exit = whale_sells_arr >= 2  # Whales are selling (exit signal)
+        to_sell = priced & (take_profit | stop_loss | max_hold | whale_exit)
+
+        for i in np.flatnonzero(to_sell):
+            token_address = positions[i][0]
+            current_price = float(prices_arr[i])
+
+            if whale_exit[i]:
+                sell_reason = f"WHALE EXIT ({whale_sells_arr[i]} whales selling)"
+            elif take_profit[i]:
+                sell_reason = f"TAKE PROFIT (+{profit_pct[i]:.1f}%)"
+            elif stop_loss[i]:
+                sell_reason = f"STOP LOSS ({profit_pct[i]:.1f}%)"
+            else:
+                sell_reason = f"MAX HOLD TIME ({hold_time_hours[i]:.1f}h)"
+
+            # Execute sell
+            result = self.paper_trader.execute_sell(
+                token_address, current_price, sell_reason
             )
 
-            if whale_sells >= 2:
-                sell_reason = f"WHALE EXIT ({whale_sells} whales selling)"
+            if result:
+                sells_executed += 1
+                self._record_outcome(result["profit_loss"] > 0)
+
+                # REWARD/PUNISHMENT based on outcome
+                if result["profit_loss"] > 0:
+                    # Calculate reward based on profit %
+                    if result["profit_pct"] >= 50:
+                        reward = 100  # BIG win
+                    elif result["profit_pct"] >= 20:
+                        reward = 50  # Good win
+                    else:
+                        reward = 25  # Small win
 
-            # Execute sell if we have a reason
-            if sell_reason:
-                result = self.paper_trader.execute_sell(
-                    token_address, current_price, sell_reason
-                )
+                    self.performance_tracker.score += reward
+                    self.performance_tracker.total_rewards += reward
 
-                if result:
-                    sells_executed += 1
-
-                    # REWARD/PUNISHMENT based on outcome
-                    if result["profit_loss"] > 0:
-                        # Calculate reward based on profit %
-                        if result["profit_pct"] >= 50:
-                            reward = 100  # BIG win
-                        elif result["profit_pct"] >= 20:
-                            reward = 50  # Good win
-                        else:
-                            reward = 25  # Small win
-
-                        self.performance_tracker.score += reward
-                        self.performance_tracker.total_rewards += reward
-
-                        logger.info(
-                            f"💰 PROFITABLE SELL (+{result['profit_pct']:.1f}%)\n"
-                            f"   Token: {token_address[:16]}...\n"
-                            f"   Profit: ${result['profit_loss']:.2f}\n"
-                            f"   Reward: +{reward} pts"
-                        )
-                    else:
-                        # PUNISHMENT for losing trade
-                        punishment = -abs(int(result["profit_pct"]))  # -10% = -10 pts
-                        self.performance_tracker.score += punishment
-                        self.performance_tracker.total_punishments += abs(punishment)
-
-                        logger.warning(
-                            f"📉 LOSING SELL ({result['profit_pct']:.1f}%)\n"
-                            f"   Token: {token_address[:16]}...\n"
-                            f"   Loss: ${result['profit_loss']:.2f}\n"
-                            f"   Punishment: {punishment} pts"
-                        )
+                    logger.info(
+                        f"💰 PROFITABLE SELL (+{result['profit_pct']:.1f}%)\n"
+                        f"   Token: {token_address[:16]}...\n"
+                        f"   Profit: ${result['profit_loss']:.2f}\n"
+                        f"   Reward: +{reward} pts"
+                    )
+                else:
+                    # PUNISHMENT for losing trade
+                    punishment = -abs(int(result["profit_pct"]))  # -10% = -10 pts
+                    self.performance_tracker.score += punishment
+                    self.performance_tracker.total_punishments += abs(punishment)
+
+                    logger.warning(
+                        f"📉 LOSING SELL ({result['profit_pct']:.1f}%)\n"
+                        f"   Token: {token_address[:16]}...\n"
+                        f"   Loss: ${result['profit_loss']:.2f}\n"
+                        f"   Punishment: {punishment} pts"
+                    )
 
         return sells_executed
 
@@ -267,7 +351,7 @@ class AutonomousPaperTrader:
         )
 
         # Save state
-        self.paper_trader.save_to_file()
+        self.paper_trader.persist()
 
         return {
             "buys": buys,
@@ -277,18 +361,28 @@ class AutonomousPaperTrader:
             "score": self.performance_tracker.score,
         }
 
+    def _record_outcome(self, won: bool) -> None:
+        """Record a closed trade in the rolling outcome window.
+
+        Args:
+            won: Whether the trade closed in profit
+        """
+        self._outcomes[self._outcome_idx % OUTCOME_WINDOW] = 1 if won else 0
+        self._outcome_idx += 1
+
     def adjust_rules_based_on_performance(self):
         """Dynamically adjust trading rules based on performance.
 
         LEARNING: If winning → take more risk
                   If losing → be more conservative
         """
-        total_trades = len(self.paper_trader.closed_trades)
+        total_trades = min(self._outcome_idx, OUTCOME_WINDOW)
 
         if total_trades < 5:
             return  # Not enough data yet
 
-        win_rate = self.paper_trader.win_count / total_trades
+        # Rolling win rate over the last OUTCOME_WINDOW trades
+        win_rate = float(self._outcomes[:total_trades].mean())
 
         # ADJUST RULES BASED ON WIN RATE
         if win_rate >= 0.7:
@@ -324,6 +418,12 @@ class AutonomousPaperTrader:
         """
         paper_report = self.paper_trader.get_performance_report()
 
+        log = self.performance_tracker.performance_log
+        events = "\n".join(
+            f"   {event['type']}: {event.get('reward', event.get('punishment', 0))} pts"
+            for event in islice(log, max(len(log) - 10, 0), None)
+        )
+
         score_section = f"""
 ╔══════════════════════════════════════════════════════════════╗
 ║          SELF-SCORING PERFORMANCE                            ║
@@ -335,17 +435,27 @@ class AutonomousPaperTrader:
 ❌ Total Punishments: -{self.performance_tracker.total_punishments} pts
 
 📊 EVENT LOG (Last 10):
+{events}
 """
-        for event in self.performance_tracker.performance_log[-10:]:
-            score_section += f"   {event['type']}: {event.get('reward', event.get('punishment', 0))} pts\n"
-
         return paper_report + "\n" + score_section
 
 
+# Long-lived trader reused across scheduler ticks (keeps HTTP clients, rules and state warm)
+_TRADER: Optional[AutonomousPaperTrader] = None
+_CYCLES = 0
+
+
 # Job function for scheduler
 async def autonomous_trading_job():
     """Autonomous trading job that runs every 5 minutes."""
-    trader = AutonomousPaperTrader(starting_balance=1000.0)
+    global _TRADER, _CYCLES
+    if _TRADER is None:
+        _TRADER = AutonomousPaperTrader(starting_balance=1000.0)
+    elif _CYCLES % SESSION_REFRESH_CYCLES == 0:
+        _TRADER.refresh_session()
+    _CYCLES += 1
+
+    trader = _TRADER
 
     try:
         # Run trading cycle
@@ -364,3 +474,5 @@ async def autonomous_trading_job():
         logger.error(f"Autonomous trading job failed: {str(e)}")
         import traceback
         traceback.print_exc()
+        # Don't carry a possibly-broken transaction into the next cycle
+        trader.refresh_session()
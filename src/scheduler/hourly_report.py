@@ -1,90 +1,109 @@
 """Hourly performance report via Telegram during learning phase."""
 
 import logging
-from datetime import datetime
-from sqlalchemy.orm import Session
+from datetime import datetime, timedelta
+from typing import Any, Dict
 
-from src.db.session import SessionLocal
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.session import get_async_session
 from src.alerts.telegram import TelegramAlerter
-from src.db.models import WalletStats30D, Trade
+from src.db.models import WalletStats30D, Trade, PaperPosition, PaperTrade
 
 logger = logging.getLogger(__name__)
 
+# Virtual balance paper trading started with
+STARTING_BALANCE = 1000.0
 
-async def send_hourly_update():
-    """Send hourly paper trading + whale pool update to Telegram."""
-    db = SessionLocal()
-    telegram = TelegramAlerter()
 
-    try:
-        # Load paper trading state
-        import json
-        import os
-
-        paper_state = {
-            "starting_balance": 1000.0,
-            "current_balance": 1000.0,
-            "total_trades": 0,
-            "wins": 0,
-            "losses": 0,
-            "total_profit": 0.0,
-            "total_loss": 0.0,
-            "open_positions": 0,
-        }
-
-        if os.path.exists("paper_trading_log.json"):
-            with open("paper_trading_log.json") as f:
-                data = json.load(f)
-                paper_state["current_balance"] = data.get("current_balance", 1000.0)
-                paper_state["total_profit"] = data.get("total_profit", 0.0)
-                paper_state["total_loss"] = data.get("total_loss", 0.0)
-                paper_state["wins"] = data.get("win_count", 0)
-                paper_state["losses"] = data.get("loss_count", 0)
-                paper_state["total_trades"] = paper_state["wins"] + paper_state["losses"]
-                paper_state["open_positions"] = len(data.get("positions", {}))
+async def _load_paper_state(db: AsyncSession) -> Dict[str, Any]:
+    """Summarize paper trading from the paper_trades/paper_positions tables.
 
-        # Calculate ROI
-        roi = ((paper_state["current_balance"] - paper_state["starting_balance"]) /
-               paper_state["starting_balance"]) * 100
+    Args:
+        db: Async database session
 
-        # Get whale pool stats
-        total_whales = db.query(WalletStats30D).count()
-        profitable_whales = (
-            db.query(WalletStats30D)
-            .filter(WalletStats30D.unrealized_pnl_usd > 0)
-            .count()
-        )
-
-        avg_pnl = (
-            db.query(WalletStats30D.unrealized_pnl_usd)
-            .filter(WalletStats30D.unrealized_pnl_usd > 0)
-            .all()
-        )
-        avg_pnl_value = sum(p[0] for p in avg_pnl) / len(avg_pnl) if avg_pnl else 0
-
-        # Get top 3 whales
-        top_whales = (
-            db.query(WalletStats30D)
-            .filter(WalletStats30D.unrealized_pnl_usd > 0)
-            .order_by(
-                (WalletStats30D.unrealized_pnl_usd * 0.3 +
-                 WalletStats30D.trades_count * 3 +
-                 WalletStats30D.earlyscore_median * 0.4).desc()
+    Returns:
+        Dict with balance, trade counts, profit/loss and open position count
+    """
+    win = PaperTrade.profit_loss > 0
+    wins, losses, total_profit, total_loss = (
+        await db.execute(
+            select(
+                func.count().filter(win),
+                func.count().filter(~win),
+                func.coalesce(func.sum(PaperTrade.profit_loss).filter(win), 0.0),
+                func.coalesce(-func.sum(PaperTrade.profit_loss).filter(~win), 0.0),
             )
-            .limit(3)
-            .all()
         )
+    ).one()
+    open_count, open_cost = (
+        await db.execute(
+            select(
+                func.count(PaperPosition.id),
+                func.coalesce(func.sum(PaperPosition.cost_basis), 0.0),
+            ).where(PaperPosition.status == "open")
+        )
+    ).one()
+
+    return {
+        "starting_balance": STARTING_BALANCE,
+        "current_balance": STARTING_BALANCE + total_profit - total_loss - open_cost,
+        "total_trades": wins + losses,
+        "wins": wins,
+        "losses": losses,
+        "total_profit": total_profit,
+        "total_loss": total_loss,
+        "open_positions": open_count,
+    }
+
 
-        # Get recent activity
-        from sqlalchemy import func
-        from datetime import timedelta
+async def send_hourly_update():
+    """Send hourly paper trading + whale pool update to Telegram."""
+    telegram = TelegramAlerter()
 
+    try:
+        # Get whale pool stats and recent activity in one round-trip
         since = datetime.utcnow() - timedelta(hours=1)
-        recent_trades = (
-            db.query(func.count(Trade.tx_hash))
-            .filter(Trade.ts >= since)
-            .scalar() or 0
+        profitable = WalletStats30D.unrealized_pnl_usd > 0
+        recent_trades_subq = (
+            select(func.count(Trade.tx_hash)).where(Trade.ts >= since).scalar_subquery()
         )
+        async with get_async_session() as db:
+            # Load paper trading state
+            paper_state = await _load_paper_state(db)
+
+            total_whales, profitable_whales, avg_pnl_value, recent_trades = (
+                await db.execute(
+                    select(
+                        func.count(WalletStats30D.wallet_address),
+                        func.count().filter(profitable),
+                        func.avg(WalletStats30D.unrealized_pnl_usd).filter(profitable),
+                        recent_trades_subq,
+                    )
+                )
+            ).one()
+
+            # Get top 3 whales (only the columns the message uses)
+            top_whales = (
+                await db.execute(
+                    select(WalletStats30D.wallet_address, WalletStats30D.unrealized_pnl_usd)
+                    .where(WalletStats30D.unrealized_pnl_usd > 0)
+                    .order_by(
+                        (WalletStats30D.unrealized_pnl_usd * 0.3 +
+                         WalletStats30D.trades_count * 3 +
+                         WalletStats30D.earlyscore_median * 0.4).desc()
+                    )
+                    .limit(3)
+                )
+            ).all()
+
+        avg_pnl_value = avg_pnl_value or 0
+        recent_trades = recent_trades or 0
+
+        # Calculate ROI
+        roi = ((paper_state["current_balance"] - paper_state["starting_balance"]) /
+               paper_state["starting_balance"]) * 100
 
         # Calculate win rate
         win_rate = (paper_state["wins"] / paper_state["total_trades"] * 100) if paper_state["total_trades"] > 0 else 0
@@ -125,8 +144,8 @@ Recent Activity: {recent_trades} trades (last hour)
 🏆 TOP 3 WHALES:
 """
 
-        for i, whale in enumerate(top_whales, 1):
-            message += f"{i}. {whale.wallet_address[:10]}... ${whale.unrealized_pnl_usd:,.0f}\n"
+        for i, (wallet_address, unrealized_pnl) in enumerate(top_whales, 1):
+            message += f"{i}. {wallet_address[:10]}... ${unrealized_pnl:,.0f}\n"
 
         if paper_state['total_trades'] == 0:
             message += "\n⏳ No trades yet - waiting for first confluence signal..."
@@ -152,5 +171,3 @@ Recent Activity: {recent_trades} trades (last hour)
         logger.error(f"Failed to send hourly update: {str(e)}")
         import traceback
         traceback.print_exc()
-    finally:
-        db.close()
@@ -2,12 +2,17 @@
 
 import logging
 import asyncio
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
-from apscheduler.triggers.cron import CronTrigger
+import functools
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 from src.config import settings
-from src.db import SessionLocal
+from src.analytics.paper_trading import PaperTradingTracker
+from src.analytics.pnl import FIFOPnLCalculator
+from src.analytics.early import EarlyScoreCalculator
+from src.db import SessionLocal, get_async_session
 from src.ingest.runners import RunnerIngestion
 from src.ingest.wallet_discovery import WalletDiscovery
 from src.monitoring.wallet_monitor import WalletMonitor
@@ -15,108 +20,161 @@ from src.watchlist.rules import WatchlistManager
 from src.scheduler.hourly_report import send_hourly_update
 from src.scheduler.autonomous_trader import autonomous_trading_job
 from src.scheduler.position_manager import manage_positions_job
+from src.utils.redis_cache import cache_get_many, cache_set_many, stats_key, stats_memo_key
 
 logger = logging.getLogger(__name__)
 
+# Jobs allowed to hold database connections at the same time
+MAX_CONCURRENT_JOBS = 4
+_job_sem = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
 
-async def runner_seed_job() -> None:
-    """Fetch trending tokens from all sources (every 15 min)."""
-    logger.info("Starting runner seed job")
+# Nightly audit snapshot of paper trading state (the database is the source of truth)
+PAPER_TRADING_SNAPSHOT = "paper_trading_log.json"
+
+# Wallets processed (and committed) per stats rollup batch
+STATS_ROLLUP_BATCH_SIZE = 500
+
+# WalletStats30D fields published to Redis after each rollup batch
+# (trades_count is left out: the upsert only writes it on insert)
+CACHED_STATS_FIELDS = (
+    "wallet_address",
+    "chain_id",
+    "realized_pnl_usd",
+    "unrealized_pnl_usd",
+    "best_trade_multiple",
+    "earlyscore_median",
+    "last_update",
+)
+
+
+async def combined_ingest_job() -> None:
+    """Ingest trending tokens, then discover wallets and whales from them (every 5 min).
+
+    The three phases run back to back on one load of the fresh seed tokens
+    (and the shared Alchemy client), instead of as three overlapping jobs that
+    each re-read seed_tokens. A failing phase is logged and the next one still runs.
+    """
+    logger.info("Starting combined ingest job")
     db = SessionLocal()
 
     try:
-        ingestion = RunnerIngestion(db)
-        results = await ingestion.run_all_sources()
-        await ingestion.cleanup()
-
-        total = sum(results.values())
-        logger.info(f"Runner seed complete: {total} tokens ingested")
+        # Phase 1: trending tokens from all sources
+        try:
+            ingestion = RunnerIngestion(db)
+            results = await ingestion.run_all_sources()
+            await ingestion.cleanup()
+            logger.info(f"Runner seed complete: {sum(results.values())} tokens ingested")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Runner seed phase failed: {str(e)}")
+
+        seed_tokens = _load_seed_tokens(db, hours_back=24)
+
+        # Phase 2: wallets from the top-ranked meme seeds
+        try:
+            ranked = sorted(
+                seed_tokens, key=lambda seed: (seed.rank_24h is None, seed.rank_24h or 0)
+            )[:50]  # Top 50 trending tokens
+            discovery = WalletDiscovery(db)
+            wallets_found = await discovery.discover_from_seed_tokens(seed_tokens=ranked)
+            logger.info(f"Wallet discovery complete: {wallets_found} wallets found")
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Wallet discovery phase failed: {str(e)}")
+
+        # Phase 3: whale buys on the highest-volume liquid seeds, one per token
+        whale_tokens: Dict[str, Tuple[str, str, str]] = {}
+        for seed in sorted(
+            seed_tokens, key=lambda seed: seed.vol_24h_usd or 0.0, reverse=True
+        ):
+            if (seed.token.liquidity_usd or 0) > 50000:  # $50k min liquidity
+                whale_tokens.setdefault(
+                    seed.token_address, (seed.token_address, seed.chain_id, seed.token.symbol)
+                )
+        try:
+            async with get_async_session() as async_db:
+                # EXPANDED: Track top 100 tokens (was 30)
+                await _discover_whales(async_db, list(whale_tokens.values())[:100])
+        except Exception as e:
+            logger.error(f"Whale discovery phase failed: {str(e)}")
 
     except Exception as e:
-        logger.error(f"Runner seed job failed: {str(e)}")
+        logger.error(f"Combined ingest job failed: {str(e)}")
     finally:
         db.close()
 
 
-async def stats_rollup_job() -> None:
-    """Calculate wallet stats (hourly)."""
+def _load_seed_tokens(db: Session, hours_back: int) -> List:
+    """Load recent seed tokens with their token rows in one query.
+
+    Args:
+        db: Database session
+        hours_back: How many hours back to look for seed tokens
+
+    Returns:
+        SeedToken rows with .token loaded
+    """
+    from datetime import datetime, timedelta
+    from sqlalchemy.orm import joinedload
+    from src.db.models import SeedToken
+
+    since = datetime.utcnow() - timedelta(hours=hours_back)
+    seed_tokens = (
+        db.query(SeedToken)
+        .options(joinedload(SeedToken.token))
+        .filter(SeedToken.snapshot_ts >= since)
+        .all()
+    )
+    logger.info(f"Found {len(seed_tokens)} seed tokens from last {hours_back}h")
+    return seed_tokens
+
+
+async def stats_rollup_job(addresses: Optional[List[str]] = None) -> None:
+    """Calculate wallet stats (hourly).
+
+    Args:
+        addresses: Only roll up these wallets (default: every non-bot wallet)
+    """
     logger.info("Starting stats rollup job")
     db = SessionLocal()
 
     try:
-        from src.analytics.pnl import FIFOPnLCalculator
-        from src.analytics.early import EarlyScoreCalculator
-        from src.db.models import Wallet, WalletStats30D
+        from src.db.models import Wallet
 
         pnl_calc = FIFOPnLCalculator(db)
         early_calc = EarlyScoreCalculator(db)
 
-        # Get all non-bot wallets
-        wallets = db.query(Wallet).filter(Wallet.is_bot_flag == False).all()
-
-        for wallet in wallets:
-            try:
-                # Calculate PnL (async method)
-                pnl_data = await pnl_calc.calculate_wallet_pnl(wallet.address, days=30)
-                best_multiple = pnl_calc.get_best_trade_multiple(wallet.address, days=30)
-
-                # Calculate median EarlyScore
-                median_early = early_calc.calculate_median_score(wallet.address, days=30)
-
-                # Get or create stats record
-                stats = (
-                    db.query(WalletStats30D)
-                    .filter(
-                        WalletStats30D.wallet_address == wallet.address,
-                        WalletStats30D.chain_id == wallet.chain_id,
-                    )
-                    .first()
-                )
-
-                if stats:
-                    from datetime import datetime
-
-                    stats.realized_pnl_usd = pnl_data["realized_pnl"]
-                    stats.unrealized_pnl_usd = pnl_data["unrealized_pnl"]
-                    stats.best_trade_multiple = best_multiple
-                    stats.earlyscore_median = median_early
-                    stats.last_update = datetime.utcnow()
-                else:
-                    from src.db.models import Trade
-                    from datetime import datetime, timedelta
-                    from sqlalchemy import and_, func
-
-                    # Count trades
-                    since = datetime.utcnow() - timedelta(days=30)
-                    trade_count = (
-                        db.query(func.count(Trade.tx_hash))
-                        .filter(
-                            and_(
-                                Trade.wallet_address == wallet.address,
-                                Trade.ts >= since,
-                            )
-                        )
-                        .scalar()
-                        or 0
-                    )
-
-                    stats = WalletStats30D(
-                        wallet_address=wallet.address,
-                        chain_id=wallet.chain_id,
-                        trades_count=trade_count,
-                        realized_pnl_usd=pnl_data["realized_pnl"],
-                        unrealized_pnl_usd=pnl_data["unrealized_pnl"],
-                        best_trade_multiple=best_multiple,
-                        earlyscore_median=median_early,
-                    )
-                    db.add(stats)
-
-            except Exception as e:
-                logger.error(f"Error processing wallet {wallet.address}: {str(e)}")
-                continue
-
-        db.commit()
-        logger.info(f"Stats rollup complete for {len(wallets)} wallets")
+        # Walk non-bot wallets in address order, one bounded batch (and commit) at a time
+        total = 0
+        last_address = ""
+        while True:
+            query = db.query(Wallet.address, Wallet.chain_id).filter(
+                Wallet.is_bot_flag == False, Wallet.address > last_address
+            )
+            if addresses is not None:
+                query = query.filter(Wallet.address.in_(addresses))
+            wallets = query.order_by(Wallet.address).limit(STATS_ROLLUP_BATCH_SIZE).all()
+            if not wallets:
+                break
+
+            rows = await _rollup_stats_batch(db, pnl_calc, early_calc, wallets)
+            db.commit()
+
+            # Publish the fresh stats so readers can skip Postgres until the next rollup
+            await cache_set_many(
+                {
+                    stats_key(row["wallet_address"]): {
+                        field: row[field] for field in CACHED_STATS_FIELDS
+                    }
+                    for row in rows
+                },
+                settings.redis_stats_ttl_seconds,
+            )
+
+            total += len(wallets)
+            last_address = wallets[-1].address
+
+        logger.info(f"Stats rollup complete for {total} wallets")
 
     except Exception as e:
         logger.error(f"Stats rollup job failed: {str(e)}")
@@ -125,122 +183,252 @@ async def stats_rollup_job() -> None:
         db.close()
 
 
-async def wallet_discovery_job() -> None:
-    """Discover wallets from trending tokens (every hour)."""
-    logger.info("Starting wallet discovery job")
-    db = SessionLocal()
+async def _rollup_stats_batch(
+    db: Session,
+    pnl_calc: FIFOPnLCalculator,
+    early_calc: EarlyScoreCalculator,
+    wallets: List[Tuple[str, str]],
+) -> List[Dict]:
+    """Compute and UPSERT 30D stats for one batch of wallets.
 
-    try:
-        discovery = WalletDiscovery(db)
-        wallets_found = await discovery.discover_from_seed_tokens(hours_back=24)
-        logger.info(f"Wallet discovery complete: {wallets_found} wallets found")
+    Args:
+        db: Database session (caller commits)
+        pnl_calc: FIFOPnLCalculator bound to db
+        early_calc: EarlyScoreCalculator bound to db
+        wallets: (address, chain_id) rows
 
-    except Exception as e:
-        logger.error(f"Wallet discovery job failed: {str(e)}")
-    finally:
-        db.close()
+    Returns:
+        The upserted stats rows
+    """
+    from datetime import datetime, timedelta
+    from sqlalchemy import func
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    from src.db.models import Trade, WalletStats30D
+
+    addresses = [w.address for w in wallets]
+
+    # Version of each wallet's 30D trade history; wallets without trades have nothing to compute
+    since = datetime.utcnow() - timedelta(days=30)
+    history = {
+        wallet_address: (latest_ts, trade_count)
+        for wallet_address, latest_ts, trade_count in db.query(
+            Trade.wallet_address, func.max(Trade.ts), func.count(Trade.tx_hash)
+        )
+        .filter(Trade.wallet_address.in_(addresses), Trade.ts >= since)
+        .group_by(Trade.wallet_address)
+        .all()
+    }
+    trade_counts = {address: count for address, (_, count) in history.items()}
+
+    # Wallets whose history is unchanged since an earlier pass reuse its FIFO state and EarlyScore
+    memo_keys = {address: stats_memo_key(address, *version) for address, version in history.items()}
+    cached = await cache_get_many(list(memo_keys.values()))
+    memo = {address: entry for address, entry in zip(memo_keys, cached) if entry is not None}
+    misses = [address for address in memo_keys if address not in memo]
+
+    # Each analytic runs once over the batch instead of once per wallet
+    fifo_memo = {address: entry["fifo"] for address, entry in memo.items()}
+    pnl_by_wallet = await pnl_calc.calculate_all_wallets_pnl(
+        list(memo_keys), days=30, fifo_memo=fifo_memo
+    )
+    medians = {address: entry["early"] for address, entry in memo.items()}
+    medians.update(early_calc.calculate_all_medians(misses, days=30))
+
+    await cache_set_many(
+        {
+            memo_keys[address]: {"fifo": fifo_memo[address], "early": medians.get(address)}
+            for address in misses
+            if address in fifo_memo
+        },
+        settings.stats_memo_ttl_seconds,
+    )
 
+    now = datetime.utcnow()
+    rows = []
+    for wallet in wallets:
+        realized, unrealized, best_multiple = pnl_by_wallet.get(
+            wallet.address, (0.0, 0.0, 1.0)
+        )
+        rows.append(
+            {
+                "wallet_address": wallet.address,
+                "chain_id": wallet.chain_id,
+                "trades_count": trade_counts.get(wallet.address, 0),
+                "realized_pnl_usd": realized,
+                "unrealized_pnl_usd": unrealized,
+                "best_trade_multiple": best_multiple,
+                "earlyscore_median": medians.get(wallet.address),
+                "last_update": now,
+            }
+        )
 
-async def whale_discovery_job() -> None:
-    """Enhanced whale discovery - Find wallets making $10k+ trades (every 30 min)."""
-    logger.info("Starting enhanced whale discovery job")
-    db = SessionLocal()
+    # Single UPSERT per batch; trades_count is only written on insert, as before
+    stmt = pg_insert(WalletStats30D).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["wallet_address", "chain_id"],
+        set_={
+            "realized_pnl_usd": stmt.excluded.realized_pnl_usd,
+            "unrealized_pnl_usd": stmt.excluded.unrealized_pnl_usd,
+            "best_trade_multiple": stmt.excluded.best_trade_multiple,
+            "earlyscore_median": stmt.excluded.earlyscore_median,
+            "last_update": stmt.excluded.last_update,
+        },
+    )
+    db.execute(stmt)
+    return rows
 
-    try:
-        from src.db.models import SeedToken, Wallet, Trade, Token
-        from src.clients.alchemy import AlchemyClient
-        from datetime import datetime
-
-        # Get MANY MORE trending tokens for broader coverage
-        # JOIN with tokens table to get liquidity (not available in seed_tokens)
-        trending_tokens = (
-            db.query(SeedToken, Token)
-            .join(Token, SeedToken.token_address == Token.token_address)
-            .filter(Token.liquidity_usd > 50000)  # $50k min liquidity
-            .order_by(SeedToken.vol_24h_usd.desc())  # Order by volume
-            .limit(100)  # EXPANDED: Track top 100 tokens (was 30)
-            .all()
-        )
 
-        logger.info(f"Analyzing {len(trending_tokens)} high-liquidity tokens for whale trades")
+async def _discover_whales(db: AsyncSession, trending_tokens: List[Tuple[str, str, str]]) -> None:
+    """Scan high-liquidity trending tokens for whale buys and store them.
 
-        client = AlchemyClient()
-        whale_wallets_found = 0
-        large_trades_found = 0
+    Args:
+        db: Async database session (committed every db_commit_interval tokens)
+        trending_tokens: (token_address, chain_id, symbol) to scan, highest volume first
+    """
+    from src.clients.alchemy import get_alchemy_client
+
+    logger.info(f"Analyzing {len(trending_tokens)} high-liquidity tokens for whale trades")
+
+    client = get_alchemy_client()
+    whale_wallets_found = 0
+    large_trades_found = 0
+
+    # Fan out all transfer fetches; the semaphore is the rate limiter
+    semaphore = asyncio.Semaphore(settings.whale_http_concurrency)
+
+    async def fetch_transfers(token_address: str, chain_id: str) -> List[Dict]:
+        async with semaphore:
+            # Get RECENT transfers (now looking back only ~3 hours via Alchemy client)
+            # This gives us FRESHER whales, not 3-day-old trades!
+            return await client.get_token_transfers(
+                token_address,
+                chain_id,
+                limit=200  # More transfers to catch more whales
+            )
+
+    results = await asyncio.gather(
+        *(fetch_transfers(token_address, chain_id) for token_address, chain_id, _ in trending_tokens),
+        return_exceptions=True,
+    )
 
-        for seed_token, token in trending_tokens:
-            try:
-                # Get RECENT transfers (now looking back only ~3 hours via Alchemy client)
-                # This gives us FRESHER whales, not 3-day-old trades!
-                transfers = await client.get_token_transfers(
-                    seed_token.token_address,
-                    seed_token.chain_id,
-                    limit=200  # More transfers to catch more whales
+    for i, ((token_address, chain_id, symbol), transfers) in enumerate(
+        zip(trending_tokens, results), 1
+    ):
+        if isinstance(transfers, Exception):
+            logger.error(f"Error processing {symbol}: {str(transfers)}")
+            continue
+
+        try:
+            # Filter for MEDIUM+ transfers ($1k+) - LOWERED for more signals
+            # Whales making $1k+ trades are still significant!
+            large_transfers = [
+                t for t in transfers
+                if t.get("value_usd", 0) >= 1000 and t.get("type") == "buy"
+            ]
+
+            # Savepoint per token so one bad token doesn't discard the rest of the batch
+            async with db.begin_nested():
+                wallets_added, trades_added = await _insert_whale_transfers(
+                    db, token_address, chain_id, large_transfers
                 )
+            whale_wallets_found += wallets_added
+            large_trades_found += trades_added
 
-                # Filter for MEDIUM+ transfers ($1k+) - LOWERED for more signals
-                # Whales making $1k+ trades are still significant!
-                large_transfers = [
-                    t for t in transfers
-                    if t.get("value_usd", 0) >= 1000 and t.get("type") == "buy"
-                ]
-
-                for transfer in large_transfers:
-                    wallet_address = transfer.get("from_address")
-                    value_usd = transfer.get("value_usd", 0)
-
-                    # Check if wallet already exists
-                    existing = db.query(Wallet).filter(
-                        Wallet.address == wallet_address
-                    ).first()
-
-                    if not existing:
-                        # New whale discovered!
-                        wallet = Wallet(
-                            address=wallet_address,
-                            chain_id=seed_token.chain_id,
-                            first_seen_at=datetime.utcnow(),
-                        )
-                        db.add(wallet)
-                        db.flush()
-                        whale_wallets_found += 1
-                        logger.info(f"🐋 NEW WHALE: {wallet_address[:16]}... bought ${value_usd:,.0f}")
-
-                    # Record the trade
-                    tx_hash = transfer.get("tx_hash")
-                    existing_trade = db.query(Trade).filter(Trade.tx_hash == tx_hash).first()
-
-                    if not existing_trade:
-                        trade = Trade(
-                            tx_hash=tx_hash,
-                            ts=transfer.get("timestamp", datetime.utcnow()),
-                            chain_id=seed_token.chain_id,
-                            wallet_address=wallet_address,
-                            token_address=seed_token.token_address,
-                            side="buy",
-                            qty_token=float(transfer.get("amount", 0)),
-                            price_usd=float(transfer.get("price_usd", 0)),
-                            usd_value=float(value_usd),
-                            venue=transfer.get("dex"),
-                        )
-                        db.add(trade)
-                        db.flush()
-                        large_trades_found += 1
-
-                db.commit()
-                await asyncio.sleep(0.1)  # Minimal rate limiting for max speed
+        except Exception as e:
+            logger.error(f"Error processing {symbol}: {str(e)}")
+            continue
 
-            except Exception as e:
-                logger.error(f"Error processing {token.symbol if token else 'unknown'}: {str(e)}")
-                db.rollback()
-                continue
+        if i % settings.db_commit_interval == 0:
+            await db.commit()
 
-        logger.info(f"Enhanced whale discovery complete: {whale_wallets_found} new whales, {large_trades_found} large trades ($10k+ each)")
+    await db.commit()
 
-    except Exception as e:
-        logger.error(f"Enhanced whale discovery job failed: {str(e)}")
-    finally:
-        db.close()
+    logger.info(f"Enhanced whale discovery complete: {whale_wallets_found} new whales, {large_trades_found} large trades ($10k+ each)")
+
+
+async def _insert_whale_transfers(
+    db: AsyncSession, token_address: str, chain_id: str, large_transfers: List[Dict]
+) -> Tuple[int, int]:
+    """Insert new whale wallets and buy trades for one token's transfers.
+
+    Uses INSERT ... ON CONFLICT DO NOTHING RETURNING, so already-known wallets
+    and trades are skipped by Postgres in the same round-trip (no pre-check
+    SELECT, and no race with concurrent jobs inserting the same rows).
+
+    Args:
+        db: Async database session (caller commits)
+        token_address: Token the transfers belong to
+        chain_id: Chain identifier
+        large_transfers: Parsed buy transfers above the whale threshold
+
+    Returns:
+        Tuple of (new wallets inserted, new trades inserted)
+    """
+    from datetime import datetime
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+    from src.db.models import Wallet, Trade
+
+    if not large_transfers:
+        return 0, 0
+
+    now = datetime.utcnow()
+    wallet_rows: Dict[str, Dict] = {}
+    trade_rows: Dict[str, Dict] = {}
+    first_buy_usd: Dict[str, float] = {}
+
+    for transfer in large_transfers:
+        wallet_address = transfer.get("from_address")
+        value_usd = transfer.get("value_usd", 0)
+
+        wallet_rows.setdefault(
+            wallet_address,
+            {
+                "address": wallet_address,
+                "chain_id": chain_id,
+                "first_seen_at": now,
+            },
+        )
+        first_buy_usd.setdefault(wallet_address, value_usd)
+
+        trade_rows.setdefault(
+            transfer.get("tx_hash"),
+            {
+                "tx_hash": transfer.get("tx_hash"),
+                "ts": transfer.get("timestamp", now),
+                "chain_id": chain_id,
+                "wallet_address": wallet_address,
+                "token_address": token_address,
+                "side": "buy",
+                "qty_token": float(transfer.get("amount", 0)),
+                "price_usd": float(transfer.get("price_usd", 0)),
+                "usd_value": float(value_usd),
+                "venue": transfer.get("dex"),
+            },
+        )
+
+    # Wallets first so the trades' foreign keys resolve
+    new_wallets = (
+        await db.execute(
+            pg_insert(Wallet)
+            .values(list(wallet_rows.values()))
+            .on_conflict_do_nothing(index_elements=["address"])
+            .returning(Wallet.address)
+        )
+    ).scalars().all()
+    for wallet_address in new_wallets:
+        # New whale discovered!
+        logger.info(f"🐋 NEW WHALE: {wallet_address[:16]}... bought ${first_buy_usd[wallet_address]:,.0f}")
+
+    new_trades = (
+        await db.execute(
+            pg_insert(Trade)
+            .values(list(trade_rows.values()))
+            .on_conflict_do_nothing(index_elements=["tx_hash"])
+            .returning(Trade.tx_hash)
+        )
+    ).scalars().all()
+
+    return len(new_wallets), len(new_trades)
 
 
 async def wallet_monitoring_job() -> None:
@@ -292,93 +480,125 @@ async def performance_evaluation_job() -> None:
         db.close()
 
 
-def setup_scheduler() -> AsyncIOScheduler:
-    """Set up and configure the job scheduler.
+async def paper_trading_snapshot_job() -> None:
+    """Write a JSON snapshot of paper trading state for audit (nightly)."""
+    logger.info("Starting paper trading snapshot job")
+    db = SessionLocal()
+
+    try:
+        trader = PaperTradingTracker.load_from_db(db, closed_trades_limit=None)
+        trader.save_to_file(PAPER_TRADING_SNAPSHOT)
+
+    except Exception as e:
+        logger.error(f"Paper trading snapshot job failed: {str(e)}")
+    finally:
+        db.close()
+
+
+def _with_job_slot(job: Callable[[], Awaitable[None]]) -> Callable[[], Awaitable[None]]:
+    """Wrap a job so it waits for one of the shared job slots before running.
+
+    Errors that escape the job are logged so its loop keeps running.
+
+    Args:
+        job: Scheduled job coroutine function
 
     Returns:
-        Configured scheduler
+        Wrapped coroutine function
     """
-    scheduler = AsyncIOScheduler()
-
-    # Runner seed - every 5 minutes (max speed)
-    scheduler.add_job(
-        runner_seed_job,
-        trigger=IntervalTrigger(minutes=5),
-        id="runner_seed",
-        name="Fetch trending tokens",
-        replace_existing=True,
-    )
 
-    # Wallet discovery - every 10 minutes (max speed)
-    scheduler.add_job(
-        wallet_discovery_job,
-        trigger=IntervalTrigger(minutes=10),
-        id="wallet_discovery",
-        name="Discover wallets from trending tokens",
-        replace_existing=True,
-    )
+    @functools.wraps(job)
+    async def wrapper() -> None:
+        async with _job_sem:
+            try:
+                await job()
+            except Exception as e:
+                logger.error(f"Job {job.__name__} failed: {str(e)}")
 
-    # Enhanced whale discovery - every 5 minutes (max speed)
-    scheduler.add_job(
-        whale_discovery_job,
-        trigger=IntervalTrigger(minutes=5),
-        id="whale_discovery",
-        name="Find whales making $10k+ trades",
-        replace_existing=True,
-    )
+    return wrapper
 
-    # Wallet monitoring - every 2 minutes (max speed)
-    scheduler.add_job(
-        wallet_monitoring_job,
-        trigger=IntervalTrigger(minutes=2),
-        id="wallet_monitoring",
-        name="Monitor watchlist wallets for trades",
-        replace_existing=True,
-    )
 
-    # Stats rollup - every 15 minutes (frequent updates)
-    scheduler.add_job(
-        stats_rollup_job,
-        trigger=IntervalTrigger(minutes=15),
-        id="stats_rollup",
-        name="Calculate wallet stats",
-        replace_existing=True,
-    )
+async def _every(job: Callable[[], Awaitable[None]], seconds: float) -> None:
+    """Run a job forever, one interval apart measured start to start.
 
-    # Position management - every 5 minutes (ACTIVE TRADING)
-    scheduler.add_job(
-        manage_positions_job,
-        trigger=IntervalTrigger(minutes=5),
-        id="position_management",
-        name="Manage open positions (take profit/stop loss)",
-        replace_existing=True,
-    )
+    The first run is one interval after startup. A run that overruns the
+    interval is followed immediately by the next one, so runs never overlap
+    and a backlog collapses into a single run.
 
-    # Watchlist maintenance - daily at 2 AM UTC
-    scheduler.add_job(
-        watchlist_maintenance_job,
-        trigger=CronTrigger(hour=2, minute=0),
-        id="watchlist_maintenance",
-        name="Nightly watchlist maintenance",
-        replace_existing=True,
-    )
+    Args:
+        job: Job coroutine function
+        seconds: Interval between run starts
+    """
+    loop = asyncio.get_running_loop()
+    await asyncio.sleep(seconds)
+    while True:
+        start = loop.time()
+        await job()
+        await asyncio.sleep(max(0.0, seconds - (loop.time() - start)))
+
+
+def _seconds_until(minute: int, hour: Optional[int] = None) -> float:
+    """Seconds until the next wall-clock time at minute (of hour, if given)."""
+    now = datetime.now()
+    run_at = now.replace(minute=minute, second=0, microsecond=0)
+    if hour is not None:
+        run_at = run_at.replace(hour=hour)
+    if run_at <= now:
+        run_at += timedelta(days=1) if hour is not None else timedelta(hours=1)
+    return (run_at - now).total_seconds()
+
+
+async def _at(job: Callable[[], Awaitable[None]], minute: int, hour: Optional[int] = None) -> None:
+    """Run a job forever at a fixed minute of every hour, or of one hour every day.
+
+    Args:
+        job: Job coroutine function
+        minute: Minute of the hour to run at
+        hour: Hour of the day to run at (None for every hour)
+    """
+    while True:
+        await asyncio.sleep(_seconds_until(minute, hour))
+        await job()
 
-    # Hourly Telegram update - every hour on the hour
-    scheduler.add_job(
-        send_hourly_update,
-        trigger=CronTrigger(minute=0),  # Every hour at :00
-        id="hourly_telegram_update",
-        name="Hourly paper trading update to Telegram",
-        replace_existing=True,
-    )
 
-    logger.info("Scheduler configured with jobs (MAX SPEED MODE + OPPORTUNITY-DRIVEN TRADING):")
-    logger.info("  - runner_seed: every 5 minutes")
-    logger.info("  - wallet_discovery: every 10 minutes")
-    logger.info("  - whale_discovery: every 5 minutes ($10k+ trades)")
-    logger.info("  - wallet_monitoring: every 2 minutes (🤖 PAPER TRADES ON CONFLUENCE)")
-    logger.info("  - stats_rollup: every 15 minutes")
-    logger.info("  - watchlist_maintenance: daily at 2:00 AM UTC")
-    logger.info("  - hourly_telegram_update: every hour (paper trading report)")
+async def run_forever() -> None:
+    """Run every scheduled job as its own asyncio task until cancelled.
 
-    return scheduler
+    Each job is a plain loop (see _every / _at) wrapped in a shared job slot,
+    so there is no scheduler executor between the event loop and the jobs.
+    Cancelling this coroutine cancels every job task.
+    """
+    # (job loop, id, schedule shown in the startup log)
+    jobs = [
+        # Max speed discovery / monitoring
+        (_every(_with_job_slot(combined_ingest_job), 5 * 60), "combined_ingest",
+         "every 5 minutes (seeds → wallets → $10k+ whales)"),
+        (_every(_with_job_slot(wallet_monitoring_job), 2 * 60), "wallet_monitoring",
+         "every 2 minutes (🤖 PAPER TRADES ON CONFLUENCE)"),
+        (_every(_with_job_slot(stats_rollup_job), 15 * 60), "stats_rollup",
+         "every 15 minutes"),
+        # Active trading
+        (_every(_with_job_slot(manage_positions_job), 5 * 60), "position_management",
+         "every 5 minutes"),
+        # Daily at 2 AM UTC
+        (_at(_with_job_slot(watchlist_maintenance_job), minute=0, hour=2), "watchlist_maintenance",
+         "daily at 2:00 AM UTC"),
+        (_at(_with_job_slot(paper_trading_snapshot_job), minute=30, hour=2), "paper_trading_snapshot",
+         "daily at 2:30 AM UTC"),
+        # Every hour at :00
+        (_at(_with_job_slot(send_hourly_update), minute=0), "hourly_telegram_update",
+         "every hour (paper trading report)"),
+    ]
+
+    summary = "\n".join(f"  - {job_id}: {schedule}" for _, job_id, schedule in jobs)
+    logger.info(
+        f"Scheduler configured with jobs (MAX SPEED MODE + OPPORTUNITY-DRIVEN TRADING):\n{summary}"
+    )
+
+    tasks = [asyncio.create_task(loop, name=job_id) for loop, job_id, _ in jobs]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
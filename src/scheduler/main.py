@@ -2,7 +2,8 @@
 
 import logging
 import asyncio
-from src.scheduler.jobs import setup_scheduler
+from src.clients.alchemy import close_alchemy_client
+from src.scheduler.jobs import run_forever
 from src.config import settings
 
 logging.basicConfig(
@@ -17,18 +18,15 @@ async def main() -> None:
     """Run the scheduler."""
     logger.info("Starting Alpha Wallet Scout Worker")
 
-    scheduler = setup_scheduler()
-    scheduler.start()
-
     logger.info("Scheduler started. Press Ctrl+C to exit.")
 
     try:
-        # Keep the scheduler running
-        while True:
-            await asyncio.sleep(3600)  # Sleep for 1 hour at a time
-    except (KeyboardInterrupt, SystemExit):
+        # Runs until cancelled (Ctrl+C cancels this task, which cancels every job)
+        await run_forever()
+    except (asyncio.CancelledError, KeyboardInterrupt, SystemExit):
         logger.info("Shutting down scheduler...")
-        scheduler.shutdown()
+    finally:
+        await close_alchemy_client()
 
 
 if __name__ == "__main__":
@@ -2,13 +2,27 @@
 
 import logging
 import asyncio
+from datetime import datetime
+from typing import Optional
 from sqlalchemy.orm import Session
+from src.config import settings
 from src.db.session import SessionLocal
 from src.analytics.paper_trading import PaperTradingTracker
 from src.utils.price_fetcher import MultiSourcePriceFetcher
 
 logger = logging.getLogger(__name__)
 
+# Shared across runs so the fetcher's price cache and HTTP clients survive between ticks
+_PRICE_FETCHER: Optional[MultiSourcePriceFetcher] = None
+
+
+def _get_price_fetcher() -> MultiSourcePriceFetcher:
+    """Return the process-wide price fetcher, creating it on first use."""
+    global _PRICE_FETCHER
+    if _PRICE_FETCHER is None:
+        _PRICE_FETCHER = MultiSourcePriceFetcher()
+    return _PRICE_FETCHER
+
 
 async def manage_positions_job() -> None:
     """Check all open positions and sell if profit/loss targets hit.
@@ -18,21 +32,34 @@ async def manage_positions_job() -> None:
     db = SessionLocal()
     
     try:
-        trader = PaperTradingTracker.load_from_file('/app/paper_trading_log.json')
+        trader = PaperTradingTracker.load_from_db(db)
         
-        if not trader or not trader.positions:
+        if not trader.positions:
             logger.info("No open positions to manage")
             return
         
-        fetcher = MultiSourcePriceFetcher()
         sells_executed = 0
         
         logger.info(f"📊 Managing {len(trader.positions)} open positions")
         
-        for token_addr, pos in list(trader.positions.items()):
+        # Re-price only positions not checked recently (batched + TTL-cached), then decide
+        # with no awaits; the rest reuse the price from their last check
+        positions = list(trader.positions.items())
+        stale = set(trader.stale_positions(settings.position_recheck_seconds))
+        now = datetime.utcnow()
+        prices = await _get_price_fetcher().get_token_prices(
+            [(token_addr, pos['chain_id']) for token_addr, pos in positions if token_addr in stale]
+        )
+        
+        for token_addr, pos in positions:
             try:
                 # Get current price
-                current_price = await fetcher.get_token_price(token_addr, pos['chain_id'])
+                if token_addr in stale:
+                    current_price = prices.get((token_addr, pos['chain_id']), 0.0)
+                    if current_price > 0:
+                        trader.record_check(token_addr, current_price, now)
+                else:
+                    current_price = pos['last_price_usd']
                 
                 if current_price == 0:
                     logger.warning(f"Cannot get price for {token_addr[:16]}..., skipping")
@@ -73,7 +100,6 @@ async def manage_positions_job() -> None:
                             f"${result['profit_loss']:+.2f} ({result['profit_pct']:+.1f}%) - {reason}"
                         )
                         logger.info(f"   New balance: ${trader.current_balance:.2f}")
-                        trader.save_to_file()
                 else:
                     logger.debug(
                         f"⏸️  HOLDING {token_addr[:16]}...: "
@@ -84,6 +110,9 @@ async def manage_positions_job() -> None:
                 logger.error(f"Error managing position {token_addr[:16]}...: {str(e)}")
                 continue
         
+        # One write for the sells and the refreshed last-checked prices
+        trader.persist()
+
         if sells_executed > 0:
             logger.info(
                 f"💰 Position management complete: {sells_executed} positions sold, "
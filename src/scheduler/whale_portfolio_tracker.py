@@ -1,10 +1,13 @@
 """Track complete whale portfolios - see EVERYTHING they're trading, not just seed tokens."""
 
 import logging
+from typing import Dict, List
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from src.config import settings
 from src.db.session import SessionLocal
-from src.db.models import Wallet, WalletStats30D, Trade
-from src.clients.alchemy import AlchemyClient
+from src.db.models import Wallet, WalletStats30D, Trade, Token
+from src.clients.alchemy import get_alchemy_client
 import asyncio
 
 logger = logging.getLogger(__name__)
@@ -29,73 +32,104 @@ async def track_whale_full_portfolios() -> None:
         
         logger.info(f"📊 Tracking full portfolios of {len(profitable_whales)} profitable whales")
         
-        client = AlchemyClient()
+        client = get_alchemy_client()
         new_tokens_discovered = 0
         new_trades_found = 0
-        
-        for whale in profitable_whales:
-            try:
+
+        # Plain values, so periodic commits don't expire and reload each Wallet row
+        whales = [(whale.address, whale.chain_id) for whale in profitable_whales]
+
+        # Fetch every whale's transactions concurrently; the semaphore is the rate limiter
+        semaphore = asyncio.Semaphore(settings.whale_http_concurrency)
+
+        async def fetch_transactions(address: str, chain_id: str) -> List[Dict]:
+            async with semaphore:
                 # Get ALL wallet transactions (not filtered by token)
-                transactions = await client.get_wallet_transactions(
-                    whale.address,
-                    whale.chain_id,
+                return await client.get_wallet_transactions(
+                    address,
+                    chain_id,
                     limit=50  # Last 50 transactions
                 )
-                
-                for tx in transactions:
-                    token_address = tx.get("token_address")
-                    
-                    # Check if this is a NEW token we haven't seen
-                    from src.db.models import Token
-                    existing_token = db.query(Token).filter(
-                        Token.token_address == token_address,
-                        Token.chain_id == whale.chain_id
-                    ).first()
-                    
-                    if not existing_token:
-                        # NEW TOKEN discovered via whale portfolio!
-                        logger.info(f"🆕 NEW TOKEN via whale {whale.address[:10]}...: {token_address[:10]}...")
-                        new_tokens_discovered += 1
-                        
-                        # Add to tokens table
-                        token = Token(
-                            token_address=token_address,
-                            chain_id=whale.chain_id,
-                            symbol=tx.get("symbol", "UNKNOWN"),
-                            last_price_usd=tx.get("price_usd", 0),
-                            liquidity_usd=0,  # Will be updated by price fetcher
-                        )
-                        db.add(token)
-                        db.flush()
-                    
-                    # Record the trade (if not already recorded)
-                    tx_hash = tx.get("tx_hash")
-                    existing_trade = db.query(Trade).filter(Trade.tx_hash == tx_hash).first()
-                    
-                    if not existing_trade:
-                        trade = Trade(
-                            tx_hash=tx_hash,
-                            ts=tx.get("timestamp"),
-                            chain_id=whale.chain_id,
-                            wallet_address=whale.address,
-                            token_address=token_address,
-                            side=tx.get("type", "buy"),
-                            qty_token=float(tx.get("amount", 0)),
-                            price_usd=float(tx.get("price_usd", 0)),
-                            usd_value=float(tx.get("value_usd", 0)),
-                            venue=tx.get("dex"),
-                        )
-                        db.add(trade)
-                        new_trades_found += 1
-                
-                db.commit()
-                await asyncio.sleep(0.2)  # Rate limiting
-                
+
+        results = await asyncio.gather(
+            *(fetch_transactions(address, chain_id) for address, chain_id in whales),
+            return_exceptions=True,
+        )
+
+        for i, ((whale_address, whale_chain_id), transactions) in enumerate(
+            zip(whales, results), 1
+        ):
+            if isinstance(transactions, Exception):
+                logger.error(f"Error tracking whale {whale_address[:10]}...: {str(transactions)}")
+                continue
+
+            # One row per token / trade; Postgres skips the ones we already have
+            token_rows: Dict[str, Dict] = {}
+            trade_rows: Dict[str, Dict] = {}
+            for tx in transactions:
+                token_address = tx.get("token_address")
+                token_rows.setdefault(
+                    token_address,
+                    {
+                        "token_address": token_address,
+                        "chain_id": whale_chain_id,
+                        "symbol": tx.get("symbol", "UNKNOWN"),
+                        "last_price_usd": tx.get("price_usd", 0),
+                        "liquidity_usd": 0,  # Will be updated by price fetcher
+                    },
+                )
+                trade_rows.setdefault(
+                    tx.get("tx_hash"),
+                    {
+                        "tx_hash": tx.get("tx_hash"),
+                        "ts": tx.get("timestamp"),
+                        "chain_id": whale_chain_id,
+                        "wallet_address": whale_address,
+                        "token_address": token_address,
+                        "side": tx.get("type", "buy"),
+                        "qty_token": float(tx.get("amount", 0)),
+                        "price_usd": float(tx.get("price_usd", 0)),
+                        "usd_value": float(tx.get("value_usd", 0)),
+                        "venue": tx.get("dex"),
+                    },
+                )
+
+            if not trade_rows:
+                continue
+
+            try:
+                # Savepoint per whale so a bad whale only discards its own rows
+                with db.begin_nested():
+                    # Tokens first so the trades' foreign keys resolve
+                    added_tokens = db.execute(
+                        pg_insert(Token)
+                        .values(list(token_rows.values()))
+                        .on_conflict_do_nothing(index_elements=["token_address"])
+                        .returning(Token.token_address)
+                    ).scalars().all()
+                    added_trades = db.execute(
+                        pg_insert(Trade)
+                        .values(list(trade_rows.values()))
+                        .on_conflict_do_nothing(index_elements=["tx_hash"])
+                        .returning(Trade.tx_hash)
+                    ).scalars().all()
+
+                for token_address in added_tokens:
+                    # NEW TOKEN discovered via whale portfolio!
+                    logger.info(f"🆕 NEW TOKEN via whale {whale_address[:10]}...: {token_address[:10]}...")
+
+                new_tokens_discovered += len(added_tokens)
+                new_trades_found += len(added_trades)
+
             except Exception as e:
-                logger.error(f"Error tracking whale {whale.address[:10]}...: {str(e)}")
-                db.rollback()
+                logger.error(f"Error tracking whale {whale_address[:10]}...: {str(e)}")
                 continue
-        
+
+            if i % settings.db_commit_interval == 0:
+                db.commit()
+
+        db.commit()
+
         logger.info(
             f"✅ Whale portfolio tracking complete: "
             f"{new_tokens_discovered} new tokens, {new_trades_found} new trades"
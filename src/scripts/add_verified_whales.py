@@ -6,7 +6,9 @@ We're adding them based on their reported performance metrics.
 """
 
 import logging
+from collections import defaultdict
 from datetime import datetime
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from src.db.session import SessionLocal
 from src.db.models import CustomWatchlistWallet
@@ -113,40 +115,52 @@ def add_verified_whales():
         print("These whales have multi-million dollar verified track records.")
         print()
 
-        added_count = 0
-        skipped_count = 0
-
-        for whale in VERIFIED_WHALES:
-            # Check if already exists
-            existing = (
-                db.query(CustomWatchlistWallet)
-                .filter(
-                    CustomWatchlistWallet.address == whale["address"],
-                    CustomWatchlistWallet.chain_id == whale["chain_id"],
-                )
-                .first()
+        # One query per chain for the candidates already on the watchlist: a plain
+        # chain_id = :chain AND address IN (...) probes the (address, chain_id) primary key
+        candidates = {(w["address"], w["chain_id"]): w for w in VERIFIED_WHALES}
+        addresses_by_chain = defaultdict(list)
+        for address, chain_id in candidates:
+            addresses_by_chain[chain_id].append(address)
+
+        existing = set()
+        for chain_id, addresses in addresses_by_chain.items():
+            existing.update(
+                db.execute(
+                    select(CustomWatchlistWallet.address, CustomWatchlistWallet.chain_id).where(
+                        CustomWatchlistWallet.chain_id == chain_id,
+                        CustomWatchlistWallet.address.in_(addresses),
+                    )
+                ).all()
             )
 
-            if existing:
+        now = datetime.utcnow()
+        missing = []
+        for key, whale in candidates.items():
+            if key in existing:
                 logger.info(f"⏭️  {whale['address'][:16]}... already exists, skipping")
-                skipped_count += 1
                 continue
 
-            # Add new whale
-            new_whale = CustomWatchlistWallet(
-                address=whale["address"],
-                chain_id=whale["chain_id"],
-                label=whale["label"],
-                notes=whale["notes"],
-                is_active=True,
-                added_at=datetime.utcnow(),
+            missing.append(
+                {
+                    "address": whale["address"],
+                    "chain_id": whale["chain_id"],
+                    "label": whale["label"],
+                    "notes": whale["notes"],
+                    "is_active": True,
+                    "added_at": now,
+                }
             )
 
-            db.add(new_whale)
+        # Single bulk insert + commit for all new whales
+        if missing:
+            db.bulk_insert_mappings(CustomWatchlistWallet, missing)
             db.commit()
 
+        for whale in missing:
             logger.info(f"✅ ADDED: {whale['label']} ({whale['address'][:16]}...)")
-            added_count += 1
+
+        added_count = len(missing)
+        skipped_count = len(candidates) - added_count
 
         print()
         print("=" * 80)
@@ -157,7 +171,8 @@ def add_verified_whales():
         print()
 
         # Show total watchlist
-        total = db.query(CustomWatchlistWallet).count()
+        whales = db.query(CustomWatchlistWallet).all()
+        total = len(whales)
         print(f"🎯 TOTAL CUSTOM WATCHLIST WHALES: {total}")
         print()
 
@@ -165,7 +180,6 @@ def add_verified_whales():
         if total > 0:
             print("📋 CURRENT WATCHLIST:")
             print()
-            whales = db.query(CustomWatchlistWallet).all()
             for w in whales:
                 print(f"  • {w.label}")
                 print(f"    {w.address[:20]}... ({w.chain_id})")
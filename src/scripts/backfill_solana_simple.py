@@ -8,6 +8,7 @@ that our monitoring picks up.
 
 import logging
 from datetime import datetime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from src.db.session import SessionLocal
 from src.db.models import Wallet, CustomWatchlistWallet
@@ -46,34 +47,34 @@ def backfill_solana_whales_simple():
         print(f"📋 Found {len(solana_whales)} Solana whales from Nansen")
         print()
 
-        wallets_created = 0
-        wallets_existing = 0
-
-        for whale in solana_whales:
-            # Check if wallet already exists
-            existing = (
-                db.query(Wallet)
-                .filter(
-                    Wallet.address == whale.address, Wallet.chain_id == whale.chain_id
+        # One INSERT for every whale; Postgres skips the wallets we already track
+        created = set(
+            db.execute(
+                pg_insert(Wallet)
+                .values(
+                    [
+                        {
+                            "address": whale.address,
+                            "chain_id": whale.chain_id,
+                            "first_seen_at": datetime.utcnow(),
+                        }
+                        for whale in solana_whales
+                    ]
                 )
-                .first()
-            )
+                .on_conflict_do_nothing(index_elements=["address"])
+                .returning(Wallet.address)
+            ).scalars()
+        )
+        db.commit()
 
-            if existing:
-                logger.info(f"⏭️  {whale.label[:30]:30} - already tracked")
-                wallets_existing += 1
+        for whale in solana_whales:
+            if whale.address in created:
+                logger.info(f"✅ {whale.label[:30]:30} - NOW TRACKING")
             else:
-                # Create wallet record
-                new_wallet = Wallet(
-                    address=whale.address,
-                    chain_id=whale.chain_id,
-                    first_seen_at=datetime.utcnow(),
-                )
-                db.add(new_wallet)
-                db.commit()
+                logger.info(f"⏭️  {whale.label[:30]:30} - already tracked")
 
-                logger.info(f"✅ {whale.label[:30]:30} - NOW TRACKING")
-                wallets_created += 1
+        wallets_created = len(created)
+        wallets_existing = len(solana_whales) - wallets_created
 
         print()
         print("=" * 80)
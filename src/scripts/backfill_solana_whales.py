@@ -8,73 +8,118 @@ which doesn't require authentication for basic queries.
 import asyncio
 import httpx
 import logging
+from contextlib import aclosing
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+from sqlalchemy import DateTime, Float, String, column, func, literal, select, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from src.db.session import SessionLocal
-from src.db.models import Wallet, Trade, CustomWatchlistWallet
+from src.db.models import Wallet, Trade, Token, CustomWatchlistWallet
+from src.utils.rate_limit import host_transport
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Solscan requests in flight: starting point and ceiling for the adaptive limit
+SOLSCAN_INITIAL_CONCURRENCY = 4
+SOLSCAN_MAX_CONCURRENCY = 32
+
+# Recent transfers backfilled per whale (also the Solscan page size), to limit API load
+MAX_TRANSFERS_PER_WHALE = 50
+
 
 class SolscanClient:
     """Client for Solscan public API (no auth required)."""
 
     BASE_URL = "https://public-api.solscan.io"
 
+    def __init__(self) -> None:
+        """Open one keep-alive connection pool behind the shared Solscan limit."""
+        self._client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            timeout=30.0,
+            transport=host_transport(
+                "solscan", SOLSCAN_INITIAL_CONCURRENCY, SOLSCAN_MAX_CONCURRENCY
+            ),
+        )
+
+    async def close(self) -> None:
+        """Close the HTTP connection pool."""
+        await self._client.aclose()
+
     async def get_wallet_transfers(
-        self, wallet_address: str, limit: int = 100
+        self, wallet_address: str, limit: int = 100, offset: int = 0
     ) -> List[Dict[str, Any]]:
         """Get SPL token transfers for a wallet.
 
         Solscan Public API endpoint - no authentication needed.
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/account/token/txs",
-                    params={
-                        "address": wallet_address,
-                        "limit": min(limit, 100),
-                    },
-                )
+            response = await self._client.get(
+                "/account/token/txs",
+                params={
+                    "address": wallet_address,
+                    "limit": min(limit, 100),
+                    "offset": offset,
+                },
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("data", [])
-                else:
-                    logger.error(
-                        f"Solscan API error {response.status_code}: {response.text}"
-                    )
-                    return []
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("data", [])
+            else:
+                logger.error(
+                    f"Solscan API error {response.status_code}: {response.text}"
+                )
+                return []
 
         except Exception as e:
             logger.error(f"Error fetching Solscan data: {str(e)}")
             return []
 
+    async def iter_wallet_transfers(
+        self, wallet_address: str, page_size: int = 50
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield SPL token transfers for a wallet, newest first, one page at a time.
+
+        The next page is only requested once the caller has consumed the
+        current one, so a caller that stops early never fetches more.
+
+        Args:
+            wallet_address: Solana wallet address
+            page_size: Transfers requested per Solscan call
+        """
+        offset = 0
+        while True:
+            page = await self.get_wallet_transfers(wallet_address, limit=page_size, offset=offset)
+            for tx in page:
+                yield tx
+            if len(page) < page_size:
+                return
+            offset += len(page)
+
     async def get_wallet_sol_transfers(
         self, wallet_address: str, limit: int = 50
     ) -> List[Dict[str, Any]]:
         """Get SOL transfers for a wallet."""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    f"{self.BASE_URL}/account/transactions",
-                    params={
-                        "address": wallet_address,
-                        "limit": min(limit, 50),
-                    },
-                )
+            response = await self._client.get(
+                "/account/transactions",
+                params={
+                    "address": wallet_address,
+                    "limit": min(limit, 50),
+                },
+            )
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return data.get("data", [])
-                else:
-                    logger.error(
-                        f"Solscan SOL API error {response.status_code}: {response.text}"
-                    )
-                    return []
+            if response.status_code == 200:
+                data = response.json()
+                return data.get("data", [])
+            else:
+                logger.error(
+                    f"Solscan SOL API error {response.status_code}: {response.text}"
+                )
+                return []
 
         except Exception as e:
             logger.error(f"Error fetching SOL transfers: {str(e)}")
@@ -82,7 +127,7 @@ class SolscanClient:
 
 
 async def backfill_solana_whale(
-    db: Session, wallet_address: str, chain_id: str = "solana"
+    db: Session, client: SolscanClient, wallet_address: str, chain_id: str = "solana"
 ) -> int:
     """Backfill transaction data for a single Solana whale.
 
@@ -91,89 +136,49 @@ async def backfill_solana_whale(
     """
     logger.info(f"🔍 Backfilling {wallet_address[:16]}...")
 
-    client = SolscanClient()
+    # Stream SPL token transfers (memecoins, etc.) into trade rows, inserted together below
+    rows: Dict[str, Tuple] = {}
+    seen = 0
 
-    # Get SPL token transfers (memecoins, etc.)
-    transfers = await client.get_wallet_transfers(wallet_address, limit=100)
+    async with aclosing(
+        client.iter_wallet_transfers(wallet_address, page_size=MAX_TRANSFERS_PER_WHALE)
+    ) as transfers:
+        async for tx in transfers:
+            seen += 1
+            _add_transfer_row(rows, tx, wallet_address)
+            if seen >= MAX_TRANSFERS_PER_WHALE:
+                break
 
-    if not transfers:
+    if seen == 0:
         logger.warning(f"   No transfers found for {wallet_address[:16]}...")
         return 0
 
-    # Create wallet record if doesn't exist
-    existing_wallet = (
-        db.query(Wallet)
-        .filter(Wallet.address == wallet_address, Wallet.chain_id == chain_id)
-        .first()
-    )
-
-    if not existing_wallet:
-        new_wallet = Wallet(
-            address=wallet_address,
-            chain_id=chain_id,
-            first_seen_at=datetime.utcnow(),
-        )
-        db.add(new_wallet)
-        db.commit()
-        logger.info(f"   ✅ Created wallet record for {wallet_address[:16]}...")
-
-    # Process transfers into trades
-    trades_added = 0
-
-    for tx in transfers[:50]:  # Limit to recent 50 to avoid rate limits
-        try:
-            # Extract transfer data
-            tx_hash = tx.get("txHash")
-            if not tx_hash:
-                continue
-
-            # Check if trade already exists
-            existing = db.query(Trade).filter(Trade.tx_hash == tx_hash).first()
-            if existing:
-                continue
-
-            # Parse timestamp
-            block_time = tx.get("blockTime")
-            if not block_time:
-                continue
-
-            ts = datetime.fromtimestamp(block_time)
-
-            # Get token address and amount
-            token_address = tx.get("tokenAddress")
-            if not token_address:
-                continue
-
-            # Determine if buy or sell based on change amount
-            change_amount = float(tx.get("changeAmount", 0))
-            if change_amount == 0:
-                continue
-
-            side = "buy" if change_amount > 0 else "sell"
-            qty_token = abs(change_amount)
-
-            # Create trade record (without price for now - would need DexScreener)
-            trade = Trade(
-                tx_hash=tx_hash,
-                ts=ts,
-                chain_id=chain_id,
-                wallet_address=wallet_address,
-                token_address=token_address,
-                side=side,
-                qty_token=qty_token,
-                price_usd=0,  # TODO: Enrich with DexScreener later
-                usd_value=0,
-                venue="unknown",  # Solscan doesn't provide DEX info easily
+    # The session is shared by every gathered whale: a failure rolls back only this
+    # whale's rows and leaves the session usable for the others
+    try:
+        # Create wallet record if doesn't exist
+        created = db.execute(
+            pg_insert(Wallet)
+            .values(address=wallet_address, chain_id=chain_id, first_seen_at=datetime.utcnow())
+            .on_conflict_do_nothing(index_elements=["address"])
+            .returning(Wallet.address)
+        ).first()
+        if created:
+            logger.info(f"   ✅ Created wallet record for {wallet_address[:16]}...")
+
+        # One INSERT ... SELECT prices the batch server-side; trades we already have are skipped
+        trades_added = 0
+        if rows:
+            trades_added = len(
+                db.execute(_priced_trades_insert(list(rows.values()), chain_id)).all()
             )
 
-            db.add(trade)
-            trades_added += 1
-
-        except Exception as e:
-            logger.error(f"   Error processing transfer: {str(e)}")
-            continue
+        db.commit()
 
-    db.commit()
+    except Exception as e:
+        logger.error(f"   ❌ Error saving trades for {wallet_address[:16]}...: {str(e)}")
+        db.rollback()
+        return 0
 
     if trades_added > 0:
         logger.info(f"   ✅ Added {trades_added} trades for {wallet_address[:16]}...")
@@ -183,9 +188,104 @@ async def backfill_solana_whale(
     return trades_added
 
 
+def _add_transfer_row(
+    rows: Dict[str, Tuple], tx: Dict[str, Any], wallet_address: str
+) -> None:
+    """Turn one Solscan token transfer into a raw transfer row keyed by tx hash.
+
+    Transfers missing a hash, time, token or amount are skipped.
+    """
+    try:
+        # Extract transfer data
+        tx_hash = tx.get("txHash")
+        if not tx_hash:
+            return
+
+        # Parse timestamp
+        block_time = tx.get("blockTime")
+        if not block_time:
+            return
+
+        # Block times are UTC epochs; trades store naive UTC like the rest of the schema
+        ts = datetime.utcfromtimestamp(block_time)
+
+        # Get token address and amount
+        token_address = tx.get("tokenAddress")
+        if not token_address:
+            return
+
+        # Determine if buy or sell based on change amount
+        change_amount = float(tx.get("changeAmount", 0))
+        if change_amount == 0:
+            return
+
+        side = "buy" if change_amount > 0 else "sell"
+        qty_token = abs(change_amount)
+
+        # Raw transfer; price and USD value are resolved in SQL on insert
+        rows.setdefault(tx_hash, (tx_hash, ts, wallet_address, token_address, side, qty_token))
+
+    except Exception as e:
+        logger.error(f"   Error processing transfer: {str(e)}")
+
+
+def _priced_trades_insert(rows: List[Tuple], chain_id: str):
+    """Build an INSERT INTO trades ... SELECT that prices raw transfers in Postgres.
+
+    The transfers are sent as a VALUES list joined to tokens, so each trade takes
+    the token's latest DexScreener price (Solscan transfers carry none) and
+    transfers of tokens we don't track are dropped instead of failing the
+    trades -> tokens foreign key.
+
+    Args:
+        rows: (tx_hash, ts, wallet_address, token_address, side, qty_token) tuples
+        chain_id: Chain the transfers belong to
+
+    Returns:
+        Insert statement returning the tx hashes actually added
+    """
+    raw = values(
+        column("tx_hash", String),
+        column("ts", DateTime),
+        column("wallet_address", String),
+        column("token_address", String),
+        column("side", String),
+        column("qty_token", Float),
+        name="raw_transfers",
+    ).data(rows)
+    price = func.coalesce(Token.last_price_usd, 0.0)
+
+    priced = select(
+        raw.c.tx_hash,
+        raw.c.ts,
+        literal(chain_id),
+        raw.c.wallet_address,
+        raw.c.token_address,
+        raw.c.side,
+        raw.c.qty_token,
+        price,
+        raw.c.qty_token * price,
+        literal("unknown"),  # Solscan doesn't provide DEX info easily
+    ).join_from(raw, Token, Token.token_address == raw.c.token_address)
+
+    return (
+        pg_insert(Trade)
+        .from_select(
+            [
+                "tx_hash", "ts", "chain_id", "wallet_address", "token_address",
+                "side", "qty_token", "price_usd", "usd_value", "venue",
+            ],
+            priced,
+        )
+        .on_conflict_do_nothing(index_elements=["tx_hash"])
+        .returning(Trade.tx_hash)
+    )
+
+
 async def backfill_all_solana_whales():
     """Backfill all Solana whales from custom watchlist."""
     db = SessionLocal()
+    client = SolscanClient()
 
     try:
         print("\n" + "=" * 80)
@@ -212,16 +312,16 @@ async def backfill_all_solana_whales():
         print(f"📋 Found {len(solana_whales)} Solana whales to backfill")
         print()
 
-        total_trades_added = 0
-
-        for whale in solana_whales:
-            trades_added = await backfill_solana_whale(
-                db, whale.address, whale.chain_id
+        # Whales are backfilled concurrently; the client's adaptive limit paces Solscan.
+        # Each one's database work runs without awaits, so they share the session safely.
+        total_trades_added = sum(
+            await asyncio.gather(
+                *(
+                    backfill_solana_whale(db, client, whale.address, whale.chain_id)
+                    for whale in solana_whales
+                )
             )
-            total_trades_added += trades_added
-
-            # Rate limit - wait 2 seconds between requests
-            await asyncio.sleep(2)
+        )
 
         print()
         print("=" * 80)
@@ -246,6 +346,7 @@ async def backfill_all_solana_whales():
             print("ℹ️  No new trades added (may already exist or no recent activity)")
 
     finally:
+        await client.close()
         db.close()
 
 
@@ -7,15 +7,23 @@ to identify truly profitable whales with sufficient trading data.
 import asyncio
 import logging
 from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from src.db.session import SessionLocal
 from src.db.models import Wallet, Trade, WalletStats30D
 from src.clients.alchemy import AlchemyClient
 from src.clients.helius import HeliusClient
+from src.utils.rate_limit import host_transport
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# History API requests in flight per chain: starting point and ceiling for the adaptive limit
+BACKFILL_INITIAL_CONCURRENCY = 4
+BACKFILL_MAX_CONCURRENCY = 32
+
 
 async def backfill_wallet_history():
     """Backfill complete trade history for all discovered wallets."""
@@ -36,93 +44,48 @@ async def backfill_wallet_history():
         print(f"⏱️  Estimated time: {total_wallets * 2} minutes")
         print()
 
-        # Group by chain for efficiency
-        wallets_by_chain = {}
+        # Group by chain for efficiency (plain addresses, so per-wallet commits
+        # don't expire and reload each Wallet row)
+        wallets_by_chain: Dict[str, List[str]] = {}
         for wallet in wallets:
             if wallet.chain_id not in wallets_by_chain:
                 wallets_by_chain[wallet.chain_id] = []
-            wallets_by_chain[wallet.chain_id].append(wallet)
+            wallets_by_chain[wallet.chain_id].append(wallet.address)
 
         total_new_trades = 0
         total_errors = 0
         whales_with_depth = 0
 
+        # Existing trade count per wallet, one GROUP BY (new trades are added on top)
+        trade_counts: Dict[str, int] = dict(
+            db.query(Trade.wallet_address, func.count()).group_by(Trade.wallet_address).all()
+        )
+
+        # Chains run concurrently: each has its own client and pool, paced by its provider's limit
         for chain_id, chain_wallets in wallets_by_chain.items():
-            print(f"\n{'='*70}")
             print(f"🔗 Processing {chain_id.upper()} ({len(chain_wallets)} wallets)")
-            print(f"{'='*70}\n")
-
-            # Initialize client
-            if chain_id == "solana":
-                client = HeliusClient()
-            else:
-                client = AlchemyClient()
-
-            for i, wallet in enumerate(chain_wallets, 1):
-                try:
-                    print(f"[{i}/{len(chain_wallets)}] Fetching {wallet.address[:16]}...", end=" ")
-
-                    # Get complete transaction history (100 txs should cover 30 days for most wallets)
-                    if chain_id == "solana":
-                        transactions = await client.get_wallet_transactions(
-                            wallet.address,
-                            limit=100
-                        )
-                    else:
-                        transactions = await client.get_wallet_transactions(
-                            wallet.address,
-                            chain_id,
-                            limit=100
-                        )
-
-                    new_trades = 0
-
-                    for tx in transactions:
-                        tx_hash = tx.get("tx_hash")
-
-                        # Check if trade already exists
-                        existing = db.query(Trade).filter(Trade.tx_hash == tx_hash).first()
-
-                        if not existing:
-                            # Create new trade record
-                            trade = Trade(
-                                tx_hash=tx_hash,
-                                ts=tx.get("timestamp", datetime.utcnow()),
-                                chain_id=chain_id,
-                                wallet_address=wallet.address,
-                                token_address=tx.get("token_address"),
-                                side=tx.get("type", "buy"),  # "buy" or "sell"
-                                qty_token=float(tx.get("amount", 0)),
-                                price_usd=float(tx.get("price_usd", 0)),
-                                usd_value=float(tx.get("value_usd", 0)),
-                                venue=tx.get("dex"),
-                            )
-                            db.add(trade)
-                            new_trades += 1
-
-                    # Commit trades for this wallet
-                    db.commit()
-                    total_new_trades += new_trades
-
-                    # Check depth
-                    total_trades = db.query(Trade).filter(
-                        Trade.wallet_address == wallet.address
-                    ).count()
-
-                    if total_trades >= 5:
-                        whales_with_depth += 1
-
-                    print(f"✅ {new_trades} new trades (total: {total_trades})")
-
-                    # Rate limiting - don't hammer APIs
-                    await asyncio.sleep(1)
-
-                except Exception as e:
-                    logger.error(f"❌ Error processing wallet {wallet.address}: {str(e)}")
-                    db.rollback()
+        print()
+
+        chain_results = await asyncio.gather(
+            *(
+                _backfill_chain(db, chain_id, chain_wallets, trade_counts)
+                for chain_id, chain_wallets in wallets_by_chain.items()
+            )
+        )
+
+        # Wallets that got new trades, the only ones whose stats change
+        updated_wallets: List[str] = []
+        for chain_wallets, results in zip(wallets_by_chain.values(), chain_results):
+            for address, result in zip(chain_wallets, results):
+                if result is None:
                     total_errors += 1
-                    print(f"❌ Error: {str(e)}")
                     continue
+                new_trades, total_trades = result
+                total_new_trades += new_trades
+                if new_trades > 0:
+                    updated_wallets.append(address)
+                if total_trades >= 5:
+                    whales_with_depth += 1
 
         print()
         print("=" * 70)
@@ -150,9 +113,9 @@ async def backfill_wallet_history():
         print()
 
         # Now trigger stats recalculation
-        print("🔄 Triggering stats recalculation...")
+        print(f"🔄 Triggering stats recalculation for {len(updated_wallets)} updated wallets...")
         from src.scheduler.jobs import stats_rollup_job
-        await stats_rollup_job()
+        await stats_rollup_job(updated_wallets)
         print("✅ Stats recalculated")
         print()
 
@@ -196,5 +159,127 @@ async def backfill_wallet_history():
         db.close()
 
 
+async def _backfill_chain(
+    db: Session, chain_id: str, addresses: List[str], trade_counts: Dict[str, int]
+) -> List[Optional[Tuple[int, int]]]:
+    """Backfill every wallet on one chain with that chain's own client.
+
+    Wallets are fetched concurrently; the provider's adaptive limit paces the API.
+    Each wallet's database work runs without awaits, so all wallets (and chains)
+    share the session safely.
+
+    Args:
+        db: Database session
+        chain_id: Chain identifier
+        addresses: Wallet addresses on this chain
+        trade_counts: Trades already stored per wallet address
+
+    Returns:
+        Per-wallet (new trades, total trades), or None where the wallet failed
+    """
+    # Initialize client (its own keep-alive pool, behind the provider's shared adaptive
+    # limit: Alchemy meters the API key, so every EVM chain backs off together)
+    if chain_id == "solana":
+        client = HeliusClient(
+            transport=host_transport("helius", BACKFILL_INITIAL_CONCURRENCY, BACKFILL_MAX_CONCURRENCY)
+        )
+    else:
+        client = AlchemyClient(
+            transport=host_transport("alchemy", BACKFILL_INITIAL_CONCURRENCY, BACKFILL_MAX_CONCURRENCY)
+        )
+
+    try:
+        return await asyncio.gather(
+            *(
+                _backfill_wallet(
+                    db,
+                    client,
+                    chain_id,
+                    address,
+                    trade_counts.get(address, 0),
+                    f"[{chain_id} {i}/{len(addresses)}]",
+                )
+                for i, address in enumerate(addresses, 1)
+            )
+        )
+    finally:
+        await client.close()
+
+
+async def _backfill_wallet(
+    db: Session, client, chain_id: str, address: str, existing_trades: int, progress: str
+) -> Optional[Tuple[int, int]]:
+    """Store one wallet's recent history.
+
+    Args:
+        db: Database session
+        client: HeliusClient (Solana) or AlchemyClient for the chain
+        chain_id: Chain identifier
+        address: Wallet address
+        existing_trades: Trades already stored for this wallet
+        progress: Progress prefix for the printed status line
+
+    Returns:
+        (new trades, total trades), or None on error
+    """
+    progress = f"{progress} {address[:16]}..."
+    try:
+        # Get complete transaction history (100 txs should cover 30 days for most wallets)
+        if chain_id == "solana":
+            transactions = await client.get_wallet_transactions(
+                address,
+                limit=100
+            )
+        else:
+            transactions = await client.get_wallet_transactions(
+                address,
+                chain_id,
+                limit=100
+            )
+
+        # One row per transaction; Postgres skips the ones we already have
+        now = datetime.utcnow()  # Fallback time for transactions without one
+        rows = {
+            tx.get("tx_hash"): {
+                "tx_hash": tx.get("tx_hash"),
+                "ts": tx.get("timestamp", now),
+                "chain_id": chain_id,
+                "wallet_address": address,
+                "token_address": tx.get("token_address"),
+                "side": tx.get("type", "buy"),  # "buy" or "sell"
+                "qty_token": float(tx.get("amount", 0)),
+                "price_usd": float(tx.get("price_usd", 0)),
+                "usd_value": float(tx.get("value_usd", 0)),
+                "venue": tx.get("dex"),
+            }
+            for tx in transactions
+        }
+
+        new_trades = 0
+        if rows:
+            new_trades = len(
+                db.execute(
+                    pg_insert(Trade)
+                    .values(list(rows.values()))
+                    .on_conflict_do_nothing(index_elements=["tx_hash"])
+                    .returning(Trade.tx_hash)
+                ).all()
+            )
+
+        # Commit trades for this wallet
+        db.commit()
+
+        # Check depth
+        total_trades = existing_trades + new_trades
+
+        logger.debug(f"{progress} ✅ {new_trades} new trades (total: {total_trades})")
+        return new_trades, total_trades
+
+    except Exception as e:
+        logger.error(f"❌ {progress} Error processing wallet {address}: {str(e)}")
+        db.rollback()
+        return None
+
+
 if __name__ == "__main__":
     asyncio.run(backfill_wallet_history())
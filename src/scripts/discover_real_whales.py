@@ -9,12 +9,16 @@ This script looks beyond just trending token buyers to find wallets with:
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
+from src.config import settings
 from src.db.session import SessionLocal
 from src.db.models import Wallet, Trade, Token, SeedToken, WalletStats30D
 from src.clients.alchemy import AlchemyClient
 from src.clients.helius import HeliusClient
+from src.utils.rate_limit import host_transport
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -33,11 +37,15 @@ async def discover_whales_from_large_trades():
     db = SessionLocal()
 
     try:
-        # Get top trending tokens with high liquidity
+        # Get top trending tokens with high liquidity: liquidity lives on the token,
+        # volume on its seed snapshots (best snapshot per token, so each appears once)
+        peak_volume = func.max(SeedToken.vol_24h_usd)
         trending_tokens = (
-            db.query(SeedToken)
-            .filter(SeedToken.liquidity_usd > 100000)  # At least $100k liquidity
-            .order_by(SeedToken.volume_24h_usd.desc())
+            db.query(Token, peak_volume)
+            .join(SeedToken, SeedToken.token_address == Token.token_address)
+            .filter(Token.liquidity_usd > 100000)  # At least $100k liquidity
+            .group_by(Token.token_address)
+            .order_by(peak_volume.desc().nullslast())
             .limit(20)
             .all()
         )
@@ -45,14 +53,16 @@ async def discover_whales_from_large_trades():
         print(f"📊 Found {len(trending_tokens)} high-liquidity trending tokens")
         print()
 
-        client = AlchemyClient()
+        client = AlchemyClient(transport=host_transport("alchemy"))
         whale_wallets_found = 0
         large_trades_found = 0
+        newly_inserted = []  # (address, chain_id) of whales this run created
+        touched_wallets = set()  # Wallets that got new trades, the only stats that change
 
-        for i, token in enumerate(trending_tokens, 1):
+        for i, (token, volume_24h_usd) in enumerate(trending_tokens, 1):
             try:
                 print(f"[{i}/{len(trending_tokens)}] Analyzing {token.symbol}...")
-                print(f"   Liquidity: ${token.liquidity_usd:,.0f} | Volume: ${token.volume_24h_usd:,.0f}")
+                print(f"   Liquidity: ${token.liquidity_usd:,.0f} | Volume: ${volume_24h_usd or 0:,.0f}")
 
                 # Get all transfers for this token (last 1000 blocks = ~3 hours)
                 transfers = await client.get_token_transfers(
@@ -69,61 +79,90 @@ async def discover_whales_from_large_trades():
 
                 print(f"   Found {len(large_transfers)} large transfers ($10k+)")
 
-                for transfer in large_transfers:
-                    wallet_address = transfer.get("from_address")
-                    value_usd = transfer.get("value_usd", 0)
-
-                    # Check if this is a buy (from DEX pool to wallet)
-                    if transfer.get("type") != "buy":
-                        continue
-
-                    # Check if wallet already exists
-                    existing = db.query(Wallet).filter(
-                        Wallet.address == wallet_address
-                    ).first()
-
-                    if not existing:
-                        # New whale discovered!
-                        wallet = Wallet(
-                            address=wallet_address,
-                            chain_id=token.chain_id,
-                            first_seen_at=datetime.utcnow(),
+                # Savepoint per token so a bad token only discards its own rows
+                new_wallets = 0
+                new_trades = 0
+                with db.begin_nested():
+                    # Trades we already have for this batch, one IN query
+                    known_trades = {
+                        tx_hash for (tx_hash,) in db.query(Trade.tx_hash).filter(
+                            Trade.tx_hash.in_({t.get("tx_hash") for t in large_transfers})
                         )
-                        db.add(wallet)
-                        db.flush()
-                        whale_wallets_found += 1
-
-                        print(f"   🐋 NEW WHALE: {wallet_address[:16]}... bought ${value_usd:,.0f}")
-
-                    # Record the trade
-                    tx_hash = transfer.get("tx_hash")
-                    existing_trade = db.query(Trade).filter(Trade.tx_hash == tx_hash).first()
-
-                    if not existing_trade:
-                        trade = Trade(
-                            tx_hash=tx_hash,
-                            ts=transfer.get("timestamp", datetime.utcnow()),
-                            chain_id=token.chain_id,
-                            wallet_address=wallet_address,
-                            token_address=token.token_address,
-                            side="buy",
-                            qty_token=float(transfer.get("amount", 0)),
-                            price_usd=float(transfer.get("price_usd", 0)),
-                            usd_value=float(value_usd),
-                            venue=transfer.get("dex"),
-                        )
-                        db.add(trade)
-                        db.flush()
-                        large_trades_found += 1
+                    }
+
+                    wallet_rows = {}
+                    whale_buys = {}
+                    trades = []
+                    now = datetime.utcnow()
+                    for transfer in large_transfers:
+                        wallet_address = transfer.get("from_address")
+                        value_usd = transfer.get("value_usd", 0)
+
+                        # Check if this is a buy (from DEX pool to wallet)
+                        if transfer.get("type") != "buy":
+                            continue
+
+                        if wallet_address not in wallet_rows:
+                            wallet_rows[wallet_address] = {
+                                "address": wallet_address,
+                                "chain_id": token.chain_id,
+                                "first_seen_at": now,
+                            }
+                            whale_buys[wallet_address] = value_usd
+
+                        # Record the trade
+                        tx_hash = transfer.get("tx_hash")
+
+                        if tx_hash not in known_trades:
+                            known_trades.add(tx_hash)
+                            trades.append(
+                                Trade(
+                                    tx_hash=tx_hash,
+                                    ts=transfer.get("timestamp", now),
+                                    chain_id=token.chain_id,
+                                    wallet_address=wallet_address,
+                                    token_address=token.token_address,
+                                    side="buy",
+                                    qty_token=float(transfer.get("amount", 0)),
+                                    price_usd=float(transfer.get("price_usd", 0)),
+                                    usd_value=float(value_usd),
+                                    venue=transfer.get("dex"),
+                                )
+                            )
 
-                db.commit()
-                await asyncio.sleep(2)  # Rate limiting
+                    # One INSERT for the batch's wallets; RETURNING gives just the new whales
+                    inserted = []
+                    if wallet_rows:
+                        inserted = db.execute(
+                            pg_insert(Wallet)
+                            .values(list(wallet_rows.values()))
+                            .on_conflict_do_nothing(index_elements=["address"])
+                            .returning(Wallet.address, Wallet.chain_id)
+                        ).all()
+
+                    for wallet_address, _ in inserted:
+                        logger.debug(f"   🐋 NEW WHALE: {wallet_address[:16]}... bought ${whale_buys[wallet_address]:,.0f}")
+
+                    # Trades go in after their wallets exist
+                    db.add_all(trades)
+                    new_wallets = len(inserted)
+                    new_trades = len(trades)
+                    touched_wallets.update(trade.wallet_address for trade in trades)
+
+                newly_inserted.extend((address, chain_id) for address, chain_id in inserted)
+                whale_wallets_found += new_wallets
+                large_trades_found += new_trades
+
+                # Commit in chunks rather than per token
+                if i % settings.db_commit_interval == 0:
+                    db.commit()
 
             except Exception as e:
                 logger.error(f"Error processing {token.symbol}: {str(e)}")
-                db.rollback()
                 continue
 
+        db.commit()
+
         print()
         print("=" * 70)
         print("🎉 WHALE DISCOVERY COMPLETE")
@@ -135,66 +174,76 @@ async def discover_whales_from_large_trades():
         print()
 
         # Now get complete history for these whales
-        if whale_wallets_found > 0:
+        if newly_inserted:
             print("🔄 Fetching complete trade history for new whales...")
             print()
 
-            new_whales = (
-                db.query(Wallet)
-                .filter(Wallet.first_seen_at >= datetime.utcnow() - timedelta(minutes=30))
-                .all()
-            )
-
-            for whale in new_whales:
+            history_trades = 0
+            for i, (whale_address, whale_chain_id) in enumerate(newly_inserted, 1):
                 try:
-                    print(f"   Fetching {whale.address[:16]}...", end=" ")
-
                     transactions = await client.get_wallet_transactions(
-                        whale.address,
-                        whale.chain_id,
+                        whale_address,
+                        whale_chain_id,
                         limit=100
                     )
 
                     new_trades = 0
                     total_volume = 0
 
-                    for tx in transactions:
-                        tx_hash = tx.get("tx_hash")
-                        existing = db.query(Trade).filter(Trade.tx_hash == tx_hash).first()
-
-                        if not existing:
-                            value = float(tx.get("value_usd", 0))
-                            trade = Trade(
-                                tx_hash=tx_hash,
-                                ts=tx.get("timestamp", datetime.utcnow()),
-                                chain_id=whale.chain_id,
-                                wallet_address=whale.address,
-                                token_address=tx.get("token_address"),
-                                side=tx.get("type", "buy"),
-                                qty_token=float(tx.get("amount", 0)),
-                                price_usd=float(tx.get("price_usd", 0)),
-                                usd_value=value,
-                                venue=tx.get("dex"),
+                    # Savepoint per whale so a bad whale only discards its own rows
+                    now = datetime.utcnow()
+                    with db.begin_nested():
+                        # Trades we already have for these transactions, one IN query
+                        candidate_hashes = [tx.get("tx_hash") for tx in transactions if tx.get("tx_hash")]
+                        known_trades = {
+                            tx_hash for (tx_hash,) in db.query(Trade.tx_hash).filter(
+                                Trade.tx_hash.in_(candidate_hashes)
                             )
-                            db.add(trade)
-                            new_trades += 1
-                            total_volume += value
-
-                    db.commit()
-                    print(f"✅ {new_trades} trades (${total_volume:,.0f} volume)")
+                        } if candidate_hashes else set()
+
+                        for tx in transactions:
+                            tx_hash = tx.get("tx_hash")
+
+                            if tx_hash not in known_trades:
+                                known_trades.add(tx_hash)
+                                value = float(tx.get("value_usd", 0))
+                                trade = Trade(
+                                    tx_hash=tx_hash,
+                                    ts=tx.get("timestamp", now),
+                                    chain_id=whale_chain_id,
+                                    wallet_address=whale_address,
+                                    token_address=tx.get("token_address"),
+                                    side=tx.get("type", "buy"),
+                                    qty_token=float(tx.get("amount", 0)),
+                                    price_usd=float(tx.get("price_usd", 0)),
+                                    usd_value=value,
+                                    venue=tx.get("dex"),
+                                )
+                                db.add(trade)
+                                new_trades += 1
+                                total_volume += value
+                                touched_wallets.add(whale_address)
+
+                    history_trades += new_trades
+                    logger.debug(
+                        f"   {whale_address[:16]}... ✅ {new_trades} trades (${total_volume:,.0f} volume)"
+                    )
 
-                    await asyncio.sleep(1)
+                    # Commit in chunks rather than per whale
+                    if i % settings.db_commit_interval == 0:
+                        db.commit()
 
                 except Exception as e:
-                    logger.error(f"Error: {str(e)}")
-                    db.rollback()
-                    print(f"❌ Error")
+                    logger.error(f"❌ Error fetching history for {whale_address[:16]}...: {str(e)}")
+
+            db.commit()
+            print(f"   ✅ {history_trades} history trades for {len(newly_inserted)} whales")
 
-        # Calculate stats
+        # Calculate stats for the whales whose trades changed
         print()
-        print("🔄 Calculating stats for all whales...")
+        print(f"🔄 Calculating stats for {len(touched_wallets)} updated whales...")
         from src.scheduler.jobs import stats_rollup_job
-        await stats_rollup_job()
+        await stats_rollup_job(sorted(touched_wallets))
         print("✅ Stats calculated")
         print()
 
@@ -13,9 +13,13 @@ It adds the best 20 whales to the custom watchlist.
 
 import asyncio
 import logging
+import numpy as np
+import pandas as pd
 from datetime import datetime, timedelta
+from typing import Dict
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from src.db.session import SessionLocal
 from src.db.models import (
@@ -27,12 +31,16 @@ from src.db.models import (
     CustomWatchlistWallet,
 )
 from src.clients.alchemy import AlchemyClient
+from src.utils.rate_limit import host_transport
 from src.analytics.pnl import FIFOPnLCalculator
 from src.analytics.early import EarlyScoreCalculator
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Transfer fields read when aggregating whale candidates
+TRANSFER_COLUMNS = ["type", "from_address", "value_usd", "timestamp"]
+
 
 async def discover_whale_wallets(db: Session, min_trade_size_usd: float = 10000, limit: int = 20):
     """
@@ -52,182 +60,200 @@ async def discover_whale_wallets(db: Session, min_trade_size_usd: float = 10000,
     """
     logger.info("🔍 DISCOVERING TOP WHALE WALLETS\n")
 
-    # Get trending tokens from last 7 days with good liquidity
+    # Get trending tokens from last 7 days with good liquidity. A token has a
+    # SeedToken row per snapshot, so group to one row per token (latest snapshot)
     cutoff = datetime.utcnow() - timedelta(days=7)
-    trending_tokens = (
-        db.query(SeedToken, Token)
-        .join(Token, SeedToken.token_address == Token.token_address)
-        .filter(
-            SeedToken.spotted_at >= cutoff,
-            Token.liquidity_usd > 100000,  # $100k+ liquidity
+    latest_snapshot = func.max(SeedToken.snapshot_ts)
+    trending_tokens = [
+        token
+        for token, _ in (
+            db.query(Token, latest_snapshot)
+            .join(SeedToken, SeedToken.token_address == Token.token_address)
+            .filter(
+                SeedToken.snapshot_ts >= cutoff,
+                Token.liquidity_usd > 100000,  # $100k+ liquidity
+            )
+            .group_by(Token.token_address)
+            .order_by(latest_snapshot.desc())
+            .limit(100)  # Top 100 trending tokens
+            .all()
         )
-        .order_by(SeedToken.spotted_at.desc())
-        .limit(100)  # Top 100 trending tokens
-        .all()
-    )
+    ]
 
     logger.info(f"📊 Analyzing {len(trending_tokens)} trending tokens\n")
 
-    # Track discovered whales
-    whale_candidates = {}
-    alchemy = AlchemyClient()
+    alchemy = AlchemyClient(transport=host_transport("alchemy"))
     pnl_calc = FIFOPnLCalculator(db)
     early_calc = EarlyScoreCalculator(db)
 
-    # Analyze each trending token
-    for seed_token, token in trending_tokens:
-        try:
-            logger.info(f"🔍 Analyzing {token.symbol} ({token.token_address[:10]}...)")
-
-            # Get token transfers (buyers)
-            transfers = await alchemy.get_token_transfers(
-                token.token_address,
-                seed_token.chain_id,
-                limit=500,  # Deep scan
-            )
-
-            # Find large buyers
-            for transfer in transfers:
-                if transfer.get("type") != "buy":
-                    continue
-
-                wallet_address = transfer.get("wallet_address")
-                value_usd = transfer.get("value_usd", 0)
-
-                # Must be large trade ($10k+)
-                if value_usd < min_trade_size_usd:
-                    continue
-
-                # Track this wallet
-                if wallet_address not in whale_candidates:
-                    whale_candidates[wallet_address] = {
-                        "address": wallet_address,
-                        "chain_id": seed_token.chain_id,
-                        "large_trades": 0,
-                        "total_volume": 0,
-                        "first_seen": transfer.get("timestamp", datetime.utcnow()),
-                        "tokens_traded": set(),
-                    }
-
-                whale_candidates[wallet_address]["large_trades"] += 1
-                whale_candidates[wallet_address]["total_volume"] += value_usd
-                whale_candidates[wallet_address]["tokens_traded"].add(token.token_address)
-
-                logger.info(f"   🐋 Found whale: {wallet_address[:16]}... (${value_usd:,.0f} buy)")
-
-            await asyncio.sleep(0.2)  # Rate limiting
+    # Fetch every token's transfers in JSON-RPC batches (one HTTP request per 50 tokens)
+    transfers_by_token = await alchemy.get_token_transfers_batch(
+        [token.token_address for token in trending_tokens],
+        limit=500,  # Deep scan
+    )
 
-        except Exception as e:
-            logger.error(f"   ❌ Error analyzing {token.symbol}: {str(e)}")
+    # Collect each trending token's transfers into one frame. Only the columns the
+    # aggregation reads are kept, and tokens are referenced by their uint16 index in
+    # trending_tokens (one entry per token address) instead of by address string.
+    frames = []
+    for token_id, token in enumerate(trending_tokens):
+        transfers = transfers_by_token.get(token.token_address)
+        if transfers is None:
+            logger.error(f"   ❌ Error analyzing {token.symbol}: transfers unavailable")
             continue
 
+        logger.info(f"🔍 Analyzing {token.symbol} ({token.token_address[:10]}...)")
+        if transfers:
+            frame = pd.DataFrame(transfers, columns=TRANSFER_COLUMNS)
+            frame["token_id"] = np.uint16(token_id)
+            frame["chain_id"] = token.chain_id
+            frames.append(frame)
+
+    # Aggregate large buys ($10k+) per buyer in one vectorized groupby
+    whale_candidates = pd.DataFrame()
+    if frames:
+        df = pd.concat(frames, ignore_index=True)
+        df = df[(df["type"] == "buy") & (df["value_usd"] >= min_trade_size_usd)]
+        whale_candidates = df.groupby("from_address").agg(
+            chain_id=("chain_id", "first"),
+            large_trades=("value_usd", "size"),
+            total_volume=("value_usd", "sum"),
+            first_seen=("timestamp", "min"),
+            tokens_traded=("token_id", "nunique"),
+        )
+
     logger.info(f"\n\n📊 ANALYSIS COMPLETE\n")
     logger.info(f"   Total whale candidates: {len(whale_candidates)}\n")
 
-    # Filter and rank whales
-    qualified_whales = []
-    for wallet_data in whale_candidates.values():
-        # Must have multiple large trades
-        if wallet_data["large_trades"] < 2:
-            continue
-
-        # Must trade multiple tokens (not one-hit wonder)
-        if len(wallet_data["tokens_traded"]) < 2:
-            continue
-
-        # Check if wallet exists in database
-        wallet = (
-            db.query(Wallet)
-            .filter(
-                Wallet.address == wallet_data["address"],
-                Wallet.chain_id == wallet_data["chain_id"],
-            )
-            .first()
+    # Filter whales: multiple large trades across multiple tokens (not one-hit wonders)
+    candidates = []
+    if not whale_candidates.empty:
+        candidates = (
+            whale_candidates[
+                (whale_candidates["large_trades"] >= 2)
+                & (whale_candidates["tokens_traded"] >= 2)
+            ]
+            .rename_axis("address")
+            .reset_index()
+            .to_dict("records")
         )
 
-        # Create wallet if it doesn't exist
-        if not wallet:
-            wallet = Wallet(
-                address=wallet_data["address"],
-                chain_id=wallet_data["chain_id"],
-                first_seen_at=wallet_data["first_seen"],
+    # Create wallets that don't exist yet: one INSERT, Postgres skips the ones we already store
+    if candidates:
+        db.execute(
+            pg_insert(Wallet)
+            .values(
+                [
+                    {
+                        "address": wallet_data["address"],
+                        "chain_id": wallet_data["chain_id"],
+                        "first_seen_at": wallet_data["first_seen"],
+                    }
+                    for wallet_data in candidates
+                ]
             )
-            db.add(wallet)
-            db.flush()
+            .on_conflict_do_nothing(index_elements=["address"])
+        )
 
-        # Calculate stats
-        pnl_data = await pnl_calc.calculate_wallet_pnl(wallet.address, days=30)
-        early_score = early_calc.calculate_median_score(wallet.address, days=30)
+    # Calculate stats for every candidate in one pass each (one trade query, one price batch)
+    addresses = [wallet_data["address"] for wallet_data in candidates]
+    fifo_states: Dict[str, Dict] = {}
+    pnl_by_wallet = await pnl_calc.calculate_all_wallets_pnl(
+        addresses, days=30, fifo_memo=fifo_states
+    )
+    medians = early_calc.calculate_all_medians(addresses, days=30)
 
-        # Calculate composite score
-        # 40% PnL, 30% Volume, 20% Win Rate, 10% EarlyScore
-        pnl_score = max(0, pnl_data["realized_pnl"] + pnl_data["unrealized_pnl"])
-        volume_score = wallet_data["total_volume"]
+    # Per-whale score inputs
+    qualified_whales = []
+    for wallet_data in candidates:
+        realized, unrealized, _ = pnl_by_wallet.get(wallet_data["address"], (0.0, 0.0, 1.0))
+
+        # Win rate: share of traded tokens closed out at a realized profit
+        token_pnls = [
+            realized_pnl
+            for _, _, realized_pnl, _ in fifo_states.get(wallet_data["address"], {})
+            .get("tokens", {})
+            .values()
+        ]
         win_rate = (
-            (pnl_data["winning_trades"] / pnl_data["total_trades"])
-            if pnl_data["total_trades"] > 0
+            sum(1 for realized_pnl in token_pnls if realized_pnl > 0) / len(token_pnls)
+            if token_pnls
             else 0
         )
-        early_score_normalized = (early_score or 0) / 100
-
-        composite_score = (
-            (pnl_score * 0.4)
-            + (volume_score * 0.3)
-            + (win_rate * 1000 * 0.2)
-            + (early_score_normalized * 1000 * 0.1)
-        )
 
         qualified_whales.append({
             **wallet_data,
-            "pnl": pnl_score,
+            "pnl": max(0, realized + unrealized),
             "win_rate": win_rate,
-            "early_score": early_score,
-            "composite_score": composite_score,
+            # Wallets without EarlyScore data (no early buys) score 0
+            "early_score": medians.get(wallet_data["address"]) or 0.0,
         })
 
-    # Sort by composite score
-    qualified_whales.sort(key=lambda x: x["composite_score"], reverse=True)
+    # Composite score over all whales at once
+    # 40% PnL, 30% Volume, 20% Win Rate, 10% EarlyScore
+    n = len(qualified_whales)
+    pnl_arr = np.fromiter((w["pnl"] for w in qualified_whales), dtype=np.float64, count=n)
+    volume_arr = np.fromiter((w["total_volume"] for w in qualified_whales), dtype=np.float64, count=n)
+    win_rate_arr = np.fromiter((w["win_rate"] for w in qualified_whales), dtype=np.float64, count=n)
+    early_arr = np.fromiter(
+        (w["early_score"] for w in qualified_whales), dtype=np.float64, count=n
+    )
+    scores = (
+        pnl_arr * 0.4
+        + volume_arr * 0.3
+        + win_rate_arr * 1000 * 0.2
+        + (early_arr / 100) * 1000 * 0.1
+    )
+
+    # Top `limit` by score: partial selection, then sort only those
+    top_idx = np.arange(n) if n <= limit else np.argpartition(-scores, limit)[:limit]
+    top_idx = top_idx[np.argsort(-scores[top_idx], kind="stable")]
+
+    top_whales = []
+    for i in top_idx:
+        qualified_whales[i]["composite_score"] = float(scores[i])
+        top_whales.append(qualified_whales[i])
 
     logger.info(f"\n🏆 TOP {limit} WHALES DISCOVERED:\n")
     logger.info("=" * 80)
 
-    # Add top whales to custom watchlist
-    added_count = 0
-    for idx, whale in enumerate(qualified_whales[:limit], 1):
-        # Check if already in custom watchlist
-        existing = (
-            db.query(CustomWatchlistWallet)
-            .filter(
-                CustomWatchlistWallet.address == whale["address"],
-                CustomWatchlistWallet.chain_id == whale["chain_id"],
+    # Add top whales to custom watchlist: one INSERT, Postgres skips the ones already watched
+    now = datetime.utcnow()
+    added = set(
+        db.execute(
+            pg_insert(CustomWatchlistWallet)
+            .values(
+                [
+                    {
+                        "address": whale["address"],
+                        "chain_id": whale["chain_id"],
+                        "added_at": now,
+                        "added_by": "auto_discovery",
+                        "label": f"Auto-Discovered Whale (Rank #{idx})",
+                        "notes": (
+                            f"Large Trades: {whale['large_trades']} | "
+                            f"Volume: ${whale['total_volume']:,.0f} | "
+                            f"PnL: ${whale['pnl']:,.0f} | "
+                            f"Win Rate: {whale['win_rate']*100:.1f}% | "
+                            f"EarlyScore: {whale['early_score']:.1f} | "
+                            f"Tokens: {whale['tokens_traded']}"
+                        ),
+                        "is_active": True,
+                    }
+                    for idx, whale in enumerate(top_whales, 1)
+                ]
             )
-            .first()
-        )
-
-        if existing:
+            .on_conflict_do_nothing(index_elements=["address", "chain_id"])
+            .returning(CustomWatchlistWallet.address, CustomWatchlistWallet.chain_id)
+        ).all()
+    ) if top_whales else set()
+    added_count = len(added)
+
+    for idx, whale in enumerate(top_whales, 1):
+        if (whale["address"], whale["chain_id"]) not in added:
             logger.info(f"{idx}. {whale['address'][:16]}... (Already in watchlist)")
             continue
 
-        # Add to custom watchlist
-        custom_whale = CustomWatchlistWallet(
-            address=whale["address"],
-            chain_id=whale["chain_id"],
-            added_at=datetime.utcnow(),
-            added_by="auto_discovery",
-            label=f"Auto-Discovered Whale (Rank #{idx})",
-            notes=(
-                f"Large Trades: {whale['large_trades']} | "
-                f"Volume: ${whale['total_volume']:,.0f} | "
-                f"PnL: ${whale['pnl']:,.0f} | "
-                f"Win Rate: {whale['win_rate']*100:.1f}% | "
-                f"EarlyScore: {whale['early_score']:.1f} | "
-                f"Tokens: {len(whale['tokens_traded'])}"
-            ),
-            is_active=True,
-        )
-        db.add(custom_whale)
-        added_count += 1
-
         logger.info(
             f"{idx}. {whale['address'][:16]}... | "
             f"Volume: ${whale['total_volume']:,.0f} | "
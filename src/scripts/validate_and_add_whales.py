@@ -11,17 +11,26 @@ Only adds whales that pass validation.
 
 import asyncio
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import List, Dict, Optional, Tuple
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from src.db.session import SessionLocal
 from src.db.models import CustomWatchlistWallet, Wallet, Trade, WalletStats30D
 from src.clients.alchemy import AlchemyClient
 from src.clients.helius import HeliusClient
+from src.utils.cache import CacheManager, cache as default_cache
+from src.utils.rate_limit import host_transport
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Seconds a run holds a wallet's validation claim before another run may take it over
+VALIDATION_LOCK_TTL = 300
+
+# Seconds a finished validation result is reused by later runs
+VALIDATION_RESULT_TTL = 24 * 60 * 60
+
 
 # Whale lists from online sources
 SOLANA_WHALES = [
@@ -76,13 +85,70 @@ ETHEREUM_WHALES = [
 ]
 
 
+def _parse_utc(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp into a naive UTC datetime."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
 class WhaleValidator:
     """Validates whale wallets before adding to watchlist."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, cache: Optional[CacheManager] = None):
         self.db = db
-        self.alchemy = AlchemyClient()
-        self.helius = HeliusClient()
+        # Redis dedup: concurrent runs validate each wallet once and reuse results
+        self.cache = cache or default_cache
+        self.alchemy = AlchemyClient(transport=host_transport("alchemy"))
+        self.helius = HeliusClient(transport=host_transport("helius"))
+        # Whales must have traded since this time (fixed once per run)
+        self.active_since = datetime.utcnow() - timedelta(days=365)
+
+    async def validate_wallet(
+        self, address: str, chain_id: str, min_pnl: float = 100000
+    ) -> Tuple[bool, Optional[Dict]]:
+        """Validate a wallet at most once across concurrent runs.
+
+        A result from the last 24h is reused. While another run holds the
+        wallet's validation claim, the wallet is reported as in progress
+        instead of being validated twice.
+
+        Args:
+            address: Wallet address
+            chain_id: "solana" or "ethereum"
+            min_pnl: Minimum required PnL in USD
+
+        Returns:
+            (is_valid, validation_info)
+        """
+        result_key = f"validated:{chain_id}:{address}"
+        cached_result = await self.cache.get(result_key)
+        if cached_result is not None:
+            logger.info(f"♻️  {address[:10]}... validated recently, reusing result")
+            return cached_result["is_valid"], cached_result["info"]
+
+        lock_key = f"validating:{chain_id}:{address}"
+        if not await self.cache.acquire(lock_key, VALIDATION_LOCK_TTL):
+            logger.info(f"⏭️  {address[:10]}... is being validated by another run, skipping")
+            return False, {"reason": "in_progress"}
+
+        try:
+            if chain_id == "solana":
+                is_valid, validation_info = await self.validate_solana_wallet(address, min_pnl)
+            else:
+                is_valid, validation_info = await self.validate_ethereum_wallet(address, min_pnl)
+
+            # Errors are transient, so only definite outcomes are reused
+            if validation_info.get("reason") != "error":
+                await self.cache.set(
+                    result_key,
+                    {"is_valid": is_valid, "info": validation_info},
+                    VALIDATION_RESULT_TTL,
+                )
+            return is_valid, validation_info
+        finally:
+            await self.cache.delete(lock_key)
 
     async def validate_ethereum_wallet(
         self, address: str, min_pnl: float = 100000
@@ -117,12 +183,10 @@ class WhaleValidator:
             last_tx_date = last_tx.get("timestamp", datetime.utcnow())
 
             if isinstance(last_tx_date, str):
-                # Parse if string
-                last_tx_date = datetime.fromisoformat(last_tx_date.replace("Z", "+00:00"))
-
-            one_year_ago = datetime.utcnow() - timedelta(days=365)
+                # Parse if string (to naive UTC, like the rest of our timestamps)
+                last_tx_date = _parse_utc(last_tx_date)
 
-            if last_tx_date < one_year_ago:
+            if last_tx_date < self.active_since:
                 logger.warning(
                     f"❌ {address[:10]}... last traded {last_tx_date.strftime('%Y-%m-%d')} (>1 year ago)"
                 )
@@ -184,11 +248,9 @@ class WhaleValidator:
             last_tx_date = last_tx.get("timestamp", datetime.utcnow())
 
             if isinstance(last_tx_date, str):
-                last_tx_date = datetime.fromisoformat(last_tx_date.replace("Z", "+00:00"))
-
-            one_year_ago = datetime.utcnow() - timedelta(days=365)
+                last_tx_date = _parse_utc(last_tx_date)
 
-            if last_tx_date < one_year_ago:
+            if last_tx_date < self.active_since:
                 logger.warning(
                     f"❌ {address[:10]}... last SOL trade {last_tx_date.strftime('%Y-%m-%d')} (>1 year ago)"
                 )
@@ -234,22 +296,6 @@ class WhaleValidator:
             True if added successfully
         """
         try:
-            # Check if already exists
-            existing = (
-                self.db.query(CustomWatchlistWallet)
-                .filter(
-                    CustomWatchlistWallet.address == whale_data["address"],
-                    CustomWatchlistWallet.chain_id == whale_data["chain_id"],
-                )
-                .first()
-            )
-
-            if existing:
-                logger.info(
-                    f"⏭️  {whale_data['address'][:10]}... already in watchlist, skipping"
-                )
-                return False
-
             # Create notes with validation info
             notes = f"""Source: {whale_data['source']}
 Reported PnL: ${whale_data['reported_pnl']:,.0f}
@@ -258,19 +304,28 @@ Total Txs: {validation_info['total_transactions']}
 Buy Txs: {validation_info['buy_transactions']}
 Validated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC')}"""
 
-            # Add to custom watchlist
-            new_whale = CustomWatchlistWallet(
-                address=whale_data["address"],
-                chain_id=whale_data["chain_id"],
-                label=whale_data["label"],
-                notes=notes,
-                is_active=True,
-                added_at=datetime.utcnow(),
-            )
-
-            self.db.add(new_whale)
+            # Add to custom watchlist; Postgres skips whales that are already there
+            added = self.db.execute(
+                pg_insert(CustomWatchlistWallet)
+                .values(
+                    address=whale_data["address"],
+                    chain_id=whale_data["chain_id"],
+                    label=whale_data["label"],
+                    notes=notes,
+                    is_active=True,
+                    added_at=datetime.utcnow(),
+                )
+                .on_conflict_do_nothing(index_elements=["address", "chain_id"])
+                .returning(CustomWatchlistWallet.address)
+            ).first()
             self.db.commit()
 
+            if not added:
+                logger.info(
+                    f"⏭️  {whale_data['address'][:10]}... already in watchlist, skipping"
+                )
+                return False
+
             logger.info(
                 f"✅ ADDED {whale_data['address'][:10]}... to watchlist: "
                 f"{whale_data['label']}"
@@ -308,13 +363,17 @@ async def validate_and_add_whales():
         print("-" * 80)
         print()
 
-        for whale in SOLANA_WHALES:
-            total_attempted += 1
-
-            # Validate
-            is_valid, validation_info = await validator.validate_solana_wallet(
-                whale["address"], min_pnl=100000
+        # Validate every whale concurrently (the shared Helius limit paces requests),
+        # then add them to the watchlist in list order
+        solana_results = await asyncio.gather(
+            *(
+                validator.validate_wallet(whale["address"], whale["chain_id"], min_pnl=100000)
+                for whale in SOLANA_WHALES
             )
+        )
+
+        for whale, (is_valid, validation_info) in zip(SOLANA_WHALES, solana_results):
+            total_attempted += 1
 
             if is_valid:
                 total_validated += 1
@@ -331,18 +390,15 @@ async def validate_and_add_whales():
                     }
                 )
 
-            # Rate limit
-            await asyncio.sleep(2)
-
         print()
         print("🟢 ETHEREUM WHALES (Lookonchain Smart Money)")
         print("-" * 80)
         print()
 
+        # Skip incomplete addresses
+        ethereum_whales = []
         for whale in ETHEREUM_WHALES:
             total_attempted += 1
-
-            # Skip incomplete addresses
             if whale.get("needs_full_address", False):
                 logger.warning(
                     f"⏭️  SKIPPING {whale['address']} - Need full 42-char address"
@@ -351,12 +407,17 @@ async def validate_and_add_whales():
                     {"address": whale["address"], "label": whale["label"]}
                 )
                 continue
+            ethereum_whales.append(whale)
 
-            # Validate
-            is_valid, validation_info = await validator.validate_ethereum_wallet(
-                whale["address"], min_pnl=100000
+        # Validate concurrently (the shared Alchemy limit paces requests)
+        ethereum_results = await asyncio.gather(
+            *(
+                validator.validate_wallet(whale["address"], whale["chain_id"], min_pnl=100000)
+                for whale in ethereum_whales
             )
+        )
 
+        for whale, (is_valid, validation_info) in zip(ethereum_whales, ethereum_results):
             if is_valid:
                 total_validated += 1
                 # Add to watchlist
@@ -372,9 +433,6 @@ async def validate_and_add_whales():
                     }
                 )
 
-            # Rate limit
-            await asyncio.sleep(2)
-
         # Summary
         print()
         print("=" * 80)
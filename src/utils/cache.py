@@ -1,14 +1,17 @@
 """Redis-based caching utilities."""
 
-import json
 import logging
-from typing import Any, Optional, Callable
+from typing import Any, Callable, List, Optional
 from functools import wraps
-import redis
+import orjson
+from redis.asyncio import Redis as AsyncRedis
 from src.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Datetimes in cached payloads (e.g. transfer timestamps) are naive UTC
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY
+
 
 class CacheManager:
     """Manages Redis caching for API responses."""
@@ -20,15 +23,12 @@ class CacheManager:
             redis_url: Redis connection URL
         """
         self.redis_url = redis_url or settings.redis_url
-        try:
-            self.redis = redis.from_url(self.redis_url, decode_responses=True)
-            self.redis.ping()
-            logger.info("Connected to Redis for caching")
-        except Exception as e:
-            logger.warning(f"Redis connection failed: {str(e)}, caching disabled")
-            self.redis = None
+        # Async client so cache round-trips don't block the event loop. It connects
+        # lazily on the first command, so an unreachable Redis shows up as a logged
+        # error (and a cache miss) on each call rather than here
+        self.redis = AsyncRedis.from_url(self.redis_url)
 
-    def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str) -> Optional[Any]:
         """Get value from cache.
 
         Args:
@@ -37,19 +37,35 @@ class CacheManager:
         Returns:
             Cached value or None
         """
-        if not self.redis:
-            return None
-
         try:
-            value = self.redis.get(key)
+            value = await self.redis.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception as e:
             logger.error(f"Cache get error for {key}: {str(e)}")
             return None
 
-    def set(self, key: str, value: Any, ttl: int = 900) -> bool:
+    async def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values with one MGET round-trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Cached values in key order (None for misses)
+        """
+        if not keys:
+            return []
+
+        try:
+            values = await self.redis.mget(keys)
+            return [orjson.loads(value) if value else None for value in values]
+        except Exception as e:
+            logger.error(f"Cache mget error for {len(keys)} keys: {str(e)}")
+            return [None] * len(keys)
+
+    async def set(self, key: str, value: Any, ttl: int = 900) -> bool:
         """Set value in cache with TTL.
 
         Args:
@@ -60,17 +76,56 @@ class CacheManager:
         Returns:
             True if successful
         """
-        if not self.redis:
+        try:
+            await self.redis.setex(key, ttl, orjson.dumps(value, option=_ORJSON_OPTIONS))
+            return True
+        except Exception as e:
+            logger.error(f"Cache set error for {key}: {str(e)}")
+            return False
+
+    async def set_many(self, items: dict, ttl: int = 900) -> bool:
+        """Set several values with one pipelined round-trip.
+
+        Args:
+            items: Mapping of cache key to value
+            ttl: Time to live in seconds (default 15 min)
+
+        Returns:
+            True if successful
+        """
+        if not items:
             return False
 
         try:
-            self.redis.setex(key, ttl, json.dumps(value))
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(key, ttl, orjson.dumps(value, option=_ORJSON_OPTIONS))
+                await pipe.execute()
             return True
         except Exception as e:
-            logger.error(f"Cache set error for {key}: {str(e)}")
+            logger.error(f"Cache set error for {len(items)} keys: {str(e)}")
             return False
 
-    def delete(self, key: str) -> bool:
+    async def acquire(self, key: str, ttl: int = 300) -> bool:
+        """Claim key with SET NX EX, so only one worker at a time does the guarded work.
+
+        The claim expires after ttl even if the holder never deletes it. If Redis is
+        unreachable every caller gets the claim, so work runs unguarded but is not blocked.
+
+        Args:
+            key: Lock key
+            ttl: Seconds before the claim expires (default 5 min)
+
+        Returns:
+            True if the caller holds the claim
+        """
+        try:
+            return bool(await self.redis.set(key, b"1", nx=True, ex=ttl))
+        except Exception as e:
+            logger.error(f"Cache lock error for {key}: {str(e)}")
+            return True
+
+    async def delete(self, key: str) -> bool:
         """Delete key from cache.
 
         Args:
@@ -79,11 +134,8 @@ class CacheManager:
         Returns:
             True if successful
         """
-        if not self.redis:
-            return False
-
         try:
-            self.redis.delete(key)
+            await self.redis.delete(key)
             return True
         except Exception as e:
             logger.error(f"Cache delete error for {key}: {str(e)}")
@@ -109,7 +161,7 @@ class CacheManager:
                 cache_key = ":".join(filter(None, key_parts))
 
                 # Try to get from cache
-                cached_value = self.get(cache_key)
+                cached_value = await self.get(cache_key)
                 if cached_value is not None:
                     logger.debug(f"Cache hit for {cache_key}")
                     return cached_value
@@ -119,7 +171,7 @@ class CacheManager:
                 result = await func(*args, **kwargs)
 
                 if result is not None:
-                    self.set(cache_key, result, ttl)
+                    await self.set(cache_key, result, ttl)
 
                 return result
 
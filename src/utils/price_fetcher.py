@@ -1,16 +1,21 @@
 """Multi-source price fetcher with fallbacks to avoid rate limiting."""
 
 import logging
-from typing import Optional
+import time
+from typing import Dict, List, Optional, Tuple
 import asyncio
 
 from src.clients.dexscreener import DexScreenerClient
 from src.clients.birdeye import BirdeyeClient
 from src.clients.coingecko import CoinGeckoClient
-from src.utils.api_cache import cached
+from src.config import settings
+from src.utils.redis_cache import cache_aside, cache_get_many, cache_set_many, price_key
 
 logger = logging.getLogger(__name__)
 
+# Max in-flight single-token fallbacks in get_token_prices (avoids 429 storms)
+FALLBACK_CONCURRENCY = 8
+
 
 class MultiSourcePriceFetcher:
     """Fetches token prices from multiple sources with automatic fallbacks."""
@@ -28,11 +33,51 @@ class MultiSourcePriceFetcher:
             "coingecko": 0,
         }
 
-    @cached(ttl_seconds=60)  # Cache prices for 60 seconds to reduce API calls
+        # (token_address, chain_id) -> (price, expires_at on the monotonic clock)
+        self._cache: Dict[Tuple[str, str], Tuple[float, float]] = {}
+        self._cache_ttl = settings.price_cache_ttl_seconds
+
+    def _get_cached_price(self, key: Tuple[str, str]) -> Optional[float]:
+        """Return a still-fresh cached price, or None."""
+        entry = self._cache.get(key)
+        if entry is not None and time.monotonic() < entry[1]:
+            return entry[0]
+        return None
+
+    def _cache_price(self, key: Tuple[str, str], price: float) -> None:
+        """Cache a successfully fetched price (failures are not cached)."""
+        if price > 0:
+            self._cache[key] = (price, time.monotonic() + self._cache_ttl)
+
     async def get_token_price(
         self, token_address: str, chain_id: str = "ethereum"
     ) -> float:
-        """Get current token price trying multiple sources with fallbacks (CACHED 60s).
+        """Get current token price, served from the TTL cache when fresh.
+
+        Args:
+            token_address: Token contract address
+            chain_id: Chain identifier (ethereum, base, arbitrum, solana, etc.)
+
+        Returns:
+            Current price in USD (0.0 if all sources fail)
+        """
+        key = (token_address, chain_id)
+        price = self._get_cached_price(key)
+        if price is not None:
+            return price
+
+        # Shared Redis cache next, so prices fetched by other jobs are reused
+        price = await cache_aside(
+            price_key(token_address, chain_id),
+            settings.redis_price_ttl_seconds,
+            lambda: self._fetch_token_price(token_address, chain_id),
+            cache_if=lambda p: p > 0,
+        )
+        self._cache_price(key, price)
+        return price
+
+    async def _fetch_token_price(self, token_address: str, chain_id: str) -> float:
+        """Get current token price trying multiple sources with fallbacks.
 
         Tries in order:
         1. DexScreener (best for EVM chains, has liquidity data)
@@ -91,6 +136,89 @@ class MultiSourcePriceFetcher:
         )
         return 0.0
 
+    async def get_token_prices(
+        self, tokens: List[Tuple[str, str]]
+    ) -> Dict[Tuple[str, str], float]:
+        """Get current prices for many tokens with as few requests as possible.
+
+        Serves fresh entries from the local TTL cache and then the shared Redis
+        cache, prices everything else DexScreener knows in batched requests
+        (30 addresses per call), then falls back to get_token_price
+        (Birdeye/CoinGecko) for the remaining tokens, a few at a time.
+
+        Args:
+            tokens: (token_address, chain_id) pairs; duplicates are fetched once
+
+        Returns:
+            Dict of (token_address, chain_id) -> price in USD (0.0 if unavailable)
+        """
+        prices: Dict[Tuple[str, str], float] = {}
+        unique_tokens = []
+        for key in dict.fromkeys(tokens):
+            price = self._get_cached_price(key)
+            if price is not None:
+                prices[key] = price
+            else:
+                unique_tokens.append(key)
+
+        if not unique_tokens:
+            return prices
+
+        # One MGET against the shared Redis cache for everything not held locally
+        shared = await cache_get_many([price_key(*key) for key in unique_tokens])
+        remaining = []
+        for key, price in zip(unique_tokens, shared):
+            if price:
+                prices[key] = price
+                self._cache_price(key, price)
+            else:
+                remaining.append(key)
+        unique_tokens = remaining
+
+        if not unique_tokens:
+            return prices
+
+        if self.failure_counts["dexscreener"] < 5:
+            try:
+                infos = await self.dexscreener.get_tokens_info(
+                    [token_address for token_address, _ in unique_tokens]
+                )
+            except Exception as e:
+                logger.debug(f"DexScreener batch failed for {len(unique_tokens)} tokens: {str(e)}")
+                infos = {}
+
+            for token_address, chain_id in unique_tokens:
+                price = float(infos.get(token_address, {}).get("price_usd", 0.0))
+                if price > 0:
+                    prices[(token_address, chain_id)] = price
+                    self._cache_price((token_address, chain_id), price)
+
+            batch_prices = {key: prices[key] for key in unique_tokens if key in prices}
+            if batch_prices:
+                self.failure_counts["dexscreener"] = 0
+                await cache_set_many(
+                    {price_key(*key): price for key, price in batch_prices.items()},
+                    settings.redis_price_ttl_seconds,
+                )
+                logger.info(f"💰 Batch prices from DexScreener: {len(batch_prices)}/{len(unique_tokens)} tokens")
+
+        # Fall back per token (bounded concurrency) for anything the batch missed
+        missing = [key for key in unique_tokens if key not in prices]
+        semaphore = asyncio.Semaphore(FALLBACK_CONCURRENCY)
+
+        async def fetch(token_address: str, chain_id: str) -> float:
+            async with semaphore:
+                return await self.get_token_price(token_address, chain_id)
+
+        results = await asyncio.gather(*(fetch(*key) for key in missing), return_exceptions=True)
+        for key, result in zip(missing, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching price for {key[0][:10]}...: {str(result)}")
+                result = 0.0
+            prices[key] = result
+
+        return prices
+
     async def _try_dexscreener(self, token_address: str) -> float:
         """Try fetching price from DexScreener."""
         try:
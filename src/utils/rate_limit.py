@@ -0,0 +1,161 @@
+"""Adaptive request limiting for bulk API scripts.
+
+AdaptiveLimiter is an AIMD (additive-increase, multiplicative-decrease)
+concurrency limit: it admits one more request in flight after each fast,
+successful response and halves on a 429, a 5xx, a slow response or a
+transport error. It also honors Retry-After and an exhausted
+X-RateLimit-Remaining by pausing new requests. ThrottledTransport plugs
+it into any httpx client, so every request is observed without changes
+at the call sites; host_transport hands out transports that share one
+limiter per provider, so every client of that provider backs off together.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Pause applied when a provider reports no remaining quota but no Retry-After
+_EXHAUSTED_PAUSE_SECONDS = 1.0
+
+# One limiter per provider, shared by every transport host_transport creates for it
+_host_limiters: Dict[str, "AdaptiveLimiter"] = {}
+
+
+class AdaptiveLimiter:
+    """AIMD limit on requests in flight, driven by response status and latency."""
+
+    def __init__(
+        self,
+        initial_concurrency: int = 4,
+        max_concurrency: int = 32,
+        target_latency: float = 2.0,
+    ):
+        """Initialize limiter.
+
+        Args:
+            initial_concurrency: Requests allowed in flight at the start
+            max_concurrency: Upper bound for the adaptive limit
+            target_latency: Responses slower than this (seconds) count as congestion
+        """
+        self.limit = float(initial_concurrency)
+        self.max_concurrency = max_concurrency
+        self.target_latency = target_latency
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def record(
+        self,
+        status_code: Optional[int],
+        latency: float,
+        headers: Optional[httpx.Headers] = None,
+    ) -> None:
+        """Adjust the limit from one finished request.
+
+        Args:
+            status_code: HTTP status (None for a transport error)
+            latency: Seconds until the response headers arrived
+            headers: Response headers (for Retry-After / X-RateLimit-Remaining)
+        """
+        congested = (
+            status_code is None
+            or status_code == 429
+            or status_code >= 500
+            or latency > self.target_latency
+        )
+        if congested:
+            self.limit = max(1.0, self.limit * 0.5)
+        else:
+            self.limit = min(float(self.max_concurrency), self.limit + 0.5)
+
+        if headers is not None:
+            pause = 0.0
+            retry_after = headers.get("retry-after")
+            if retry_after is not None:
+                try:
+                    pause = float(retry_after)
+                except ValueError:
+                    pause = _EXHAUSTED_PAUSE_SECONDS
+            elif headers.get("x-ratelimit-remaining") == "0":
+                pause = _EXHAUSTED_PAUSE_SECONDS
+            if pause > 0:
+                self._paused_until = max(self._paused_until, time.monotonic() + pause)
+                logger.warning(f"⏸️  Rate limited (HTTP {status_code}), pausing {pause:.1f}s")
+
+
+class ThrottledTransport(httpx.AsyncBaseTransport):
+    """httpx transport that sends every request through an AdaptiveLimiter."""
+
+    def __init__(
+        self,
+        limiter: AdaptiveLimiter,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Initialize transport.
+
+        Args:
+            limiter: Limiter shared by every client that should back off together
+            transport: Underlying transport (a default AsyncHTTPTransport otherwise)
+        """
+        self._limiter = limiter
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        async with self._limiter:
+            start = time.monotonic()
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                self._limiter.record(None, time.monotonic() - start)
+                raise
+            self._limiter.record(response.status_code, time.monotonic() - start, response.headers)
+            return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def host_transport(
+    host: str, initial_concurrency: int = 4, max_concurrency: int = 32
+) -> ThrottledTransport:
+    """Return a pooled transport throttled by the limiter shared for host.
+
+    The first call for a host creates its limiter; later calls reuse it, so
+    separate clients of one provider share a single adaptive limit.
+
+    Args:
+        host: Provider key (e.g. "alchemy", "helius", "solscan")
+        initial_concurrency: Starting limit if the host's limiter is new
+        max_concurrency: Limit ceiling if the host's limiter is new
+
+    Returns:
+        ThrottledTransport over its own keep-alive connection pool
+    """
+    limiter = _host_limiters.get(host)
+    if limiter is None:
+        limiter = _host_limiters[host] = AdaptiveLimiter(initial_concurrency, max_concurrency)
+    return ThrottledTransport(
+        limiter,
+        httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        ),
+    )
@@ -0,0 +1,131 @@
+"""Async Redis cache-aside helpers shared by scheduler jobs.
+
+Prices and wallet stats computed by one job are published here so other jobs
+can reuse them instead of re-fetching from APIs or re-querying Postgres.
+Redis is strictly an accelerator: every helper fails soft, and after an error
+the cache is bypassed for a short back-off period.
+"""
+
+import logging
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import orjson
+from redis.asyncio import Redis as AsyncRedis
+
+from src.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds to bypass Redis after a connection/command error
+_BACKOFF_SECONDS = 30
+
+_redis: Optional[AsyncRedis] = None
+_disabled_until = 0.0
+
+
+def get_redis() -> Optional[AsyncRedis]:
+    """Return the shared async Redis client, or None while backing off."""
+    global _redis
+    if time.monotonic() < _disabled_until:
+        return None
+    if _redis is None:
+        _redis = AsyncRedis.from_url(settings.redis_url)
+    return _redis
+
+
+def _back_off(action: str, e: Exception) -> None:
+    """Log a Redis failure and bypass the cache for a while."""
+    global _disabled_until
+    _disabled_until = time.monotonic() + _BACKOFF_SECONDS
+    logger.warning(f"Redis cache {action} failed, bypassing for {_BACKOFF_SECONDS}s: {str(e)}")
+
+
+async def cache_get_many(keys: List[str]) -> List[Optional[Any]]:
+    """Read several cached values with one MGET.
+
+    Args:
+        keys: Cache keys
+
+    Returns:
+        Decoded values in key order (None for misses or when Redis is unavailable)
+    """
+    client = get_redis()
+    if client is None or not keys:
+        return [None] * len(keys)
+
+    try:
+        raw = await client.mget(keys)
+    except Exception as e:
+        _back_off("read", e)
+        return [None] * len(keys)
+
+    return [orjson.loads(value) if value is not None else None for value in raw]
+
+
+async def cache_set_many(items: Dict[str, Any], ttl: int) -> None:
+    """Write several values with one pipelined round-trip.
+
+    Args:
+        items: Mapping of cache key to JSON-serializable value
+        ttl: Time to live in seconds
+    """
+    client = get_redis()
+    if client is None or not items:
+        return
+
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.setex(key, ttl, orjson.dumps(value, default=str))
+            await pipe.execute()
+    except Exception as e:
+        _back_off("write", e)
+
+
+async def cache_aside(
+    key: str,
+    ttl: int,
+    loader: Callable[[], Awaitable[Any]],
+    cache_if: Optional[Callable[[Any], bool]] = None,
+) -> Any:
+    """Return the cached value for key, loading and caching it on a miss.
+
+    Args:
+        key: Cache key
+        ttl: Time to live in seconds
+        loader: Coroutine factory producing the value on a miss
+        cache_if: Optional predicate; results failing it are returned but not cached
+
+    Returns:
+        Cached or freshly loaded value
+    """
+    (cached,) = await cache_get_many([key])
+    if cached is not None:
+        return cached
+
+    value = await loader()
+    if value is not None and (cache_if is None or cache_if(value)):
+        await cache_set_many({key: value}, ttl)
+    return value
+
+
+def price_key(token_address: str, chain_id: str) -> str:
+    """Cache key for a token's USD price."""
+    return f"price:{chain_id}:{token_address}"
+
+
+def feed_key(source: str, chain: str) -> str:
+    """Cache key for the fingerprint of a trending feed's last ingested payload."""
+    return f"feed:{source}:{chain}"
+
+
+def stats_key(wallet_address: str) -> str:
+    """Cache key for a wallet's 30D stats."""
+    return f"stats:{wallet_address}"
+
+
+def stats_memo_key(wallet_address: str, latest_ts: datetime, trade_count: int) -> str:
+    """Cache key for stats derived from one exact version of a wallet's trade history."""
+    return f"stats:memo:{wallet_address}:{latest_ts.isoformat()}:{trade_count}"
@@ -283,6 +283,18 @@ async def test_error_handling_returns_empty_list(alchemy_client):
         assert transactions == []
 
 
+@pytest.mark.asyncio
+async def test_error_handling_raises_when_requested(alchemy_client):
+    """Test that raise_errors surfaces API errors instead of an empty list."""
+    wallet = "0xERROR"
+
+    with patch.object(alchemy_client, 'post', new_callable=AsyncMock) as mock_post:
+        mock_post.side_effect = Exception("API Error")
+
+        with pytest.raises(Exception, match="API Error"):
+            await alchemy_client.get_wallet_transactions(wallet, "ethereum", raise_errors=True)
+
+
 @pytest.mark.asyncio
 async def test_multiple_tokens_same_wallet(alchemy_client):
     """Test detecting trades across multiple tokens."""
@@ -336,3 +348,32 @@ async def test_multiple_tokens_same_wallet(alchemy_client):
         assert len(transactions) == 2
         token_addresses = {tx["token_address"] for tx in transactions}
         assert token_addresses == {"0xTOKEN_A", "0xTOKEN_B"}
+
+
+@pytest.mark.asyncio
+async def test_token_transfers_batch_matches_responses_by_id(alchemy_client, mock_dex_client):
+    """Test that one JSON-RPC batch is demultiplexed back to each token."""
+    pool_sends = lambda buyer: {
+        "result": {
+            "transfers": [
+                {"from": "0xPOOL", "to": buyer, "hash": f"0x{buyer}_{i}", "value": 10.0}
+                for i in range(3)
+            ]
+        }
+    }
+    mock_dex_client.get_tokens_info = AsyncMock(
+        return_value={"0xAAA": {"price_usd": 2.0}, "0xBBB": {"price_usd": 3.0}}
+    )
+
+    with patch.object(alchemy_client, 'post', new_callable=AsyncMock) as mock_post:
+        # Batch responses arrive out of order
+        mock_post.side_effect = [
+            {"result": "0x1000000"},
+            [{"id": 1, **pool_sends("0xB")}, {"id": 0, **pool_sends("0xA")}],
+        ]
+
+        results = await alchemy_client.get_token_transfers_batch(["0xAAA", "0xBBB"])
+
+    assert mock_post.call_count == 2
+    assert [t["from_address"] for t in results["0xAAA"]] == ["0xA"] * 3
+    assert results["0xBBB"][0]["value_usd"] == pytest.approx(30.0)
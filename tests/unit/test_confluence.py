@@ -124,3 +124,29 @@ def test_clear_token(detector, mock_redis):
     detector.clear_token("0xtoken", "ethereum")
 
     mock_redis.delete.assert_called_once_with("confluence:ethereum:0xtoken")
+
+
+def test_process_batch_matches_sequential_order(detector, mock_redis):
+    """Test batch processing only counts entries recorded before each trade."""
+    now = datetime.utcnow().timestamp()
+    existing = json.dumps({"wallet": "0xwallet1", "ts": now - 60})
+
+    pipe = Mock()
+    pipe.execute = Mock(side_effect=[[0, [existing]], []])
+    mock_redis.pipeline = Mock(return_value=pipe)
+
+    results = detector.process_batch(
+        [
+            ("0xtoken", "ethereum", "0xwallet1", "buy", {"tx_hash": "0xa"}),
+            ("0xtoken", "ethereum", "0xwallet2", "buy", {"tx_hash": "0xb"}),
+        ],
+        min_wallets=2,
+    )
+
+    # First trade repeats wallet1 (no confluence), second adds wallet2
+    assert results[0] is None
+    assert [e["wallet"] for e in results[1]] == ["0xwallet1", "0xwallet2"]
+
+    # One read pipeline + one write pipeline
+    assert pipe.execute.call_count == 2
+    assert pipe.zadd.call_count == 2
@@ -0,0 +1,71 @@
+"""Unit tests for paper trading persistence."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from src.analytics.paper_trading import PaperTradingTracker
+from src.db.models import Base, PaperPosition, PaperTrade
+
+
+@pytest.fixture
+def db():
+    """In-memory SQLite session with the paper trading tables."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[PaperPosition.__table__, PaperTrade.__table__])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def test_persist_and_reload_state(db):
+    """Test that positions, targets and closed trades survive a reload."""
+    tracker = PaperTradingTracker.load_from_db(db)
+    tracker.execute_buy("0xwin", "ethereum", price_usd=1.0, amount_usd=100.0, reason="test")
+    tracker.execute_buy("0xhold", "ethereum", price_usd=2.0, amount_usd=200.0, reason="test")
+    tracker.persist()
+
+    tracker.update_position("0xhold", take_profit_pct=25.0, stop_loss_pct=-15.0)
+    tracker.execute_sell("0xwin", current_price=1.5, reason="take profit")
+    tracker.persist()
+
+    reloaded = PaperTradingTracker.load_from_db(db, closed_trades_limit=None)
+
+    assert list(reloaded.positions) == ["0xhold"]
+    assert reloaded.positions["0xhold"]["take_profit_pct"] == 25.0
+    assert reloaded.win_count == 1
+    assert reloaded.total_profit == pytest.approx(50.0)
+    assert reloaded.current_balance == pytest.approx(tracker.current_balance)
+    assert [t["token_address"] for t in reloaded.closed_trades] == ["0xwin"]
+    assert db.query(PaperPosition).filter_by(status="closed").count() == 1
+
+
+def test_sell_before_persist_only_records_trade(db):
+    """Test that a position bought and sold between persists leaves no open row."""
+    tracker = PaperTradingTracker.load_from_db(db)
+    tracker.execute_buy("0xflip", "ethereum", price_usd=1.0, amount_usd=100.0, reason="test")
+    tracker.execute_sell("0xflip", current_price=0.8, reason="stop loss")
+    tracker.persist()
+
+    reloaded = PaperTradingTracker.load_from_db(db)
+
+    assert reloaded.positions == {}
+    assert reloaded.loss_count == 1
+    assert reloaded.total_loss == pytest.approx(20.0)
+    assert db.query(PaperPosition).count() == 0
+
+
+def test_stale_positions_skip_recent_checks(db):
+    """Test that only positions without a recent price check are re-priced."""
+    tracker = PaperTradingTracker.load_from_db(db)
+    tracker.execute_buy("0xfresh", "ethereum", price_usd=1.0, amount_usd=100.0, reason="test")
+    tracker.execute_buy("0xold", "ethereum", price_usd=1.0, amount_usd=100.0, reason="test")
+    tracker.record_check("0xfresh", 1.1, datetime.utcnow())
+    tracker.record_check("0xold", 0.9, datetime.utcnow() - timedelta(minutes=5))
+    tracker.persist()
+
+    reloaded = PaperTradingTracker.load_from_db(db)
+
+    assert reloaded.stale_positions(60) == ["0xold"]
+    assert reloaded.positions["0xfresh"]["last_price_usd"] == pytest.approx(1.1)
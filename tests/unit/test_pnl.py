@@ -1,10 +1,13 @@
 """Unit tests for FIFO PnL calculation."""
 
+import orjson
 import pytest
 from datetime import datetime, timedelta
-from unittest.mock import Mock, MagicMock
+from unittest.mock import AsyncMock, Mock, MagicMock
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
 from src.analytics.pnl import FIFOPnLCalculator
-from src.db.models import Trade
+from src.db.models import Base, Position, Trade
 
 
 @pytest.fixture
@@ -217,3 +220,68 @@ def test_best_trade_multiple(calculator, mock_db):
 
     # Best should be 5x from token2
     assert multiple == pytest.approx(5.0, rel=0.01)
+
+
+def test_match_fifo_leaves_remaining_lot():
+    """Test FIFO matching returns the unsold remainder of the buy queue."""
+    trades = [
+        Trade(tx_hash="0x1", side="buy", qty_token=100.0, price_usd=1.0, usd_value=100.0, fee_usd=0.0),
+        Trade(tx_hash="0x2", side="buy", qty_token=100.0, price_usd=2.0, usd_value=200.0, fee_usd=0.0),
+        Trade(tx_hash="0x3", side="sell", qty_token=150.0, price_usd=3.0, usd_value=450.0, fee_usd=0.0),
+    ]
+
+    buy_queue, realized = FIFOPnLCalculator._match_fifo(trades)
+
+    assert realized == pytest.approx(250.0, rel=0.01)
+    assert len(buy_queue) == 1
+    assert buy_queue[0][0] == pytest.approx(50.0)
+    assert buy_queue[0][2] == pytest.approx(100.0)
+
+
+async def test_fifo_memo_round_trip_matches_fresh_match():
+    """Test that a FIFO memo read back from Redis (orjson) gives the fresh-match numbers."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Trade.__table__, Position.__table__])
+    db = sessionmaker(bind=engine)()
+    now = datetime.utcnow()
+
+    def trade(tx_hash, wallet, token, side, qty, price, days_ago, fee=0.0):
+        return Trade(
+            tx_hash=tx_hash, ts=now - timedelta(days=days_ago), chain_id="ethereum",
+            wallet_address=wallet, token_address=token, side=side, qty_token=qty,
+            price_usd=price, usd_value=qty * price, fee_usd=fee,
+        )
+
+    db.add_all([
+        # 0xa: one closed winner, one open lot priced by the fetcher
+        trade("0x1", "0xa", "0xwin", "buy", 100.0, 1.0, 9, fee=1.0),
+        trade("0x2", "0xa", "0xwin", "sell", 100.0, 3.0, 8, fee=2.0),
+        trade("0x3", "0xa", "0xopen", "buy", 50.0, 2.0, 7),
+        # 0xb: partial sell, remaining lot falls back to the last trade price
+        trade("0x4", "0xb", "0xunpriced", "buy", 200.0, 0.5, 6),
+        trade("0x5", "0xb", "0xunpriced", "sell", 50.0, 0.75, 5),
+    ])
+    db.commit()
+
+    def calculator():
+        calc = FIFOPnLCalculator(db)
+        calc.price_fetcher = Mock()
+        calc.price_fetcher.get_token_prices = AsyncMock(
+            return_value={("0xopen", "ethereum"): 2.5}
+        )
+        return calc
+
+    fifo_memo = {}
+    fresh = await calculator().calculate_all_wallets_pnl(["0xa", "0xb"], fifo_memo=fifo_memo)
+
+    # Same encoding the stats rollup uses for its Redis memo: tuples come back as lists
+    cached_memo = orjson.loads(orjson.dumps(fifo_memo, default=str))
+
+    # Without trades, only the memo can reproduce the numbers
+    db.query(Trade).delete()
+    memoized = await calculator().calculate_all_wallets_pnl(["0xa", "0xb"], fifo_memo=cached_memo)
+
+    assert memoized == fresh
+    assert fresh["0xa"][0] == pytest.approx(197.0)  # 300 - 2 fee - 101 cost
+    assert fresh["0xa"][1] == pytest.approx(25.0)  # 50 * (2.5 - 2.0)
+    assert fresh["0xb"] == pytest.approx((12.5, 37.5, 1.5))  # 150 left at last price 0.75
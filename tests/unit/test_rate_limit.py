@@ -0,0 +1,30 @@
+"""Unit tests for adaptive request limiting."""
+
+import httpx
+from src.utils.rate_limit import AdaptiveLimiter, ThrottledTransport, host_transport
+
+
+async def test_limit_grows_on_success_and_halves_on_429():
+    """Test AIMD adjustment through the httpx transport."""
+    statuses = iter([200, 200, 200, 200, 429])
+    limiter = AdaptiveLimiter(initial_concurrency=2, max_concurrency=8)
+    transport = ThrottledTransport(
+        limiter, httpx.MockTransport(lambda request: httpx.Response(next(statuses)))
+    )
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        for _ in range(4):
+            await client.get("https://example.test/")
+        assert limiter.limit == 4.0
+
+        await client.get("https://example.test/")
+        assert limiter.limit == 2.0
+
+
+def test_host_transport_shares_one_limiter_per_host():
+    """Test that clients of one provider back off together."""
+    first = host_transport("test-host")
+    second = host_transport("test-host")
+
+    assert first._limiter is second._limiter
+    assert host_transport("other-host")._limiter is not first._limiter